@@ -0,0 +1,27 @@
+"""Benchmark del motor por lotes.
+
+Mide pasos y partidas por segundo de ``BatchGameEngine`` con las políticas
+aleatoria y codiciosa, jugando todas las partidas del lote hasta el final.
+
+Uso:
+    python -m benchmarks.bench_batch
+"""
+
+import time
+
+from core.batchengine import BatchGameEngine, greedy_policy, random_policy
+
+
+def main(size: int = 4096) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for name, policy in (("random", random_policy), ("greedy", greedy_policy)):
+        engine = BatchGameEngine(size, seed=1, policy=policy)
+        start = time.perf_counter()
+        turns = engine.run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<7} N={size}: {turns} turnos, {elapsed:6.2f} s, "
+              f"{engine.get_steps() / elapsed:10.0f} pasos/s, {size / elapsed:8.0f} partidas/s")
+
+
+if __name__ == "__main__":
+    main()
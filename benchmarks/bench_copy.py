@@ -0,0 +1,36 @@
+"""Benchmark de copia de tableros y juegos.
+
+Compara ``Board.copy`` y ``BackgammonGame.clone`` con ``copy.deepcopy``.
+
+Uso:
+    python -m benchmarks.bench_copy
+"""
+
+import copy
+import timeit
+
+from core.backgammongame import BackgammonGame
+
+
+def _microseconds(statement, number: int) -> float:
+    """Devuelve el tiempo medio por llamada en microsegundos (mejor de 5 repeticiones)."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main(number: int = 20000) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    game = BackgammonGame()
+    game.start_game()
+    board = game.get_board()
+    rows = [
+        ("copy.deepcopy(board)", _microseconds(lambda: copy.deepcopy(board), number)),
+        ("board.copy()", _microseconds(board.copy, number)),
+        ("copy.deepcopy(game)", _microseconds(lambda: copy.deepcopy(game), number // 10)),
+        ("game.clone()", _microseconds(game.clone, number)),
+    ]
+    for name, elapsed in rows:
+        print(f"{name:<24} {elapsed:10.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark de generación de dados.
+
+Compara el costo por tirada de ``Dice`` con el generador global, ``Dice`` con
+semilla (buffer) y ``BatchDice`` para un lote de partidas.
+
+Uso:
+    python -m benchmarks.bench_dice
+"""
+
+import timeit
+
+from core.batchdice import BatchDice
+from core.dice import Dice
+
+
+def _nanoseconds_per_roll(statement, number: int, rolls_per_call: int = 1) -> float:
+    """Devuelve el tiempo medio por tirada en nanosegundos (mejor de 5 repeticiones)."""
+    best = min(timeit.repeat(statement, number=number, repeat=5))
+    return best / (number * rolls_per_call) * 1e9
+
+
+def main(number: int = 200000, batch_size: int = 4096) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    global_dice = Dice()
+    seeded_dice = Dice(seed=1)
+    batch = BatchDice(batch_size, seed=1)
+    rows = [
+        ("Dice().roll()", _nanoseconds_per_roll(global_dice.roll, number)),
+        ("Dice(seed).roll()", _nanoseconds_per_roll(seeded_dice.roll, number)),
+        (
+            f"BatchDice({batch_size}).roll()",
+            _nanoseconds_per_roll(batch.roll, number // 100, batch_size),
+        ),
+    ]
+    for name, elapsed in rows:
+        print(f"{name:<24} {elapsed:10.2f} ns/tirada")
+
+
+if __name__ == "__main__":
+    main()
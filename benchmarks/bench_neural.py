@@ -0,0 +1,45 @@
+"""Benchmark del evaluador neuronal.
+
+Evalúa todas las posiciones hijas de las 21 tiradas desde la posición inicial,
+una por una (interfaz ``Evaluator``) y en un solo lote por tirada
+(``evaluate_batch``), e informa las evaluaciones por segundo.
+
+Uso:
+    python -m benchmarks.bench_neural
+"""
+
+import time
+
+from core.engine import DICE_OUTCOMES
+from core.movegen import generate_successors
+from core.neuralnet import NeuralNetwork
+from core.position import Position, WHITE
+
+
+def main(repeats: int = 20) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    position = Position()
+    position.setup_initial_points()
+    batches = [
+        [child for _, child in generate_successors(position, WHITE, dice)]
+        for dice, _ in DICE_OUTCOMES
+    ]
+    total = sum(len(batch) for batch in batches) * repeats
+    network = NeuralNetwork()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for batch in batches:
+            for child in batch:
+                network(child, WHITE)
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for batch in batches:
+            network.evaluate_batch(batch, WHITE)
+    batched = time.perf_counter() - start
+    print(f"Una por una: {total / single:10.0f} evaluaciones/s")
+    print(f"Por lotes:   {total / batched:10.0f} evaluaciones/s  ({single / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark del Position ID.
+
+Codifica y decodifica las posiciones hijas de las 21 tiradas desde la posición
+inicial, una por una y en un solo lote, e informa los identificadores por
+segundo.
+
+Uso:
+    python -m benchmarks.bench_positionid
+"""
+
+import time
+
+from core.engine import DICE_OUTCOMES
+from core.movegen import generate_successors
+from core.position import Position, WHITE, BLACK
+from core.positionid import (
+    encode_position_id, decode_position_id, encode_position_ids, decode_position_ids,
+)
+
+
+def main(repeats: int = 50) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    position = Position()
+    position.setup_initial_points()
+    positions = [
+        child
+        for dice, _ in DICE_OUTCOMES
+        for _, child in generate_successors(position, WHITE, dice)
+    ]
+    sides = [BLACK] * len(positions)
+    total = len(positions) * repeats
+    timings = {}
+    start = time.perf_counter()
+    for _ in range(repeats):
+        ids = [encode_position_id(child, BLACK) for child in positions]
+    timings["encode"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeats):
+        encode_position_ids(positions, sides)
+    timings["encode_batch"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for position_id in ids:
+            decode_position_id(position_id, BLACK)
+    timings["decode"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeats):
+        decode_position_ids(ids, sides)
+    timings["decode_batch"] = time.perf_counter() - start
+    for kind in ("encode", "decode"):
+        single, batched = timings[kind], timings[kind + "_batch"]
+        print(f"{kind:6s} uno por uno: {total / single:10.0f} ids/s")
+        print(f"{kind:6s} por lotes:   {total / batched:10.0f} ids/s  ({single / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
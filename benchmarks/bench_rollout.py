@@ -0,0 +1,36 @@
+"""Benchmark de rollouts.
+
+Mide el tiempo de un rollout de la posición inicial en un solo proceso y
+repartido entre todos los núcleos con ``ProcessPoolExecutor``.
+
+Uso:
+    python -m benchmarks.bench_rollout
+"""
+
+import os
+import time
+
+from core.position import Position, WHITE
+from core.rollout import RolloutSettings, run_rollout
+
+
+def _timed_rollout(position: Position, trials: int, workers: int) -> float:
+    """Devuelve los segundos de un rollout con la cantidad de workers indicada."""
+    start = time.perf_counter()
+    run_rollout(position, WHITE, RolloutSettings(trials=trials, seed=1, workers=workers))
+    return time.perf_counter() - start
+
+
+def main(trials: int = 1296) -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    position = Position()
+    position.setup_initial_points()
+    cores = os.cpu_count() or 1
+    for workers in sorted({1, cores}):
+        elapsed = _timed_rollout(position, trials, workers)
+        print(f"{trials} partidas, {workers:>2} worker(s): {elapsed:8.2f} s "
+              f"({trials / elapsed:8.1f} partidas/s)")
+
+
+if __name__ == "__main__":
+    main()
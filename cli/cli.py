@@ -6,6 +6,10 @@ visualización mejorada del tablero y feedback claro al usuario.
 
 from typing import Optional
 from core.backgammongame import BackgammonGame
+from core.engine import best_play
+
+HINT_DEPTH = 1
+HINT_TIME_BUDGET = 0.5
 
 
 class CLIInterface:
@@ -285,6 +289,9 @@ class CLIInterface:
             'r': self._cmd_roll_,
             'roll': self._cmd_roll_,
             'tirar': self._cmd_roll_,
+            'p': self._cmd_hint_,
+            'hint': self._cmd_hint_,
+            'pista': self._cmd_hint_,
             'm': self._cmd_move_,
             'move': self._cmd_move_,
             'mover': self._cmd_move_,
@@ -319,6 +326,7 @@ class CLIInterface:
         print("║  JUEGO:" + " " * 49 + "║")
         print("║    roll (r)     - Tirar los dados" + " " * 20 + "║")
         print("║    move (m)     - Hacer un movimiento" + " " * 16 + "║")
+        print("║    hint (p)     - Sugerir la mejor jugada" + " " * 12 + "║")
         print("║    end (e)      - Terminar turno" + " " * 21 + "║")
         print("║" + " " * 58 + "║")
         print("║  SISTEMA:" + " " * 47 + "║")
@@ -358,6 +366,19 @@ class CLIInterface:
         except (ValueError, AttributeError, RuntimeError) as e:
             print(f" Error al tirar dados: {e}")
 
+    def _cmd_hint_(self) -> None:
+        """Sugiere la mejor jugada para los dados actuales."""
+        try:
+            play = best_play(self._game_, HINT_DEPTH, HINT_TIME_BUDGET)
+        except ValueError as e:
+            print(f"\n  ⚠️  {e}")
+            return
+        if not play:
+            print("\n  No hay jugadas legales con estos dados")
+            return
+        steps = "  ".join(f"{source} → {dest}" for source, dest, _ in play)
+        print(f"\n  Sugerencia: {steps}")
+
     def _cmd_move_(self) -> None:
         """Maneja el comando de hacer un movimiento."""
         print("\n Movimiento:")
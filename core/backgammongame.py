@@ -3,23 +3,91 @@
 Esta clase maneja el juego de Backgammon, gestionando jugadores, tablero, dados y lógica principal.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, NamedTuple, Set, Tuple
 from core.player import Player
 from core.board import Board
 from core.dice import Dice
 from core.checker import Checker
+from core.position import (
+    SIDE_BY_COLOR, SIDE_TO_MOVE_KEY, OFF_SLOT, decode_record, dice_key,
+)
+from core.movegen import BAR_POINT, Step, generate_plays, legal_steps, to_point_step
+from core.positionid import (
+    CENTERED_CUBE, GAME_OVER, NO_GAME, PLAYING, MatchState, decode_match_id, encode_match_id,
+)
+
+
+class MoveRecord(NamedTuple):
+    """
+    Registro reversible de un movimiento realizado en el juego.
+
+    Atributos:
+        board_record: Registro de ``Position.apply`` (origen, destino, dado, lado y golpe).
+        dice_before: Dados disponibles antes del movimiento.
+        ended_turn: Indica si el movimiento terminó el turno.
+        won_game: Indica si el movimiento ganó la partida.
+    """
+    board_record: int
+    dice_before: Tuple[int, ...]
+    ended_turn: bool
+    won_game: bool
+
+    def get_step(self) -> Tuple[int, int, int]:
+        """Devuelve el paso ``(desde, hasta, dado)`` en la notación de puntos 1-24."""
+        source, dest, die, side, _ = decode_record(self.board_record)
+        return to_point_step(side, (source, dest, die))
+
+    def was_hit(self) -> bool:
+        """Indica si el movimiento golpeó una ficha rival."""
+        return decode_record(self.board_record)[4]
+
+
+class LegalStepCache(NamedTuple):
+    """
+    Pasos legales de un estado de juego, calculados una sola vez.
+
+    Atributos:
+        key: Hash de la posición de juego para la que se calcularon.
+        moves: Pasos ``(punto_origen, punto_destino, dado)`` en notación de puntos.
+        steps: Paso en casillas de ``Position`` por ``(punto_origen, punto_destino)``.
+        destinations: Destinos legales por punto de origen.
+    """
+    key: int
+    moves: Tuple[Tuple[int, int, int], ...]
+    steps: Dict[Tuple[int, int], Step]
+    destinations: Dict[int, FrozenSet[int]]
+
 
 class BackgammonGame:
     """Clase principal del juego Backgammon."""
 
-    def __init__(self, player1_name: str = "Player 1", player2_name: str = "Player 2") -> None:
+    def __init__(
+        self,
+        player1_name: str = "Player 1",
+        player2_name: str = "Player 2",
+        dice: Optional[Dice] = None,
+        *,
+        source: Optional["BackgammonGame"] = None,
+    ) -> None:
         """
         Inicializa una nueva instancia de BackgammonGame.
 
         Args:
             player1_name (str): Nombre del jugador 1.
             player2_name (str): Nombre del jugador 2.
+            dice (Optional[Dice]): Dados a usar; por ejemplo ``Dice(seed=...)`` para
+                partidas reproducibles. Si es None se crean dados nuevos.
+            source (Optional[BackgammonGame]): Juego a copiar (ver ``clone``); si se
+                indica, los demás argumentos se ignoran.
         """
+        if source is not None:
+            self.__dict__.update(source.__dict__)
+            self.__board = self.__board.copy()
+            self.__dice = self.__dice.copy()
+            self.__move_history = list(self.__move_history)
+            self.__redo_stack = list(self.__redo_stack)
+            self.__match_score = dict(self.__match_score)
+            return
         if not player1_name or not player2_name:
             raise ValueError("Los nombres de los jugadores no pueden estar vacíos")
         if player1_name == player2_name:
@@ -27,7 +95,7 @@ class BackgammonGame:
         self.__player1: Player = Player(player1_name, "white")
         self.__player2: Player = Player(player2_name, "black")
         self.__board: Board = Board()  # Cambiado de self.board a self.__board
-        self.__dice: Dice = Dice()
+        self.__dice: Dice = dice if dice is not None else Dice()
         self.__current_player: Player = self.__player1
         self.__started: bool = False
         self.__finished: bool = False
@@ -37,56 +105,37 @@ class BackgammonGame:
         self.__moves_count: int = 0
         self.__turn_number: int = 1
         self.__move_history: List[Any] = []
+        self.__redo_stack: List[MoveRecord] = []
+        self.__legal_cache: Optional[LegalStepCache] = None
         self.__match_score: Dict[Player, int] = {self.__player1: 0, self.__player2: 0}
         self.__double_offered: bool = False
         self.__doubling_cube_value: int = 1
         self.__doubling_cube_owner: Optional[Player] = None
         self.__game_type: str = "single"
-        self.__player1_checkers: List[Checker] = [Checker(self.__player1) for _ in range(15)]
-        self.__player2_checkers: List[Checker] = [Checker(self.__player2) for _ in range(15)]
         self.setup_initial_position()
 
     def setup_initial_position(self) -> None:
-        """Configura la posición inicial del tablero y las fichas usando objetos Checker."""
+        """Configura la posición inicial del tablero."""
         self.__board.setup_initial_position(self.__player1, self.__player2)
-        for checker in self.__player1_checkers:
-            checker.reset_position()
-        for checker in self.__player2_checkers:
-            checker.reset_position()
-        idx = 0
-        for _ in range(2):
-            self.__player1_checkers[idx].set_position(0)
-            idx += 1
-        for _ in range(5):
-            self.__player1_checkers[idx].set_position(11)
-            idx += 1
-        for _ in range(3):
-            self.__player1_checkers[idx].set_position(16)
-            idx += 1
-        for _ in range(5):
-            self.__player1_checkers[idx].set_position(18)
-            idx += 1
-        idx = 0
-        for _ in range(2):
-            self.__player2_checkers[idx].set_position(23)
-            idx += 1
-        for _ in range(5):
-            self.__player2_checkers[idx].set_position(12)
-            idx += 1
-        for _ in range(3):
-            self.__player2_checkers[idx].set_position(7)
-            idx += 1
-        for _ in range(5):
-            self.__player2_checkers[idx].set_position(5)
-            idx += 1
+
+    def clone(self) -> "BackgammonGame":
+        """
+        Devuelve una copia independiente del juego para explorar jugadas.
+
+        El tablero, los dados y el historial se copian; los jugadores se comparten.
+
+        Returns:
+            BackgammonGame: Juego que puede modificarse sin afectar al original.
+        """
+        return BackgammonGame(source=self)
 
     def get_player1_checkers(self) -> List[Checker]:
-        """Devuelve la lista de fichas del jugador 1."""
-        return self.__player1_checkers
+        """Devuelve las fichas del jugador 1 según la posición actual del tablero."""
+        return self.__board.get_checkers(self.__player1)
 
     def get_player2_checkers(self) -> List[Checker]:
-        """Devuelve la lista de fichas del jugador 2."""
-        return self.__player2_checkers
+        """Devuelve las fichas del jugador 2 según la posición actual del tablero."""
+        return self.__board.get_checkers(self.__player2)
 
     def get_player1(self) -> Player:
         """Devuelve el jugador 1."""
@@ -128,6 +177,7 @@ class BackgammonGame:
         self.__dice_rolled = False
         self.__last_dice_roll = None
         self.__move_history.clear()
+        self.__redo_stack.clear()
         # Solo resetear el tablero si no tiene fichas
         if not any(self.__board.get_points()):
             self.__board.reset()
@@ -173,6 +223,8 @@ class BackgammonGame:
         else:
             self.__last_dice_roll = dice_result
         self.__dice_rolled = True
+        # Los movimientos deshechos pertenecen a una tirada anterior
+        self.__redo_stack.clear()
         # Devolver siempre los 2 valores físicos de los dados
         return dice_result
 
@@ -185,152 +237,66 @@ class BackgammonGame:
         return self.__dice_rolled
 
     def get_available_moves(self) -> List[Any]:
-        """Devuelve los movimientos disponibles basados en los dados lanzados."""
-        if not self.__dice_rolled or not self.__last_dice_roll:
-            return []
+        """
+        Devuelve los pasos legales de un solo dado con los dados restantes.
 
-        movimientos = []
-        dados_disponibles = self.__last_dice_roll
+        Returns:
+            List[Any]: Tuplas ``(punto_origen, punto_destino, dado)`` en la
+            notación de puntos 1-24 (ver ``to_point_step``).
+        """
+        return list(self.__legal_steps().moves)
 
-        # Manejar tuplas de cualquier longitud (dobles tienen 4 elementos)
-        # Simplificado: siempre convertimos a lista, ya que roll_dice siempre asegura valores
-        if not dados_disponibles:
-            return []
-        dados_a_procesar = list(dados_disponibles)
-
-        # Verificar si puede hacer bear off
-        color = self.__current_player.get_color()
-        can_bear = self.__board.can_bear_off(self.__current_player)
-
-        # Buscar fichas del jugador actual en el tablero
-        for punto_idx in range(24):
-            if self.__board.points[punto_idx]:
-                primera_ficha = self.__board.points[punto_idx][0]
-                if primera_ficha.get_owner() == self.__current_player:
-                    punto_num = punto_idx + 1
-
-                    # Calcular posibles destinos para cada dado
-                    for dado in dados_a_procesar:
-                        # En Backgammon:
-                        # - Fichas blancas van hacia números más altos (1->24)
-                        # - Fichas negras van hacia números más bajos (24->1)
-                        if self.__current_player.get_color() == "white":
-                            destino = punto_num + dado
-                        else:
-                            destino = punto_num - dado
-
-                        # Movimientos normales en el tablero
-                        if 1 <= destino <= 24:
-                            if self._is_valid_move_internal(punto_num, destino):
-                                movimientos.append((punto_num, destino, dado))
-
-                        # Bear off: verificar si puede sacar fichas
-                        if can_bear:
-                            if color == "white" and 19 <= punto_num <= 24:
-                                # Bear off para blancas
-                                if self._is_valid_move_internal(punto_num, 25):
-                                    movimientos.append((punto_num, 25, dado))
-                            elif color == "black" and 1 <= punto_num <= 6:
-                                # Bear off para negras
-                                if self._is_valid_move_internal(punto_num, 0):
-                                    movimientos.append((punto_num, 0, dado))
-
-        return movimientos
+    def get_legal_destinations(self, from_point: int) -> FrozenSet[int]:
+        """
+        Devuelve los puntos de destino legales desde ``from_point``.
+
+        Args:
+            from_point (int): Punto de origen (0 o 25 para la barra).
+
+        Returns:
+            FrozenSet[int]: Destinos en notación de puntos; vacío si no hay.
+        """
+        return self.__legal_steps().destinations.get(from_point, frozenset())
 
     def _is_valid_move_internal(self, from_point: int, to_point: int) -> bool:
         """
         Validación interna del movimiento sin verificar estado del juego.
         Usado internamente por get_available_moves.
         """
-        # Verificar que el punto de origen tenga fichas del jugador actual
-        if from_point < 1 or from_point > 24:
-            return False
-
-        punto_origen = from_point - 1
-        if not self.__board.points[punto_origen]:
-            return False
-
-        # Verificar que la ficha pertenezca al jugador actual
-        primera_ficha = self.__board.points[punto_origen][0]
-        if primera_ficha.get_owner() != self.__current_player:
-            return False
-
-        # Obtener dados disponibles
-        dados_disponibles = self.__last_dice_roll
+        return (from_point, to_point) in self.__legal_steps().steps
 
-        # Manejar tuplas de cualquier longitud (dobles tienen 4 elementos)
-        if not dados_disponibles:
-            return False
-        valores_dados = list(dados_disponibles)
-
-        # BEAR OFF: Verificar PRIMERO si el movimiento es bear off válido
-        color = self.__current_player.get_color()
-        home_points_white_idx = range(18, 24)  # Índices 0-based: puntos 19-24 (18-23)
-        home_points_black_idx = range(0, 6)    # Índices 0-based: puntos 1-6 (0-5)
-
-        if color == "white" and from_point >= 19 and from_point <= 24 and to_point == 25:
-            # Bear off válido si todas las fichas están en home board
-            if self.__board.can_bear_off(self.__current_player):
-                # Verificar que el dado permita este movimiento
-                movimiento = 25 - from_point
-                if movimiento <= 0:
-                    movimiento = 1
-                if movimiento in valores_dados:
-                    return True
-                # Permitir usar dado mayor solo si es la ficha más atrasada
-                # Buscar la ficha más lejana (mayor índice, ya que blanco viene de 0)
-                punto_origen_idx = from_point - 1
-                max_pos = max([
-                    i for i in home_points_white_idx
-                    if self.__board.points[i] and
-                    self.__board.points[i][0].get_owner() == self.__current_player
-                ], default=None)
-                if max_pos is not None and punto_origen_idx == max_pos:
-                    return any(dado >= movimiento for dado in valores_dados)
-            return False
-        elif color == "black" and from_point >= 1 and from_point <= 6 and to_point == 0:
-            # Bear off válido si todas las fichas están en home board
-            if self.__board.can_bear_off(self.__current_player):
-                # Verificar que el dado permita este movimiento
-                movimiento = from_point
-                if movimiento <= 0:
-                    movimiento = 1
-                if movimiento in valores_dados:
-                    return True
-                # Permitir usar dado mayor solo si es la ficha más atrasada
-                # Buscar la ficha más lejana (menor índice, ya que negro viene de 23)
-                punto_origen_idx = from_point - 1
-                min_pos = min([
-                    i for i in home_points_black_idx
-                    if self.__board.points[i] and
-                    self.__board.points[i][0].get_owner() == self.__current_player
-                ], default=None)
-                if min_pos is not None and punto_origen_idx == min_pos:
-                    return any(dado >= movimiento for dado in valores_dados)
-            return False
-
-        # Si no es bear off, verificar movimiento normal
-        # Calcular la distancia del movimiento
-        distancia = abs(to_point - from_point)
-
-        if distancia not in valores_dados:
-            return False
-
-        # Verificar que el punto de destino sea válido (no bear off)
-        if to_point < 1 or to_point > 24:
-            return False
-
-        punto_destino = to_point - 1
-
-        # Verificar si el punto de destino está bloqueado por el oponente
-        if self.__board.points[punto_destino]:
-            primera_ficha_destino = self.__board.points[punto_destino][0]
-            if primera_ficha_destino.get_owner() != self.__current_player:
-                # Si hay más de una ficha del oponente, está bloqueado
-                if len(self.__board.points[punto_destino]) > 1:
-                    return False
+    def __legal_steps(self) -> LegalStepCache:
+        """
+        Devuelve los pasos legales del turno, calculados una vez por estado.
 
-        return True
+        El conjunto se recalcula solo cuando cambia el hash de la posición de
+        juego (tablero, jugador en turno o dados restantes), es decir, al tirar
+        los dados, al mover, al deshacer o si se modifica el tablero.
+        """
+        key = self.position_hash()
+        cache = self.__legal_cache
+        if cache is not None and cache.key == key:
+            return cache
+        moves = []
+        steps = {}
+        if self.__dice_rolled and self.__last_dice_roll:
+            side = SIDE_BY_COLOR[self.__current_player.get_color()]
+            position = self.__board.get_position()
+            # Dados de menor a mayor: un bear off usa el dado exacto antes que uno mayor
+            for dado in sorted(set(self.__last_dice_roll)):
+                for step in legal_steps(position, side, dado):
+                    move = to_point_step(side, step)
+                    moves.append(move)
+                    steps.setdefault(move[:2], step)
+        destinations: Dict[int, Set[int]] = {}
+        for from_point, to_point in steps:
+            destinations.setdefault(from_point, set()).add(to_point)
+        cache = LegalStepCache(
+            key, tuple(moves), steps,
+            {point: frozenset(targets) for point, targets in destinations.items()},
+        )
+        self.__legal_cache = cache
+        return cache
 
     def is_valid_move(self, from_point: int, to_point: int) -> bool:
         """
@@ -380,136 +346,11 @@ class BackgammonGame:
         if not self.__dice_rolled:
             raise ValueError("Debes lanzar los dados primero")
 
-        if not self._is_valid_move_internal(from_point, to_point):
-            return False
-        punto_origen = from_point - 1
-        punto_destino = to_point - 1
-        distancia = abs(to_point - from_point)
-        dados_disponibles = self.__last_dice_roll
-
-        jugador = self.__current_player
-        board = self.__board
-        color = jugador.get_color()
-        home_points_white_idx = range(18, 24)  # Índices 0-based: puntos 19-24 (18-23)
-        home_points_black_idx = range(0, 6)     # Índices 0-based: puntos 1-6 (0-5)
-        # BEAR OFF
-        # Si is_valid_move ya validó que es bear off válido, proceder directamente
-        if (color == "white" and from_point >= 19 and from_point <= 24 and to_point == 25) or \
-           (color == "black" and from_point >= 1 and from_point <= 6 and to_point == 0):
-            # is_valid_move ya validó can_bear_off y los dados, así que proceder
-            # Calcular el movimiento requerido (ya validado en is_valid_move)
-            if color == "white":
-                movimiento = 25 - from_point
-            else:
-                movimiento = from_point
-
-            if movimiento <= 0:
-                movimiento = 1
-
-            # Valores de dado posibles que permiten bear off
-            dados_a_procesar = list(dados_disponibles)
-
-            # Buscar si el movimiento exacto está disponible
-            if movimiento in dados_a_procesar:
-                dados_a_procesar.remove(movimiento)
-                # Actualizar dados restantes
-                if dados_a_procesar:
-                    self.__last_dice_roll = tuple(dados_a_procesar)
-                else:
-                    self.__last_dice_roll = ()
-            else:
-                # Permitir sacar con dado mayor solo si es la ficha más atrasada
-                # (Esta validación ya pasó en is_valid_move, pero la repetimos
-                # para usar el dado correcto)
-                max_pos = max([
-                    i for i in home_points_white_idx
-                    if board.points[i] and board.points[i][0].get_owner() == jugador
-                ], default=None)
-                min_pos = min([
-                    i for i in home_points_black_idx
-                    if board.points[i] and board.points[i][0].get_owner() == jugador
-                ], default=None)
-
-                puede_usar_mayor = False
-                movimiento_requerido = movimiento
-                if color == "white" and max_pos is not None and punto_origen == max_pos:
-                    puede_usar_mayor = True
-                elif color == "black" and min_pos is not None and punto_origen == min_pos:
-                    puede_usar_mayor = True
-
-                if puede_usar_mayor:
-                    # Buscar un dado mayor o igual al movimiento requerido
-                    dado_usado = None
-                    for dado in sorted(dados_a_procesar, reverse=True):
-                        if dado >= movimiento_requerido:
-                            dado_usado = dado
-                            break
-
-                    if dado_usado:
-                        dados_a_procesar.remove(dado_usado)
-                        self.__last_dice_roll = tuple(dados_a_procesar) if dados_a_procesar else ()
-                        # Continuar con el bear off (dado_usado encontrado)
-                    else:
-                        # Esto no debería ocurrir si is_valid_move validó correctamente
-                        return False
-                else:
-                    # Esto no debería ocurrir si is_valid_move validó correctamente
-                    return False
-
-            # Efectuar bear off
-            if not board.points[punto_origen]:
-                return False  # No debería ocurrir, pero por seguridad
-            ficha_movida = board.points[punto_origen].pop()
-            ficha_movida.move_off_board()
-            board.bear_off[color].append(ficha_movida)
-            # Verificar victoria: si el jugador tiene 15 fichas en bear off, gana
-            if len(board.bear_off[color]) >= 15:
-                self.__winner = jugador
-                self.finish_game()
-            # Fin de dados/turno
-            if not self.__last_dice_roll or len(self.__last_dice_roll) == 0:
-                self.end_turn()
-            self.__moves_count += 1
-            return True
-        # Remover la ficha del punto de origen
-        ficha_movida = self.__board.points[punto_origen].pop()
-
-        # Si hay fichas del oponente en el destino, verificar captura
-        if self.__board.points[punto_destino]:
-            primera_ficha_destino = self.__board.points[punto_destino][0]
-            if primera_ficha_destino.get_owner() != self.__current_player:
-                # Solo se puede capturar si hay exactamente 1 ficha del oponente
-                if len(self.__board.points[punto_destino]) == 1:
-                    ficha_capturada = self.__board.points[punto_destino].pop()
-                    # Agregar a la barra del oponente
-                    color_oponente = ficha_capturada.get_owner().get_color()
-                    self.__board.bar[color_oponente].append(ficha_capturada)
-                    # Actualizar posición de la ficha capturada
-                    ficha_capturada.set_position(None)
-                    ficha_capturada.set_on_bar(True)
-                else:
-                    # Hay más de 1 ficha del oponente, no se puede capturar
-                    return False
-
-        # Colocar la ficha en el destino
-        self.__board.points[punto_destino].append(ficha_movida)
-
-        # Actualizar el estado de los dados
-        valores_restantes = list(dados_disponibles)
-        # Remover un movimiento usado
-        if distancia in valores_restantes:
-            valores_restantes.remove(distancia)
-        else:
-            # Movimiento no coincide con ningún dado disponible
+        step = self.__legal_steps().steps.get((from_point, to_point))
+        if step is None:
             return False
-        # Si quedan valores, mantenerlos; si no, terminar turno
-        self.__last_dice_roll = tuple(valores_restantes) if valores_restantes else ()
-
-        # Si no quedan dados por usar, cambiar de turno
-        if not self.__last_dice_roll:
-            self.end_turn()
-
-        self.__moves_count += 1
+        self.__redo_stack.clear()
+        self.__play_step(SIDE_BY_COLOR[self.__current_player.get_color()], *step)
         return True
 
     def make_move_from_bar(self, to_point: int) -> bool:
@@ -528,101 +369,56 @@ class BackgammonGame:
         if not self.__dice_rolled:
             return False
 
-        # Verificar que el jugador tenga fichas en la barra
-        color_jugador = self.__current_player.get_color()
-        if not self.__board.bar[color_jugador]:
-            return False
-
-        # Verificar que el punto de destino sea válido según las reglas de reingreso
-        if color_jugador == "white":
-            # Fichas blancas solo pueden reingresar en puntos 1-6
-            if not 1 <= to_point <= 6:
-                return False
-        else:
-            # Fichas negras solo pueden reingresar en puntos 19-24
-            if not 19 <= to_point <= 24:
-                return False
-
-        punto_destino = to_point - 1
-
-        # Verificar si el punto de destino está bloqueado por el oponente
-        if self.__board.points[punto_destino]:
-            primera_ficha_destino = self.__board.points[punto_destino][0]
-            if primera_ficha_destino.get_owner() != self.__current_player:
-                # Si hay más de una ficha del oponente, está bloqueado
-                if len(self.__board.points[punto_destino]) > 1:
-                    return False
-
-        # Verificar que la distancia coincida con algún valor de dado
-        dados_disponibles = self.__last_dice_roll
-
-        # Manejar tuplas de cualquier longitud (dobles tienen 4 elementos)
-        if not dados_disponibles:
-            return False
-        valores_dados = list(dados_disponibles)
-
-        # Calcular la distancia desde la barra
-        if self.__current_player.get_color() == "white":
-            # Fichas blancas van hacia números más altos desde la barra
-            distancia = to_point
-        else:
-            # Fichas negras van hacia números más bajos desde la barra
-            distancia = 25 - to_point
-
-        # Validar que la distancia esté disponible ANTES de remover la ficha
-        if distancia not in valores_dados:
+        # Solo hay pasos desde el punto de barra si el jugador tiene fichas en ella
+        side = SIDE_BY_COLOR[self.__current_player.get_color()]
+        step = self.__legal_steps().steps.get((BAR_POINT[side], to_point))
+        if step is None:
             return False
+        self.__redo_stack.clear()
+        self.__play_step(side, *step)
+        return True
 
-        # Validar actualización de dados ANTES de remover la ficha
-        valores_restantes = list(dados_disponibles)
-        if distancia in valores_restantes:
-            valores_restantes.remove(distancia)
-        else:
-            # Esto no debería ocurrir si la validación anterior es correcta
-            return False
+    def __play_step(self, side: int, source: int, dest: int, die: int) -> None:
+        """
+        Aplica un paso ya validado y lo registra en el historial.
 
-        # Ahora SÍ remover una ficha de la barra (todas las validaciones pasaron)
-        ficha_movida = self.__board.bar[color_jugador].pop()
-
-        # Si hay una ficha del oponente en el destino, capturarla
-        if self.__board.points[punto_destino]:
-            primera_ficha_destino = self.__board.points[punto_destino][0]
-            if primera_ficha_destino.get_owner() != self.__current_player:
-                ficha_capturada = self.__board.points[punto_destino].pop()
-                color_oponente = ficha_capturada.get_owner().get_color()
-                self.__board.bar[color_oponente].append(ficha_capturada)
-                ficha_capturada.set_position(None)
-                ficha_capturada.set_on_bar(True)
-
-        # Colocar la ficha en el destino
-        self.__board.points[punto_destino].append(ficha_movida)
-        ficha_movida.set_position(punto_destino)
-        ficha_movida.set_on_bar(False)
-
-        # Actualizar el estado de los dados (ya validado arriba)
+        Consume el dado, verifica la victoria, termina el turno si no quedan
+        dados y guarda un ``MoveRecord`` que permite deshacer el paso.
+        """
+        position = self.__board.get_position()
+        dice_before = self.__last_dice_roll
+        board_record = position.apply(side, (source, dest, die))
+        valores_restantes = list(dice_before)
+        valores_restantes.remove(die)
+        # Si quedan valores, mantenerlos; si no, terminar turno
         self.__last_dice_roll = tuple(valores_restantes) if valores_restantes else ()
-
-        # Si no quedan dados por usar, cambiar de turno
-        if not self.__last_dice_roll:
-            self.end_turn()
-
+        # Verificar victoria: si el jugador tiene 15 fichas fuera, gana
+        won_game = dest == OFF_SLOT[side] and position.get_off(side) >= 15
+        if won_game:
+            self.__winner = self.__current_player
+            self.finish_game()
+        ended_turn = not self.__last_dice_roll
+        if ended_turn:
+            self.__pass_turn()
         self.__moves_count += 1
-        return True
+        self.__move_history.append(MoveRecord(board_record, dice_before, ended_turn, won_game))
 
-    def can_player_move(self, player: Player) -> bool:  # pylint: disable=unused-argument
+    def can_player_move(self, player: Player) -> bool:
         """
-        Indica si el jugador puede mover.
+        Indica si el jugador puede mover con los dados restantes.
 
         Args:
             player (Player): El jugador a consultar.
-                (No usado actualmente, mantenido para compatibilidad de API)
 
         Returns:
-            bool: True si puede mover, False en caso contrario.
+            bool: True si es el jugador en turno, ya lanzó los dados y tiene al
+            menos un paso legal; False en caso contrario (el turno debe pasar).
         """
-        # El parámetro player se mantiene para compatibilidad de API
-        _ = player  # Marcar como usado para evitar warning
-        return True
+        if not self.__started or self.__finished or not self.__dice_rolled:
+            return False
+        if player != self.__current_player or not self.__last_dice_roll:
+            return False
+        return bool(self.__legal_steps().steps)
 
     def must_enter_from_bar(self, player: Player) -> bool:
         """
@@ -670,7 +466,12 @@ class BackgammonGame:
         return self.__turn_number
 
     def end_turn(self) -> None:
-        """Finaliza el turno actual."""
+        """Finaliza el turno actual y descarta los movimientos pendientes de rehacer."""
+        self.__redo_stack.clear()
+        self.__pass_turn()
+
+    def __pass_turn(self) -> None:
+        """Pasa el turno al rival (también al rehacer el último paso de un turno)."""
         self.__turn_number += 1
         self.switch_player()
         self.__dice_rolled = False
@@ -686,6 +487,7 @@ class BackgammonGame:
         self.__dice_rolled = False
         self.__last_dice_roll = None
         self.__move_history.clear()
+        self.__redo_stack.clear()
         self.__board.reset()
         self.__current_player = self.__player1
 
@@ -693,26 +495,16 @@ class BackgammonGame:
         """
         Devuelve el pip count del jugador.
 
+        El tablero lo mantiene incrementalmente en cada movimiento, golpe,
+        entrada desde la barra y bear off, por lo que la consulta es O(1).
+
         Args:
             player (Player): El jugador para el que se calcula el pip count.
 
         Returns:
             int: Pip count del jugador (suma de las distancias de todas sus fichas al final).
         """
-        pip_count = 0
-        # Usar getters para asegurar coverage
-        checkers = (
-            self.get_player1_checkers() if player == self.__player1 else self.get_player2_checkers()
-        )
-        for checker in checkers:
-            if checker.is_on_board():
-                pos = checker.get_position()
-                if pos is not None:
-                    if player.get_color() == "white":
-                        pip_count += 24 - pos
-                    else:
-                        pip_count += pos + 1
-        return pip_count
+        return self.__board.calculate_pip_count(player)
 
     def is_race_position(self) -> bool:
         """Indica si la posición es de carrera."""
@@ -805,27 +597,99 @@ class BackgammonGame:
         self.__move_history.append(move)
 
     def undo_last_move(self) -> bool:
-        """Deshace el último movimiento."""
+        """
+        Deshace el último movimiento en O(1).
+
+        Restaura el tablero (incluida una ficha golpeada), los dados restantes, el
+        jugador en turno, los contadores y, si el movimiento ganó la partida, el
+        estado de juego en curso. El movimiento deshecho queda disponible para
+        ``redo_move``.
+
+        Returns:
+            bool: True si había un movimiento para deshacer.
+        """
         if not self.__move_history:
             return False
-        self.__move_history.pop()
+        entry = self.__move_history.pop()
+        if not isinstance(entry, MoveRecord):
+            return True
+        if entry.ended_turn:
+            self.__turn_number -= 1
+            self.switch_player()
+        if entry.won_game:
+            self.__winner = None
+            self.__finished = False
+            self.__started = True
+        self.__board.get_position().unapply(entry.board_record)
+        self.__last_dice_roll = entry.dice_before
+        self.__dice_rolled = True
+        self.__moves_count -= 1
+        self.__redo_stack.append(entry)
         return True
 
     def can_undo_move(self) -> bool:
         """Indica si se puede deshacer el último movimiento."""
         return bool(self.__move_history)
 
+    def redo_move(self) -> bool:
+        """
+        Rehace el último movimiento deshecho.
+
+        Cualquier movimiento nuevo, una nueva tirada o ``end_turn`` descartan los
+        movimientos pendientes de rehacer.
+
+        Returns:
+            bool: True si se rehízo un movimiento; False si no había ninguno, el
+            juego terminó o el movimiento no es del jugador en turno.
+        """
+        if not self.__redo_stack or self.__finished:
+            return False
+        entry = self.__redo_stack[-1]
+        source, dest, die, side, _ = decode_record(entry.board_record)
+        if side != SIDE_BY_COLOR[self.__current_player.get_color()]:
+            return False
+        self.__redo_stack.pop()
+        self.__last_dice_roll = entry.dice_before
+        self.__play_step(side, source, dest, die)
+        return True
+
+    def can_redo_move(self) -> bool:
+        """Indica si hay movimientos deshechos que se puedan rehacer."""
+        return bool(self.__redo_stack)
+
+    def get_legal_plays(self) -> List[Tuple[Tuple[int, int, int], ...]]:
+        """
+        Devuelve las jugadas legales completas para los dados restantes.
+
+        Cada jugada es una tupla de pasos ``(desde, hasta, dado)`` en puntos 1-24;
+        la barra es 0 (blancas) o 25 (negras) como origen, y sacar fichas es 25
+        (blancas) o 0 (negras) como destino. Las jugadas que llegan a la misma
+        posición se cuentan una sola vez.
+
+        Returns:
+            List[Tuple[Tuple[int, int, int], ...]]: Jugadas legales; vacía si no hay dados
+            o no se puede mover.
+        """
+        if not self.__dice_rolled or not self.__last_dice_roll:
+            return []
+        side = SIDE_BY_COLOR[self.__current_player.get_color()]
+        plays = generate_plays(self.__board.get_position(), side, self.__last_dice_roll)
+        return [tuple(to_point_step(side, step) for step in play) for play in plays]
+
     def get_possible_moves_count(self) -> int:
-        """Devuelve la cantidad de movimientos posibles."""
-        return 0
+        """Devuelve la cantidad de jugadas legales distintas para los dados restantes."""
+        return len(self.get_legal_plays())
 
     def is_forced_move(self) -> bool:
-        """Indica si hay movimientos forzados."""
-        return False
+        """Indica si existe una única jugada legal."""
+        return self.get_possible_moves_count() == 1
 
     def get_forced_moves(self) -> List[Any]:
-        """Devuelve los movimientos forzados."""
-        return []
+        """Devuelve los pasos de la jugada forzada, o una lista vacía si no la hay."""
+        plays = self.get_legal_plays()
+        if len(plays) != 1:
+            return []
+        return list(plays[0])
 
     def validate_game_state(self) -> bool:
         """Valida el estado actual del juego."""
@@ -852,3 +716,93 @@ class BackgammonGame:
     def __hash__(self) -> int:
         """Devuelve el hash de la instancia."""
         return hash((self.__turn_number, self.__started))
+
+    def position_hash(self) -> int:
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición de juego.
+
+        Combina el hash del tablero (mantenido incrementalmente en cada movimiento)
+        con el jugador en turno y los dados que quedan por usar.
+
+        Returns:
+            int: Clave apta para tablas de transposición.
+        """
+        result = self.__board.position_hash()
+        if self.__current_player.get_color() == "black":
+            result ^= SIDE_TO_MOVE_KEY
+        if self.__dice_rolled and self.__last_dice_roll:
+            result ^= dice_key(self.__last_dice_roll)
+        return result
+
+    def get_match_state(self) -> MatchState:
+        """
+        Devuelve el estado de match que se guarda en el Match ID.
+
+        Los dados son los que quedan por usar (los dos del lanzamiento al
+        comienzo del turno). El juego no tiene matches a N puntos, así que la
+        longitud es 0 (partida por dinero).
+
+        Returns:
+            MatchState: Cubo, turno, dados y marcador.
+        """
+        side = SIDE_BY_COLOR[self.__current_player.get_color()]
+        owner = self.__doubling_cube_owner
+        if self.__finished:
+            game_state = GAME_OVER
+        else:
+            game_state = PLAYING if self.__started else NO_GAME
+        dice = self.__last_dice_roll[:2] if self.__dice_rolled and self.__last_dice_roll else ()
+        return MatchState(
+            cube_value=self.__doubling_cube_value,
+            cube_owner=CENTERED_CUBE if owner is None else SIDE_BY_COLOR[owner.get_color()],
+            dice_owner=side,
+            game_state=game_state,
+            turn=1 - side if self.__double_offered else side,
+            doubled=self.__double_offered,
+            dice=dice,
+            score=(self.__match_score[self.__player1], self.__match_score[self.__player2]),
+        )
+
+    def get_position_id(self) -> str:
+        """Devuelve el Position ID del tablero con el jugador actual en turno."""
+        side = SIDE_BY_COLOR[self.__current_player.get_color()]
+        return self.__board.get_position_id(side)
+
+    def get_match_id(self) -> str:
+        """Devuelve el Match ID del estado actual (ver ``get_match_state``)."""
+        return encode_match_id(self.get_match_state())
+
+    def load_ids(self, position_id: str, match_id: str) -> None:
+        """
+        Carga la posición y el estado de un Position ID y un Match ID.
+
+        Reemplaza el tablero, el jugador en turno, los dados, el cubo y el
+        marcador, y vacía el historial de movimientos.
+
+        Args:
+            position_id (str): Position ID de 14 caracteres.
+            match_id (str): Match ID de 12 caracteres.
+
+        Raises:
+            ValueError: Si alguno de los identificadores no es válido.
+        """
+        state = decode_match_id(match_id)
+        self.__board.set_position_id(position_id, state.dice_owner)
+        players = (self.__player1, self.__player2)
+        self.__current_player = players[state.dice_owner]
+        self.__started = state.game_state == PLAYING
+        self.__finished = state.game_state > PLAYING
+        self.__winner = None
+        dice = state.dice
+        if len(dice) == 2 and dice[0] == dice[1]:
+            dice = dice * 2
+        self.__last_dice_roll = dice or None
+        self.__dice_rolled = bool(dice)
+        self.__doubling_cube_value = state.cube_value
+        self.__doubling_cube_owner = (
+            None if state.cube_owner == CENTERED_CUBE else players[state.cube_owner]
+        )
+        self.__double_offered = state.doubled
+        self.__match_score = {self.__player1: state.score[0], self.__player2: state.score[1]}
+        self.__move_history.clear()
+        self.__redo_stack.clear()
@@ -0,0 +1,149 @@
+"""Módulo batchdice para Backgammon.
+
+Dados vectorizados con NumPy para simular muchas partidas en paralelo. Cada
+tirada de un lote es un arreglo ``(N, 2)`` de ``uint8`` generado en una sola
+llamada al generador, en lugar de dos ``randint`` por partida y turno.
+
+Los 36 resultados posibles se numeran como ``(dado1 - 1) * 6 + (dado2 - 1)``;
+las tablas ``OUTCOMES``, ``OUTCOME_MOVES``, ``MOVE_VALUES`` y ``MOVE_COUNTS``
+se indexan con ese número.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.dice import derive_seed
+
+NUM_OUTCOMES: int = 36
+
+OUTCOMES = np.array(
+    [(i // 6 + 1, i % 6 + 1) for i in range(NUM_OUTCOMES)], dtype=np.uint8
+)
+OUTCOMES.flags.writeable = False
+
+# Valores de movimiento de cada resultado, como los devuelve ``Dice.get_moves``.
+OUTCOME_MOVES: Tuple[Tuple[int, ...], ...] = tuple(
+    (int(d1),) * 4 if d1 == d2 else (int(d1), int(d2)) for d1, d2 in OUTCOMES
+)
+
+# Mismos valores en forma de arreglo (rellenado con ceros) para los motores por lotes.
+MOVE_VALUES = np.zeros((NUM_OUTCOMES, 4), dtype=np.uint8)
+MOVE_COUNTS = np.zeros(NUM_OUTCOMES, dtype=np.uint8)
+for _index, _moves in enumerate(OUTCOME_MOVES):
+    MOVE_VALUES[_index, :len(_moves)] = _moves
+    MOVE_COUNTS[_index] = len(_moves)
+MOVE_VALUES.flags.writeable = False
+MOVE_COUNTS.flags.writeable = False
+
+
+def outcome_index(rolls: np.ndarray) -> np.ndarray:
+    """
+    Convierte tiradas ``(N, 2)`` en su número de resultado 0-35.
+
+    Args:
+        rolls (np.ndarray): Tiradas con valores 1-6.
+
+    Returns:
+        np.ndarray: Arreglo ``(N,)`` de ``uint8``.
+    """
+    rolls = np.asarray(rolls, dtype=np.uint8)
+    return ((rolls[:, 0] - 1) * 6 + rolls[:, 1] - 1).astype(np.uint8)
+
+
+class BatchDice:
+    """Dados para ``N`` partidas simultáneas, generados por bloques de turnos."""
+
+    def __init__(
+        self,
+        size: int,
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
+        block_turns: int = 64,
+    ) -> None:
+        """
+        Inicializa los dados por lotes.
+
+        Args:
+            size (int): Cantidad de partidas del lote.
+            seed (Optional[int]): Semilla para un generador propio.
+            rng (Optional[np.random.Generator]): Generador a usar (tiene prioridad sobre ``seed``).
+            block_turns (int): Turnos generados en cada recarga del buffer.
+
+        Raises:
+            ValueError: Si ``size`` o ``block_turns`` no son positivos.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño del lote debe ser positivo")
+        if block_turns <= 0:
+            raise ValueError("La cantidad de turnos por bloque debe ser positiva")
+        self.__size: int = size
+        self.__rng: np.random.Generator = rng if rng is not None else np.random.default_rng(seed)
+        self.__block_turns: int = block_turns
+        self.__block: np.ndarray = np.empty((0, size), dtype=np.uint8)
+        self.__turn: int = 0
+        self.__last_indices: np.ndarray = np.zeros(size, dtype=np.uint8)
+
+    @classmethod
+    def for_worker(cls, seed: int, worker_id: int, size: int) -> "BatchDice":
+        """
+        Crea dados por lotes con un flujo independiente para un worker.
+
+        Usa la misma derivación de semilla que ``Dice.for_worker``.
+        """
+        return cls(size, seed=derive_seed(seed, worker_id))
+
+    def get_size(self) -> int:
+        """Devuelve la cantidad de partidas del lote."""
+        return self.__size
+
+    def roll_indices(self) -> np.ndarray:
+        """
+        Lanza los dados de todas las partidas y devuelve el número de resultado.
+
+        Returns:
+            np.ndarray: Arreglo ``(N,)`` de ``uint8`` con valores 0-35.
+        """
+        if self.__turn >= len(self.__block):
+            self.__block = self.__rng.integers(
+                0, NUM_OUTCOMES, size=(self.__block_turns, self.__size), dtype=np.uint8
+            )
+            self.__turn = 0
+        self.__last_indices = self.__block[self.__turn]
+        self.__turn += 1
+        return self.__last_indices
+
+    def roll(self) -> np.ndarray:
+        """
+        Lanza los dados de todas las partidas.
+
+        Returns:
+            np.ndarray: Arreglo ``(N, 2)`` de ``uint8`` con valores 1-6.
+        """
+        return OUTCOMES[self.roll_indices()]
+
+    def get_last_indices(self) -> np.ndarray:
+        """Devuelve los números de resultado de la última tirada."""
+        return self.__last_indices
+
+    def get_last_roll(self) -> np.ndarray:
+        """Devuelve la última tirada como arreglo ``(N, 2)``."""
+        return OUTCOMES[self.__last_indices]
+
+    @staticmethod
+    def is_double(rolls: np.ndarray) -> np.ndarray:
+        """Indica, por partida, si la tirada es doble."""
+        return rolls[:, 0] == rolls[:, 1]
+
+    @staticmethod
+    def get_moves(index: int) -> Tuple[int, ...]:
+        """
+        Devuelve los valores de movimiento de un resultado.
+
+        Args:
+            index (int): Número de resultado 0-35.
+
+        Returns:
+            Tuple[int, ...]: Cuatro valores en dobles, dos en el resto.
+        """
+        return OUTCOME_MOVES[index]
@@ -0,0 +1,356 @@
+"""Módulo batchengine para Backgammon.
+
+Motor por lotes que avanza ``N`` partidas a la vez con operaciones
+vectorizadas de NumPy. El estado se guarda como estructura de arreglos:
+
+- ``boards``: arreglo ``(N, 28)`` de ``int8`` con el mismo formato de casillas
+  que ``Position`` (24 puntos, barra y fuera por lado), pero siempre desde el
+  punto de vista del jugador en turno: sus fichas son positivas y avanzan del
+  punto 0 al 23, su barra es la casilla 24 y sus fichas fuera la 26. Al
+  terminar el turno el tablero se espeja para el rival.
+- ``sides``: lado en turno de cada partida (``WHITE`` o ``BLACK``).
+- ``dice``: arreglo ``(N, 4)`` con los dados restantes (0 = usado).
+
+Cada paso aplica un solo dado por partida con las mismas reglas que
+``BackgammonGame.make_move``: golpes, entrada obligatoria desde la barra y
+bear off (exacto, o con dado mayor solo desde la ficha más atrasada). Como en
+``BackgammonGame``, el turno termina cuando no quedan dados o no hay paso legal.
+"""
+
+from array import array
+from typing import Callable, NamedTuple, Optional, Set
+
+import numpy as np
+
+from core.batchdice import MOVE_VALUES, BatchDice
+from core.movegen import Step
+from core.movetables import (
+    DESTINATION, STEP_KIND, ON_BOARD, BEAR_OFF_EXACT, BEAR_OFF_OVER,
+)
+from core.position import (
+    Position, WHITE, BLACK, NUM_POINTS, MIRROR_SLOTS,
+)
+
+# Casillas en la perspectiva del jugador en turno.
+OWN_BAR: int = 24
+OPPONENT_BAR: int = 25
+OWN_OFF: int = 26
+OPPONENT_OFF: int = 27
+NUM_SOURCES: int = 25  # 24 puntos + barra
+
+# Índices para espejar un tablero hacia la perspectiva del rival (y volver),
+# los mismos que ``Position.mirror``.
+FLIP = np.array(MIRROR_SLOTS, dtype=np.intp)
+
+# Destino y clase de paso por (dado, origen) en la perspectiva del jugador en turno,
+# tomados de ``core.movetables`` (las blancas ya mueven del punto 0 al 23).
+STEP_DEST = np.array(DESTINATION[WHITE][:NUM_SOURCES], dtype=np.intp).T
+STEP_CLASS = np.array(STEP_KIND[WHITE][:NUM_SOURCES], dtype=np.int8).T
+_SOURCE_POINTS = np.arange(NUM_SOURCES)
+
+
+class StepTargets(NamedTuple):
+    """
+    Información de cada paso candidato, con forma ``(M, 2, 25)``.
+
+    Atributos:
+        targets: Conteo de la casilla de destino antes del paso (-1 es un blot rival).
+        kinds: Clase de paso de ``core.movetables`` (``ON_BOARD``, ``BEAR_OFF_EXACT``...).
+    """
+    targets: np.ndarray
+    kinds: np.ndarray
+
+
+# Política por lotes: recibe los pasos legales ``(M, 2, 25)`` (dado mayor y menor
+# por cada origen), su información y el generador; devuelve un puntaje por paso
+# (se juega el mayor entre los legales).
+BatchPolicy = Callable[[np.ndarray, StepTargets, np.random.Generator], np.ndarray]
+
+
+def random_policy(legal: np.ndarray, info: StepTargets, rng: np.random.Generator) -> np.ndarray:
+    """Política aleatoria: todos los pasos legales son equiprobables."""
+    _ = info
+    return rng.random(legal.shape, dtype=np.float32)
+
+
+def greedy_policy(legal: np.ndarray, info: StepTargets, rng: np.random.Generator) -> np.ndarray:
+    """Política codiciosa: golpear, luego sacar fichas, luego mover a puntos propios."""
+    on_board = info.kinds == ON_BOARD
+    score = 4.0 * (on_board & (info.targets == -1))
+    score += 3.0 * (info.kinds > ON_BOARD)
+    score += 2.0 * (on_board & (info.targets >= 1))
+    return score + rng.random(legal.shape, dtype=np.float32)
+
+
+def initial_boards(size: int) -> np.ndarray:
+    """Devuelve ``size`` tableros en la posición inicial (perspectiva de las blancas)."""
+    position = Position()
+    position.setup_initial_points()
+    row = np.frombuffer(position.to_bytes(), dtype=np.int8)
+    return np.tile(row, (size, 1))
+
+
+def _legal_steps(boards: np.ndarray, dice: np.ndarray):
+    """
+    Calcula los pasos legales de cada origen para dos valores de dado por partida.
+
+    Args:
+        boards (np.ndarray): Tableros ``(M, 28)`` en la perspectiva del jugador en turno.
+        dice (np.ndarray): Valores ``(M, 2)`` (0 si no hay dado).
+
+    Returns:
+        Tuple[np.ndarray, StepTargets]: Pasos legales ``(M, 2, 25)`` y su información.
+    """
+    rows = np.arange(len(boards))[:, None, None]
+    targets = boards[rows, STEP_DEST[dice]]
+    kinds = STEP_CLASS[dice]
+    own = boards[:, :NUM_SOURCES] > 0
+    on_bar = own[:, OWN_BAR]
+    home_only = ~own[:, :18].any(axis=1) & ~on_bar
+    furthest = own[:, :NUM_POINTS].argmax(axis=1)
+    open_dest = (kinds == ON_BOARD) & (targets >= -1)
+    bear = (kinds == BEAR_OFF_EXACT) | (
+        (kinds == BEAR_OFF_OVER) & (_SOURCE_POINTS == furthest[:, None])[:, None, :]
+    )
+    bear &= home_only[:, None, None]
+    # Con fichas en la barra solo vale entrar (columna 24); sin ellas, solo los puntos.
+    allowed = (_SOURCE_POINTS == OWN_BAR) == on_bar[:, None]
+    legal = (open_dest | bear) & (own & allowed)[:, None, :]
+    return legal, StepTargets(targets, kinds)
+
+
+class BatchState(NamedTuple):
+    """
+    Arreglos de estado de ``N`` partidas; se modifican en el lugar.
+
+    Atributos:
+        boards: Tableros ``(N, 28)`` en la perspectiva del jugador en turno.
+        sides: Lado en turno de cada partida.
+        remaining: Dados restantes ``(N, 4)`` (0 = usado).
+        winners: Lado ganador de cada partida (-1 si sigue en curso).
+        results: Puntos de cada partida terminada (1, 2 o 3; 0 si sigue).
+    """
+    boards: np.ndarray
+    sides: np.ndarray
+    remaining: np.ndarray
+    winners: np.ndarray
+    results: np.ndarray
+
+
+class BatchGameEngine:
+    """Motor que avanza ``N`` partidas en paralelo (lockstep)."""
+
+    def __init__(
+        self,
+        size: int,
+        seed: Optional[int] = None,
+        policy: BatchPolicy = random_policy,
+        dice: Optional[BatchDice] = None,
+    ) -> None:
+        """
+        Inicializa el motor con todas las partidas en la posición inicial.
+
+        Args:
+            size (int): Cantidad de partidas.
+            seed (Optional[int]): Semilla de los dados y de la política.
+            policy (BatchPolicy): Política de ambos jugadores.
+            dice (Optional[BatchDice]): Dados por lotes (deben tener el mismo tamaño).
+
+        Raises:
+            ValueError: Si ``size`` no es positivo o los dados no coinciden en tamaño.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño del lote debe ser positivo")
+        if dice is not None and dice.get_size() != size:
+            raise ValueError("Los dados deben tener el mismo tamaño que el lote")
+        self.__dice: BatchDice = dice or BatchDice(size, seed=seed)
+        self.__rng: np.random.Generator = np.random.default_rng(seed)
+        self.__policy: BatchPolicy = policy
+        self.reset()
+
+    def reset(self) -> None:
+        """Vuelve todas las partidas a la posición inicial con las blancas en turno."""
+        size = self.get_size()
+        self.__state: BatchState = BatchState(
+            boards=initial_boards(size),
+            sides=np.full(size, WHITE, dtype=np.int8),
+            remaining=np.zeros((size, 4), dtype=np.uint8),
+            winners=np.full(size, -1, dtype=np.int8),
+            results=np.zeros(size, dtype=np.int8),
+        )
+        self.__turns: int = 0
+        self.__steps: int = 0
+
+    def get_size(self) -> int:
+        """Devuelve la cantidad de partidas."""
+        return self.__dice.get_size()
+
+    def get_turns(self) -> int:
+        """Devuelve los turnos jugados en lockstep."""
+        return self.__turns
+
+    def get_steps(self) -> int:
+        """Devuelve la cantidad total de pasos aplicados."""
+        return self.__steps
+
+    def get_sides(self) -> np.ndarray:
+        """Devuelve el lado en turno de cada partida."""
+        return self.__state.sides.copy()
+
+    def get_dice(self) -> np.ndarray:
+        """Devuelve los dados restantes ``(N, 4)`` (0 = usado)."""
+        return self.__state.remaining.copy()
+
+    def get_finished(self) -> np.ndarray:
+        """Devuelve qué partidas terminaron."""
+        return self.__state.winners >= 0
+
+    def get_winners(self) -> np.ndarray:
+        """Devuelve el lado ganador de cada partida (-1 si sigue en curso)."""
+        return self.__state.winners.copy()
+
+    def get_results(self) -> np.ndarray:
+        """Devuelve los puntos de cada partida terminada (1, 2 o 3; 0 si sigue)."""
+        return self.__state.results.copy()
+
+    def get_boards(self) -> np.ndarray:
+        """Devuelve los tableros ``(N, 28)`` en el formato absoluto de ``Position``."""
+        boards = self.__state.boards.copy()
+        black = self.__state.sides == BLACK
+        boards[black] = -boards[black][:, FLIP]
+        return boards
+
+    def get_position(self, index: int) -> Position:
+        """Devuelve la posición de una partida como ``Position``."""
+        row = self.__state.boards[index]
+        if self.__state.sides[index] == BLACK:
+            row = -row[FLIP]
+        return Position(array("b", row.tolist()))
+
+    def legal_steps(self, index: int) -> Set[Step]:
+        """
+        Devuelve los pasos legales de una partida con sus dados restantes.
+
+        Los pasos usan las casillas absolutas de ``Position``, igual que
+        ``core.movegen.legal_steps``.
+        """
+        state = self.__state
+        side = int(state.sides[index])
+        values = sorted(set(int(value) for value in state.remaining[index] if value))
+        if not values:
+            return set()
+        dice = np.array([(values[-1], values[0])], dtype=np.intp)
+        legal = _legal_steps(state.boards[index:index + 1], dice)[0][0]
+        return {
+            self.__absolute_step(side, int(source), int(dice[0, half]))
+            for half, source in zip(*np.nonzero(legal))
+        }
+
+    @staticmethod
+    def __absolute_step(side: int, source: int, die: int) -> Step:
+        """Convierte un paso de la perspectiva del jugador en turno a casillas de ``Position``."""
+        dest = int(STEP_DEST[die, source])
+        if side == BLACK:
+            return (int(FLIP[source]), int(FLIP[dest]), die)
+        return (source, dest, die)
+
+    def roll(self) -> None:
+        """Lanza los dados de todas las partidas en curso."""
+        indices = self.__dice.roll_indices()
+        running = self.__state.winners < 0
+        self.__state.remaining[running] = MOVE_VALUES[indices[running]]
+
+    def play_step(self) -> int:
+        """
+        Aplica un paso (un dado) en cada partida que tenga uno legal.
+
+        Returns:
+            int: Cantidad de partidas que movieron.
+        """
+        remaining = self.__state.remaining
+        active = np.flatnonzero(remaining.any(axis=1))
+        if not active.size:
+            return 0
+        current = remaining[active]
+        # Dado mayor y menor restantes de cada partida.
+        dice = np.stack(
+            (current.max(axis=1), np.where(current, current, 7).min(axis=1)), axis=1
+        ).astype(np.intp)
+        legal, info = _legal_steps(self.__state.boards[active], dice)
+        flat_legal = legal.reshape(len(active), -1)
+        movable = flat_legal.any(axis=1)
+        # Sin paso legal el turno termina: los dados que quedan se pierden.
+        remaining[active[~movable]] = 0
+        if not movable.any():
+            return 0
+        scores = self.__policy(legal, info, self.__rng).reshape(len(active), -1)
+        choice = np.where(flat_legal, scores, -np.inf).argmax(axis=1)[movable]
+        half, source = np.divmod(choice, NUM_SOURCES)
+        rows = active[movable]
+        self.__apply_steps(rows, source, dice[movable, half])
+        return len(rows)
+
+    def __apply_steps(self, rows: np.ndarray, source: np.ndarray, die: np.ndarray) -> None:
+        """Mueve una ficha de ``source`` con ``die`` en cada partida de ``rows`` (con golpes)."""
+        dest = STEP_DEST[die, source]
+        board = self.__state.boards
+        board[rows, source] -= 1
+        hits = board[rows, dest] == -1
+        board[rows[hits], dest[hits]] = 0
+        board[rows[hits], OPPONENT_BAR] -= 1
+        board[rows, dest] += 1
+        remaining = self.__state.remaining
+        slot = (remaining[rows] == die[:, None]).argmax(axis=1)
+        remaining[rows, slot] = 0
+        self.__steps += len(rows)
+        self.__check_finished(rows)
+
+    def __check_finished(self, rows: np.ndarray) -> None:
+        """Marca como terminadas las partidas cuyo jugador en turno sacó las 15 fichas."""
+        state = self.__state
+        board = state.boards
+        done = rows[board[rows, OWN_OFF] == 15]
+        if not done.size:
+            return
+        state.winners[done] = state.sides[done]
+        state.remaining[done] = 0
+        finished = board[done]
+        backgammon = (finished[:, OPPONENT_BAR] < 0) | (finished[:, 18:NUM_POINTS] < 0).any(axis=1)
+        state.results[done] = np.where(
+            finished[:, OPPONENT_OFF] < 0, 1, np.where(backgammon, 3, 2)
+        )
+
+    def end_turn(self) -> None:
+        """Pasa el turno en las partidas en curso (espeja el tablero y cambia de lado)."""
+        state = self.__state
+        running = state.winners < 0
+        state.boards[running] = -state.boards[running][:, FLIP]
+        state.sides[running] ^= 1
+        state.remaining[running] = 0
+        self.__turns += 1
+
+    def play_turn(self) -> None:
+        """Juega un turno completo en todas las partidas en curso."""
+        self.roll()
+        for _ in range(4):
+            if not self.play_step():
+                break
+        self.end_turn()
+
+    def run(self, max_turns: Optional[int] = None) -> int:
+        """
+        Juega turnos hasta que terminen todas las partidas.
+
+        Args:
+            max_turns (Optional[int]): Límite de turnos.
+
+        Returns:
+            int: Turnos jugados.
+        """
+        played = 0
+        while not self.get_finished().all():
+            if max_turns is not None and played >= max_turns:
+                break
+            self.play_turn()
+            played += 1
+        return played
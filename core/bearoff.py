@@ -0,0 +1,369 @@
+"""Módulo bearoff para Backgammon.
+
+Base de datos de bear off de un solo lado. Para cada posición de hasta
+``checkers`` fichas repartidas en los 6 puntos de casa guarda la distribución
+exacta de la cantidad de tiradas que faltan para sacar todas las fichas,
+jugando siempre la jugada que minimiza la cantidad esperada de tiradas.
+
+Las posiciones se indexan con el sistema combinatorio de números: los conteos
+``c[0..5]`` (``c[0]`` es el punto más cercano a la salida) se convierten en la
+combinación estrictamente creciente ``s_i = c_0 + ... + c_i + i`` y su índice es
+``sum(C(s_i, i + 1))``, un número entre 0 y ``C(checkers + 6, 6) - 1``.
+
+El archivo guarda las probabilidades cuantizadas en ``uint16`` (65535 = 1) y se
+abre con ``numpy.memmap`` la primera vez que se consulta, de modo que los
+procesos de un pool comparten las páginas del sistema operativo.
+
+Uso:
+    python -m core.bearoff --checkers 15 --output data/bearoff1.bin
+"""
+
+import argparse
+import struct
+from math import comb
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.evaluation import Evaluator, heuristic_evaluation, terminal_value
+from core.position import Position, WHITE, NUM_POINTS, SIGN, CHECKERS_PER_SIDE
+
+HOME_POINTS: int = 6
+MAGIC: bytes = b"BOS1"
+HEADER = struct.Struct("<4sBBH")
+SCALE: int = 65535
+DEFAULT_PATH: str = "data/bearoff1.bin"
+
+Counts = Tuple[int, ...]
+
+# Tiradas distintas con su peso en 36avos (los dobles mueven cuatro veces).
+ROLLS: Tuple[Tuple[Tuple[int, ...], int], ...] = tuple(
+    ((die1,) * 4, 1) if die1 == die2 else ((die1, die2), 2)
+    for die1 in range(1, 7)
+    for die2 in range(die1, 7)
+)
+
+
+def position_count(checkers: int, points: int = HOME_POINTS) -> int:
+    """Devuelve la cantidad de posiciones de hasta ``checkers`` fichas en ``points`` puntos."""
+    return comb(checkers + points, points)
+
+
+def rank_counts(counts: Sequence[int]) -> int:
+    """
+    Devuelve el índice combinatorio de una posición de bear off.
+
+    Args:
+        counts (Sequence[int]): Fichas por punto, del más cercano a la salida al más lejano.
+
+    Returns:
+        int: Índice de la posición.
+    """
+    rank = 0
+    position = -1
+    for index, count in enumerate(counts):
+        position += count + 1
+        rank += comb(position, index + 1)
+    return rank
+
+
+def unrank_counts(rank: int, checkers: int, points: int = HOME_POINTS) -> Counts:
+    """
+    Devuelve los conteos de la posición con el índice indicado.
+
+    Args:
+        rank (int): Índice combinatorio.
+        checkers (int): Máximo de fichas de la base.
+        points (int): Cantidad de puntos.
+
+    Raises:
+        ValueError: Si el índice está fuera de rango.
+    """
+    if not 0 <= rank < position_count(checkers, points):
+        raise ValueError("Índice de posición fuera de rango")
+    combination = [0] * points
+    upper = checkers + points - 1
+    for index in range(points - 1, -1, -1):
+        while comb(upper, index + 1) > rank:
+            upper -= 1
+        combination[index] = upper
+        rank -= comb(upper, index + 1)
+        upper -= 1
+    counts = []
+    previous = -1
+    for value in combination:
+        counts.append(value - previous - 1)
+        previous = value
+    return tuple(counts)
+
+
+def home_counts(position: Position, side: int) -> Optional[Counts]:
+    """
+    Devuelve los conteos de bear off de un lado, o None si no está todo en casa.
+
+    Args:
+        position (Position): Posición.
+        side (int): Lado a consultar.
+
+    Returns:
+        Optional[Counts]: Fichas por distancia a la salida (1 a 6).
+    """
+    if not position.can_bear_off(side):
+        return None
+    cells = position.get_cells()
+    sign = SIGN[side]
+    if side == WHITE:
+        slots = range(NUM_POINTS - 1, NUM_POINTS - 1 - HOME_POINTS, -1)
+    else:
+        slots = range(HOME_POINTS)
+    return tuple(max(cells[slot] * sign, 0) for slot in slots)
+
+
+def single_moves(counts: Counts, die: int) -> List[Counts]:
+    """Devuelve las posiciones distintas tras jugar un dado."""
+    if not any(counts):
+        return [counts]
+    highest = max(index for index, count in enumerate(counts) if count)
+    children = []
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        target = index - die
+        if target < -1 and index != highest:
+            continue
+        child = list(counts)
+        child[index] -= 1
+        if target >= 0:
+            child[target] += 1
+        children.append(tuple(child))
+    return children
+
+
+def generate_distributions(checkers: int) -> np.ndarray:
+    """
+    Calcula la distribución exacta de tiradas hasta terminar el bear off.
+
+    Args:
+        checkers (int): Máximo de fichas (1 a 15).
+
+    Returns:
+        np.ndarray: Arreglo ``(posiciones, máximo_de_tiradas)`` de ``float64``,
+        indexado por ``rank_counts``.
+
+    Raises:
+        ValueError: Si ``checkers`` está fuera de rango.
+    """
+    if not 1 <= checkers <= CHECKERS_PER_SIDE:
+        raise ValueError("La cantidad de fichas debe estar entre 1 y 15")
+    total = position_count(checkers)
+    positions = [unrank_counts(rank, checkers) for rank in range(total)]
+    order = sorted(range(total), key=lambda rank: sum(
+        count * (index + 1) for index, count in enumerate(positions[rank])))
+    max_rolls = checkers * HOME_POINTS // 2 + 2
+    distributions = np.zeros((total, max_rolls), dtype=np.float64)
+    expected: Dict[Counts, float] = {}
+    best_cache: Dict[Tuple[Counts, Tuple[int, ...]], Tuple[float, Counts]] = {}
+
+    def best_after(counts: Counts, dice: Tuple[int, ...]) -> Tuple[float, Counts]:
+        """Mejor posición (menor esperanza de tiradas) tras jugar los dados en orden."""
+        if not dice:
+            return expected[counts], counts
+        key = (counts, dice)
+        cached = best_cache.get(key)
+        if cached is None:
+            cached = min(best_after(child, dice[1:]) for child in single_moves(counts, dice[0]))
+            best_cache[key] = cached
+        return cached
+
+    for rank in order:
+        counts = positions[rank]
+        if not any(counts):
+            distributions[rank, 0] = 1.0
+            expected[counts] = 0.0
+            continue
+        row = distributions[rank]
+        for dice, weight in ROLLS:
+            options = [best_after(counts, dice)]
+            if len(dice) == 2:
+                options.append(best_after(counts, dice[::-1]))
+            child = rank_counts(min(options)[1])
+            row[1:] += weight / 36 * distributions[child, :-1]
+        expected[counts] = float(np.dot(row, np.arange(max_rolls)))
+        # Las entradas intermedias ya no se reutilizan después de calcular la posición.
+        if len(best_cache) > 1 << 20:
+            best_cache.clear()
+    used = int(np.flatnonzero(distributions.any(axis=0))[-1]) + 1
+    return distributions[:, :used]
+
+
+def write_database(path: str, checkers: int) -> None:
+    """
+    Genera la base de datos y la guarda en ``path``.
+
+    Args:
+        path (str): Archivo de salida.
+        checkers (int): Máximo de fichas.
+    """
+    distributions = generate_distributions(checkers)
+    quantized = np.rint(distributions * SCALE).astype("<u2")
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, HOME_POINTS, checkers, distributions.shape[1]))
+        handle.write(quantized.tobytes())
+
+
+class MappedBearoffDatabase:
+    """
+    Base de las consultas de bear off: abre el archivo con mmap bajo demanda.
+
+    El archivo empieza con la cabecera ``header`` (firma, puntos de casa, máximo
+    de fichas y los campos propios del formato) seguida de la tabla ``uint16``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        magic: bytes,
+        header: struct.Struct,
+        shape: Callable[..., Tuple[int, ...]],
+    ) -> None:
+        """
+        Inicializa la base sin abrir el archivo.
+
+        Args:
+            path (str): Archivo de la base.
+            magic (bytes): Firma esperada del formato.
+            header (struct.Struct): Cabecera del formato.
+            shape (Callable[..., Tuple[int, ...]]): Forma de la tabla a partir del
+                máximo de fichas y los campos propios de la cabecera.
+        """
+        self.__path: str = path
+        self.__magic: bytes = magic
+        self.__header: struct.Struct = header
+        self.__shape: Callable[..., Tuple[int, ...]] = shape
+        self.__table: Optional[np.memmap] = None
+        self.__checkers: int = 0
+
+    def get_table(self) -> np.memmap:
+        """Devuelve la tabla cuantizada, abriendo el archivo con mmap la primera vez."""
+        if self.__table is None:
+            header = self.__header
+            with open(self.__path, "rb") as handle:
+                data = handle.read(header.size)
+            if len(data) < header.size:
+                raise ValueError("Archivo de bear off inválido")
+            magic, points, checkers, *fields = header.unpack(data)
+            if magic != self.__magic or points != HOME_POINTS:
+                raise ValueError("Archivo de bear off inválido")
+            self.__checkers = checkers
+            self.__table = np.memmap(
+                self.__path, dtype="<u2", mode="r", offset=header.size,
+                shape=self.__shape(checkers, *fields),
+            )
+        return self.__table
+
+    def is_loaded(self) -> bool:
+        """Indica si el archivo ya fue mapeado."""
+        return self.__table is not None
+
+    def get_checkers(self) -> int:
+        """Devuelve el máximo de fichas (por lado) cubierto por la base."""
+        self.get_table()
+        return self.__checkers
+
+    def covers(self, counts: Optional[Counts]) -> bool:
+        """Indica si la posición de un lado está en la base."""
+        return counts is not None and sum(counts) <= self.get_checkers()
+
+
+class BearoffDatabase(MappedBearoffDatabase):
+    """Consulta de la base de bear off de un solo lado, cargada con mmap bajo demanda."""
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        Inicializa la base sin abrir el archivo.
+
+        Args:
+            path (str): Archivo generado con ``write_database``.
+        """
+        # Una fila por posición y una columna por cantidad de tiradas.
+        super().__init__(
+            path, MAGIC, HEADER, lambda checkers, max_rolls: (position_count(checkers), max_rolls),
+        )
+
+    def distribution(self, counts: Counts) -> np.ndarray:
+        """
+        Devuelve la probabilidad de terminar en exactamente ``k`` tiradas.
+
+        Args:
+            counts (Counts): Fichas por distancia a la salida (1 a 6).
+
+        Raises:
+            ValueError: Si la posición no está en la base.
+        """
+        if not self.covers(counts):
+            raise ValueError("La posición no está en la base de bear off")
+        return self.get_table()[rank_counts(counts)] / SCALE
+
+    def expected_rolls(self, counts: Counts) -> float:
+        """Devuelve la cantidad esperada de tiradas para terminar el bear off."""
+        probabilities = self.distribution(counts)
+        return float(np.dot(probabilities, np.arange(len(probabilities))))
+
+    def win_probability(self, position: Position, side: int) -> Optional[float]:
+        """
+        Devuelve la probabilidad exacta de ganar de ``side``, que tiene el turno.
+
+        Solo vale cuando ambos lados están en bear off sin contacto; si no,
+        devuelve None.
+        """
+        own = home_counts(position, side)
+        other = home_counts(position, 1 - side)
+        if not (self.covers(own) and self.covers(other)):
+            return None
+        mine = self.distribution(own)
+        theirs = self.distribution(other)
+        # Gana quien tira primero si termina en k tiradas y el rival necesita al menos k.
+        theirs_at_least = np.concatenate((np.cumsum(theirs[::-1])[::-1], [0.0]))
+        size = min(len(mine), len(theirs_at_least))
+        return float(np.dot(mine[:size], theirs_at_least[:size]))
+
+
+def make_bearoff_evaluator(
+    database: BearoffDatabase, fallback: Evaluator = heuristic_evaluation
+) -> Evaluator:
+    """
+    Devuelve un evaluador que usa la base en las posiciones de bear off.
+
+    Como el motor y las políticas, el evaluador se llama sobre la posición que
+    dejó la jugada de ``side``, así que el turno es del rival. La equity de la
+    base es sin cubo y sin gammons (``2p - 1``); el resto de las posiciones se
+    delega en ``fallback``.
+
+    Sirve con cualquier base que tenga ``win_probability(position, side)``, por
+    ejemplo ``core.bearoff2.TwoSidedBearoffDatabase``; encadenando evaluadores
+    se puede consultar primero la base de dos lados y luego la de uno.
+    """
+    def evaluate(position: Position, side: int) -> float:
+        result = terminal_value(position, side)
+        if result:
+            return float(result)
+        probability = database.win_probability(position, 1 - side)
+        if probability is None:
+            return fallback(position, side)
+        return 1.0 - 2.0 * probability
+
+    return evaluate
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Genera la base de datos desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera la base de bear off de un solo lado")
+    parser.add_argument("--checkers", type=int, default=CHECKERS_PER_SIDE)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args(argv)
+    write_database(args.output, args.checkers)
+    print(f"Base de {position_count(args.checkers)} posiciones guardada en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
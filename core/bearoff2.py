@@ -0,0 +1,234 @@
+"""Módulo bearoff2 para Backgammon.
+
+Base de bear off de dos lados: para cada par de posiciones de hasta
+``checkers`` fichas por lado en las casas guarda la probabilidad exacta (sin
+cubo) de que gane el lado que tiene el turno. Las posiciones de cada lado se
+indexan con el mismo rango combinatorio que ``core.bearoff``; la tabla
+``W[propia, rival]`` ocupa ``position_count(checkers) ** 2`` valores ``uint16``
+(65535 = 1) y se abre con ``numpy.memmap`` en la primera consulta.
+
+El cálculo es retrógrado por niveles de pips totales: ``W[x, y]`` solo depende
+de ``W[y, c]`` con ``c`` una posición que deja ``x`` tras su tirada, que tiene
+menos pips. Todos los pares de un mismo nivel son independientes y se reparten
+entre los procesos de un ``ProcessPoolExecutor`` que escriben sobre una tabla
+de trabajo compartida por mmap.
+
+Uso:
+    python -m core.bearoff2 --checkers 6 --output data/bearoff2.bin
+"""
+
+import argparse
+import os
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.bearoff import (
+    HOME_POINTS, SCALE, Counts, ROLLS, MappedBearoffDatabase, single_moves, home_counts,
+    position_count, rank_counts, unrank_counts,
+)
+from core.position import Position
+
+MAGIC: bytes = b"BTS2"
+# Firma, puntos de casa y máximo de fichas por lado.
+HEADER = struct.Struct("<4sBB")
+DEFAULT_CHECKERS: int = 6
+DEFAULT_PATH: str = "data/bearoff2.bin"
+
+# Pesos en 36avos de las 21 tiradas, en el mismo orden que ``ROLLS``.
+_WEIGHTS = tuple(weight for _, weight in ROLLS)
+
+
+def _final_positions(counts: Counts, dice: Tuple[int, ...]) -> List[int]:
+    """Devuelve los rangos de las posiciones distintas que deja una tirada."""
+    orders = [dice] if len(dice) == 4 else [dice, dice[::-1]]
+    finals = set()
+    for order in orders:
+        frontier = {counts}
+        for die in order:
+            frontier = {child for current in frontier for child in single_moves(current, die)}
+        finals |= frontier
+    return sorted(rank_counts(final) for final in finals)
+
+
+def build_children(checkers: int) -> List[List[np.ndarray]]:
+    """
+    Calcula, para cada posición y cada una de las 21 tiradas, las posiciones alcanzables.
+
+    Returns:
+        List[List[np.ndarray]]: ``children[rango][tirada]`` con los rangos hijos.
+    """
+    return [
+        [np.array(_final_positions(unrank_counts(rank, checkers), dice), dtype=np.intp)
+         for dice, _ in ROLLS]
+        for rank in range(position_count(checkers))
+    ]
+
+
+class _Solver:
+    """Estado de cálculo de un proceso: tabla compartida, hijos y grupos por pips."""
+
+    def __init__(self, work_path: str, checkers: int) -> None:
+        total = position_count(checkers)
+        self.table: np.memmap = np.memmap(work_path, dtype=np.float64, mode="r+",
+                                          shape=(total, total))
+        self.children: List[List[np.ndarray]] = build_children(checkers)
+        self.pips: List[int] = [
+            sum(count * (index + 1) for index, count in enumerate(unrank_counts(rank, checkers)))
+            for rank in range(total)
+        ]
+        groups: Dict[int, List[int]] = {}
+        for rank in range(1, total):
+            groups.setdefault(self.pips[rank], []).append(rank)
+        self.groups: Dict[int, np.ndarray] = {
+            pips: np.array(ranks, dtype=np.intp) for pips, ranks in groups.items()
+        }
+
+    def solve(self, level: int, ranks: Sequence[int]) -> None:
+        """Calcula ``W[x, y]`` para cada ``x`` dado y cada ``y`` del nivel de pips ``level``."""
+        table = self.table
+        for rank in ranks:
+            opponents = self.groups.get(level - self.pips[rank])
+            if opponents is None:
+                continue
+            total = np.zeros(len(opponents))
+            rows = table[opponents]
+            for weight, children in zip(_WEIGHTS, self.children[rank]):
+                total += weight * (1.0 - rows[:, children]).max(axis=1)
+            table[rank, opponents] = total / 36
+
+
+_WORKER_SOLVER: Optional[_Solver] = None
+
+
+def _init_worker(work_path: str, checkers: int) -> None:
+    """Inicializador de cada proceso del pool."""
+    global _WORKER_SOLVER  # pylint: disable=global-statement
+    _WORKER_SOLVER = _Solver(work_path, checkers)
+
+
+def _solve_chunk(level: int, ranks: List[int]) -> None:
+    """Tarea del pool: resuelve un bloque de posiciones de un nivel."""
+    _WORKER_SOLVER.solve(level, ranks)
+    _WORKER_SOLVER.table.flush()
+
+
+def generate_table(checkers: int, work_path: str, workers: int = 1) -> np.memmap:
+    """
+    Calcula la tabla de probabilidades en un archivo de trabajo ``float64``.
+
+    Args:
+        checkers (int): Máximo de fichas por lado.
+        work_path (str): Archivo de trabajo (se sobrescribe).
+        workers (int): Procesos; 1 calcula en este proceso.
+
+    Returns:
+        np.memmap: La tabla ``W`` calculada.
+
+    Raises:
+        ValueError: Si ``checkers`` o ``workers`` no son positivos.
+    """
+    if checkers <= 0 or workers <= 0:
+        raise ValueError("La cantidad de fichas y de workers debe ser positiva")
+    total = position_count(checkers)
+    table = np.memmap(work_path, dtype=np.float64, mode="w+", shape=(total, total))
+    # El rango 0 es la posición sin fichas: quien la tiene ya ganó.
+    table[0, 1:] = 1.0
+    table.flush()
+    ranks = list(range(1, total))
+    max_level = 2 * HOME_POINTS * checkers
+    if workers == 1:
+        solver = _Solver(work_path, checkers)
+        for level in range(2, max_level + 1):
+            solver.solve(level, ranks)
+        solver.table.flush()
+    else:
+        chunks = [ranks[start::workers] for start in range(workers)]
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(work_path, checkers)) as pool:
+            for level in range(2, max_level + 1):
+                futures = [pool.submit(_solve_chunk, level, chunk) for chunk in chunks]
+                for future in wait(futures).done:
+                    future.result()
+    return np.memmap(work_path, dtype=np.float64, mode="r", shape=(total, total))
+
+
+def write_database(path: str, checkers: int = DEFAULT_CHECKERS, workers: int = 1) -> None:
+    """
+    Genera la base de dos lados y la guarda cuantizada en ``path``.
+
+    Args:
+        path (str): Archivo de salida.
+        checkers (int): Máximo de fichas por lado.
+        workers (int): Procesos para el cálculo.
+    """
+    handle, work_path = tempfile.mkstemp(suffix=".work", dir=os.path.dirname(path) or None)
+    os.close(handle)
+    try:
+        table = generate_table(checkers, work_path, workers)
+        quantized = np.rint(np.asarray(table) * SCALE).astype("<u2")
+        del table
+        with open(path, "wb") as output:
+            output.write(HEADER.pack(MAGIC, HOME_POINTS, checkers))
+            output.write(quantized.tobytes())
+    finally:
+        os.remove(work_path)
+
+
+class TwoSidedBearoffDatabase(MappedBearoffDatabase):
+    """Consulta de la base de bear off de dos lados, cargada con mmap bajo demanda."""
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        Inicializa la base sin abrir el archivo.
+
+        Args:
+            path (str): Archivo generado con ``write_database``.
+        """
+        # Una fila por posición propia y una columna por posición rival.
+        super().__init__(
+            path, MAGIC, HEADER, lambda checkers: (position_count(checkers),) * 2,
+        )
+
+    def lookup(self, own: Counts, other: Counts) -> float:
+        """
+        Devuelve la probabilidad de ganar del lado en turno dados los conteos de ambos.
+
+        Raises:
+            ValueError: Si alguna de las posiciones no está en la base.
+        """
+        if not (self.covers(own) and self.covers(other)):
+            raise ValueError("La posición no está en la base de bear off")
+        return float(self.get_table()[rank_counts(own), rank_counts(other)]) / SCALE
+
+    def win_probability(self, position: Position, side: int) -> Optional[float]:
+        """
+        Devuelve la probabilidad exacta de ganar de ``side``, que tiene el turno.
+
+        Devuelve None si algún lado no está en bear off o tiene más fichas
+        de las que cubre la base.
+        """
+        own = home_counts(position, side)
+        other = home_counts(position, 1 - side)
+        if not (self.covers(own) and self.covers(other)):
+            return None
+        return self.lookup(own, other)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Genera la base de datos desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera la base de bear off de dos lados")
+    parser.add_argument("--checkers", type=int, default=DEFAULT_CHECKERS)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    write_database(args.output, args.checkers, args.workers)
+    total = position_count(args.checkers) ** 2
+    print(f"Base de {total} pares de posiciones guardada en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
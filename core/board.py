@@ -1,27 +1,233 @@
 """Módulo Board para Backgammon.
 
 Gestiona el estado del tablero, las fichas, la barra y las fichas fuera del tablero.
-"""
-import copy
 
-from typing import List, Dict, Any, Optional
+El estado se guarda en una ``Position`` compacta (conteos con signo por casilla);
+``Board`` expone sobre ella la API basada en objetos ``Checker`` que usan el juego,
+la CLI y la interfaz Pygame. Las fichas devueltas se crean al vuelo a partir de
+los conteos.
+"""
+from collections.abc import Mapping, Sequence
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from core.checker import Checker
 from core.player import Player
+from core.position import (
+    Position, WHITE, BLACK, COLORS, SIDE_BY_COLOR, SIGN, NUM_POINTS, BAR_SLOT, OFF_SLOT,
+)
+from core.positionid import encode_position_id, decode_position_id
+
+
+class _SlotView(Sequence):
+    """Vista tipo lista de las fichas de una casilla (punto, barra o fuera)."""
+
+    __slots__ = ("__board", "__slot", "__side")
+
+    def __init__(self, board: "Board", slot: int, side: Optional[int] = None) -> None:
+        self.__board = board
+        self.__slot = slot
+        self.__side = side
+
+    def __len__(self) -> int:
+        return self.__board.get_position().get_count(self.__slot)
+
+    def __getitem__(self, index: Any) -> Any:
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Índice de ficha fuera de rango")
+        return self.__board._make_checker(self.__current_side())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, _SlotView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __current_side(self) -> Optional[int]:
+        if self.__side is not None:
+            return self.__side
+        return self.__board.get_position().get_owner_side(self.__slot)
+
+    def append(self, checker: Checker) -> None:
+        """Agrega una ficha a la casilla."""
+        self.__board._push_checker(self.__slot, checker, self.__side)
+
+    def pop(self, index: int = -1) -> Checker:  # pylint: disable=unused-argument
+        """Remueve y devuelve una ficha de la casilla (todas son equivalentes)."""
+        side = self.__current_side()
+        if side is None or not self:
+            raise IndexError("pop from empty list")
+        self.__board.get_position().remove_checkers(self.__slot, side)
+        return self.__board._make_checker(side)
+
+
+class _PointsView(Sequence):
+    """Vista de los 24 puntos que admite asignar una lista de fichas por punto."""
+
+    __slots__ = ("__board",)
+
+    def __init__(self, board: "Board") -> None:
+        self.__board = board
+
+    def __len__(self) -> int:
+        return NUM_POINTS
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(NUM_POINTS))]
+        if index < 0:
+            index += NUM_POINTS
+        if not 0 <= index < NUM_POINTS:
+            raise IndexError("Punto fuera de rango")
+        return _SlotView(self.__board, index)
+
+    def __setitem__(self, index: int, checkers: Iterable[Checker]) -> None:
+        if index < 0:
+            index += NUM_POINTS
+        if not 0 <= index < NUM_POINTS:
+            raise IndexError("Punto fuera de rango")
+        self.__board._set_checkers(index, checkers)
+
+
+class _SideStacks(Mapping):
+    """Vista tipo diccionario ``color -> fichas`` de la barra o de las fichas fuera."""
+
+    __slots__ = ("__board", "__slots")
+
+    def __init__(self, board: "Board", slots: Tuple[int, int]) -> None:
+        self.__board = board
+        self.__slots = slots
+
+    def __getitem__(self, color: str) -> _SlotView:
+        side = SIDE_BY_COLOR[color]
+        return _SlotView(self.__board, self.__slots[side], side)
+
+    def __setitem__(self, color: str, checkers: Iterable[Checker]) -> None:
+        side = SIDE_BY_COLOR[color]
+        self.__board._set_checkers(self.__slots[side], checkers, side)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(COLORS)
+
+    def __len__(self) -> int:
+        return len(COLORS)
+
 
 class Board:
     """Representa el tablero de Backgammon."""
 
-    def __init__(self) -> None:
+    __slots__ = ("__position", "__players")
+
+    def __init__(
+        self,
+        position: Optional[Position] = None,
+        players: Optional[Sequence[Optional[Player]]] = None,
+    ) -> None:
         """
         Inicializa el tablero con 24 puntos vacíos.
+
+        Args:
+            position (Optional[Position]): Posición que respalda al tablero; si es None
+                se crea una vacía. No se copia.
+            players (Optional[Sequence[Optional[Player]]]): Jugadores por lado (WHITE,
+                BLACK); si es None se crean al pedirlos.
         """
-        self.points: List[List['Checker']] = [[] for _ in range(24)]
-        self.bar: Dict[str, List['Checker']] = {"white": [], "black": []}  # pylint: disable=disallowed-name
-        self.bear_off: Dict[str, List['Checker']] = {"white": [], "black": []}
+        self.__position: Position = position if position is not None else Position()
+        self.__players: List[Optional[Player]] = (
+            list(players) if players is not None else [None, None]
+        )
 
-    def get_points(self) -> List[List[Checker]]:
+    @property
+    def points(self) -> _PointsView:
+        """Vista de los 24 puntos del tablero."""
+        return _PointsView(self)
+
+    @points.setter
+    def points(self, value: Iterable[Iterable[Checker]]) -> None:
+        self.__position.clear_points()
+        for i, checkers in enumerate(value):
+            self._set_checkers(i, checkers)
+
+    @property
+    def bar(self) -> _SideStacks:  # pylint: disable=disallowed-name
+        """Vista de las fichas en la barra por color."""
+        return _SideStacks(self, BAR_SLOT)
+
+    @bar.setter
+    def bar(self, value: Dict[str, Iterable[Checker]]) -> None:  # pylint: disable=disallowed-name
+        for color in COLORS:
+            self.bar[color] = value.get(color, [])
+
+    @property
+    def bear_off(self) -> _SideStacks:
+        """Vista de las fichas fuera del tablero por color."""
+        return _SideStacks(self, OFF_SLOT)
+
+    @bear_off.setter
+    def bear_off(self, value: Dict[str, Iterable[Checker]]) -> None:
+        for color in COLORS:
+            self.bear_off[color] = value.get(color, [])
+
+    def get_position(self) -> Position:
+        """Devuelve la posición compacta que respalda al tablero."""
+        return self.__position
+
+    def get_player(self, side: int) -> Player:
+        """Devuelve el jugador asociado al lado (WHITE o BLACK)."""
+        player = self.__players[side]
+        if player is None:
+            player = Player("Blanco" if side == WHITE else "Negro", COLORS[side])
+            self.__players[side] = player
+        return player
+
+    def _make_checker(self, side: Optional[int]) -> Checker:
+        """Crea una ficha del lado indicado para exponerla por la API."""
+        if side is None:
+            raise IndexError("La casilla está vacía")
+        return Checker(self.get_player(side))
+
+    def _register_owner(self, checker: Checker) -> int:
+        """Registra al dueño de la ficha y devuelve su lado."""
+        owner = checker.get_owner()
+        side = SIDE_BY_COLOR[owner.get_color()]
+        self.__players[side] = owner
+        return side
+
+    def _push_checker(self, slot: int, checker: Checker, side: Optional[int] = None) -> None:
+        """Agrega una ficha a la casilla validando el lado si la casilla lo fija."""
+        checker_side = self._register_owner(checker)
+        if side is not None and side != checker_side:
+            raise ValueError("La ficha no corresponde a esta casilla")
+        self.__position.add_checkers(slot, checker_side)
+
+    def _set_checkers(
+        self, slot: int, checkers: Iterable[Checker], side: Optional[int] = None
+    ) -> None:
+        """Reemplaza el contenido de la casilla por las fichas dadas."""
+        checkers = list(checkers)
+        sides = {self._register_owner(checker) for checker in checkers}
+        if len(sides) > 1:
+            raise ValueError("Una casilla no puede tener fichas de ambos jugadores")
+        checker_side = sides.pop() if sides else WHITE if side is None else side
+        if side is not None and checker_side != side:
+            raise ValueError("La ficha no corresponde a esta casilla")
+        self.__position.set_slot(slot, checker_side, len(checkers))
+
+    @staticmethod
+    def _side_of(player: Player) -> int:
+        """Devuelve el lado del jugador según su color."""
+        return SIDE_BY_COLOR[player.get_color()]
+
+    def get_points(self) -> List[_SlotView]:
         """Devuelve la lista de puntos del tablero."""
-        return self.points
+        return list(self.points)
 
     def setup_initial_position(self, player1: 'Player', player2: 'Player') -> None:
         """
@@ -31,66 +237,54 @@ class Board:
             player1 (Player): Jugador blanco.
             player2 (Player): Jugador negro.
         """
-        self.points = [[] for _ in range(24)]
-        # Blanco (white)
-        self.points[0] = [Checker(player1) for _ in range(2)]      # Punto 1: 2 fichas blancas
-        self.points[11] = [Checker(player1) for _ in range(5)]     # Punto 12: 5 fichas blancas
-        self.points[16] = [Checker(player1) for _ in range(3)]     # Punto 17: 3 fichas blancas
-        self.points[18] = [Checker(player1) for _ in range(5)]     # Punto 19: 5 fichas blancas
-        # Negro (black)
-        self.points[23] = [Checker(player2) for _ in range(2)]     # Punto 24: 2 fichas negras
-        self.points[12] = [Checker(player2) for _ in range(5)]     # Punto 13: 5 fichas negras
-        self.points[7] = [Checker(player2) for _ in range(3)]      # Punto 8: 3 fichas negras
-        self.points[5] = [Checker(player2) for _ in range(5)]      # Punto 6: 5 fichas negras
+        self.__players[WHITE] = player1
+        self.__players[BLACK] = player2
+        self.__position.setup_initial_points()
 
     def is_point_empty(self, point: int) -> bool:
         """Indica si el punto está vacío."""
-        return len(self.points[point]) == 0
+        return self.__position.get_cells()[point] == 0
 
     def get_point_owner(self, point: int) -> Optional[Player]:
         """Devuelve el propietario del punto."""
-        if not self.points[point]:
+        side = self.__position.get_owner_side(point)
+        if side is None:
             return None
-        return self.points[point][0].get_owner()
+        return self.get_player(side)
 
     def get_checkers_count_on_point(self, point: int) -> int:
         """Devuelve la cantidad de fichas en el punto."""
         if point < 0 or point > 23:
             raise ValueError("Punto inválido")
-        return len(self.points[point])
+        return self.__position.get_count(point)
 
     def add_checker_to_point(self, point: int, checker: Checker) -> None:
         """Agrega una ficha al punto."""
-        self.points[point].append(checker)
+        self._push_checker(point, checker)
 
     def remove_checker_from_point(self, point: int) -> Checker:
         """Remueve una ficha del punto."""
-        if not self.points[point]:
+        side = self.__position.get_owner_side(point)
+        if side is None:
             raise ValueError("No hay fichas para remover")
-        return self.points[point].pop()
+        self.__position.remove_checkers(point, side)
+        return self._make_checker(side)
 
     def can_place_checker(self, point: int, player: Player) -> bool:
         """Indica si se puede colocar una ficha en el punto."""
-        if self.is_point_empty(point):
-            return True
-        owner = self.get_point_owner(point)
-        if owner == player:
-            return True
-        return len(self.points[point]) == 1
+        return self.__position.get_cells()[point] * SIGN[self._side_of(player)] >= -1
 
     def is_point_blocked(self, point: int, player: Player) -> bool:
         """Indica si el punto está bloqueado para el jugador."""
-        owner = self.get_point_owner(point)
-        return owner is not None and owner != player and len(self.points[point]) > 1
+        return self.__position.get_cells()[point] * SIGN[self._side_of(player)] < -1
 
     def has_blot(self, point: int) -> bool:
         """Indica si el punto tiene un blot (solo una ficha)."""
-        return len(self.points[point]) == 1
+        return self.__position.get_count(point) == 1
 
     def can_hit_blot(self, point: int, player: Player) -> bool:
         """Indica si el jugador puede golpear el blot en el punto."""
-        owner = self.get_point_owner(point)
-        return self.has_blot(point) and owner is not None and owner != player
+        return self.__position.get_cells()[point] * SIGN[self._side_of(player)] == -1
 
     def hit_blot(self, point: int, player: Player) -> Checker:
         """Golpea el blot en el punto y lo remueve."""
@@ -100,22 +294,20 @@ class Board:
 
     def get_bar_checkers_count(self, player: Player) -> int:
         """Devuelve la cantidad de fichas en la barra para el jugador."""
-        color = player.get_color()
-        return len(self.bar.get(color, []))
+        return self.__position.get_bar(self._side_of(player))
 
     def add_checker_to_bar(self, checker: Checker) -> None:
         """Agrega una ficha a la barra."""
-        color = checker.get_color()
-        if color not in self.bar:
-            self.bar[color] = []
-        self.bar[color].append(checker)
+        side = self._register_owner(checker)
+        self.__position.add_checkers(BAR_SLOT[side], side)
 
     def remove_checker_from_bar(self, player: Player) -> Checker:
         """Remueve una ficha de la barra del jugador."""
-        color = player.get_color()
         if self.get_bar_checkers_count(player) == 0:
             raise ValueError("No hay fichas en la barra")
-        return self.bar[color].pop()
+        side = self._side_of(player)
+        self.__position.remove_checkers(BAR_SLOT[side], side)
+        return self._make_checker(side)
 
     def has_checkers_on_bar(self, player: Player) -> bool:
         """Indica si el jugador tiene fichas en la barra."""
@@ -123,21 +315,18 @@ class Board:
 
     def get_off_board_checkers_count(self, player: Player) -> int:
         """Devuelve la cantidad de fichas fuera del tablero para el jugador."""
-        color = player.get_color()
-        return len(self.bear_off.get(color, []))
+        return self.__position.get_off(self._side_of(player))
 
     def add_checker_off_board(self, checker: Checker) -> None:
         """Agrega una ficha fuera del tablero."""
-        color = checker.get_color()
-        if color not in self.bear_off:
-            self.bear_off[color] = []
-        self.bear_off[color].append(checker)
+        side = self._register_owner(checker)
+        self.__position.add_checkers(OFF_SLOT[side], side)
 
-    def get_bar(self) -> Dict[Player, List[Checker]]:
+    def get_bar(self) -> Mapping:
         """Devuelve la barra de fichas."""
         return self.bar
 
-    def get_off_board(self) -> Dict[Player, List[Checker]]:
+    def get_off_board(self) -> Mapping:
         """Devuelve las fichas fuera del tablero."""
         return self.bear_off
 
@@ -151,7 +340,7 @@ class Board:
 
     def is_in_home_board(self, point: int, player: Player) -> bool:
         """Indica si el punto está en la zona de casa del jugador.
-        
+
         Args:
             point: Número de punto (1-based: 1-24)
         """
@@ -161,89 +350,128 @@ class Board:
 
     def can_bear_off(self, player: Player) -> bool:
         """Indica si el jugador puede sacar fichas del tablero."""
-        if self.has_checkers_on_bar(player):
-            return False
-        # Los puntos del tablero usan índices 0-based (0-23)
-        # Home board de blancas: puntos 19-24 (índices 18-23)
-        # Home board de negras: puntos 1-6 (índices 0-5)
-        home_points = range(18, 24) if player.get_color() == "white" else range(0, 6)
-        for i in range(24):
-            if i not in home_points:
-                for checker in self.points[i]:
-                    if checker.get_owner() == player:
-                        return False
-        return True
+        return self.__position.can_bear_off(self._side_of(player))
 
     def get_furthest_checker(self, player: Player) -> Optional[int]:
         """Devuelve la posición de la ficha más lejana del jugador."""
-        if player.get_color() == "white":
-            for i in range(24):
-                if any(c.get_owner() == player for c in self.points[i]):
-                    return i
-        else:
-            for i in reversed(range(24)):
-                if any(c.get_owner() == player for c in self.points[i]):
-                    return i
-        return None
+        return self.__position.furthest_point(self._side_of(player))
 
     def count_checkers_on_board(self, player: Player) -> int:
         """Cuenta las fichas del jugador en el tablero."""
-        return sum(1 for i in range(24) for c in self.points[i] if c.get_owner() == player)
+        return self.__position.count_on_board(self._side_of(player))
 
     def get_all_checker_positions(self, player: Player) -> List[int]:
         """Devuelve todas las posiciones de fichas del jugador en el tablero."""
-        return [i for i in range(24) if any(c.get_owner() == player for c in self.points[i])]
+        return self.__position.checker_positions(self._side_of(player))
+
+    def get_checkers(self, player: Player) -> List[Checker]:
+        """
+        Devuelve fichas del jugador generadas a partir de la posición actual.
+
+        Las fichas se crean en cada llamada con su punto, barra o salida ya
+        asignados, por lo que nunca quedan desactualizadas respecto del tablero.
+
+        Args:
+            player (Player): Jugador cuyas fichas se devuelven.
+
+        Returns:
+            List[Checker]: Fichas en el tablero, en la barra y fuera.
+        """
+        side = self._side_of(player)
+        position = self.__position
+        checkers = []
+        for point in position.checker_positions(side):
+            for _ in range(position.get_side_count(point, side)):
+                checker = Checker(player)
+                checker.set_position(point)
+                checkers.append(checker)
+        for _ in range(position.get_bar(side)):
+            checker = Checker(player)
+            checker.set_on_bar(True)
+            checkers.append(checker)
+        for _ in range(position.get_off(side)):
+            checker = Checker(player)
+            checker.set_off_board(True)
+            checkers.append(checker)
+        return checkers
 
     def clear_point(self, point: int) -> List[Checker]:
         """Limpia el punto y devuelve las fichas que había."""
         cleared = self.points[point][:]
-        self.points[point] = []
+        self.__position.set_slot(point, WHITE, 0)
         return cleared
 
     def reset(self) -> None:
         """
         Reinicia el tablero a la posición inicial vacía.
         """
-        self.points = [[] for _ in range(24)]
-        self.bar = {"white": [], "black": []}
-        self.bear_off = {"white": [], "black": []}
+        self.__position.clear()
 
     def copy(self) -> "Board":
-        """Devuelve una copia profunda del tablero."""
-        return copy.deepcopy(self)
+        """
+        Devuelve una copia independiente del tablero.
+
+        Copia solo el arreglo de conteos; los jugadores se comparten entre
+        ambos tableros en lugar de clonarse.
+        """
+        return Board(self.__position.copy(), self.__players)
 
     def __str__(self) -> str:
         """
         Devuelve una representación simple del tablero mostrando la cantidad de fichas en cada punto
         """
-        return str([len(point) for point in self.points])
+        return str([abs(count) for count in self.__position.get_cells()[:NUM_POINTS]])
 
     def __eq__(self, other: object) -> bool:
         """Compara dos tableros."""
         if not isinstance(other, Board):
             return False
-        # Comparación usando getters para respetar el encapsulamiento
-        # y evitar acceso directo a atributos privados
-        return (
-            self.get_points() == other.get_points() and
-            self.get_bar() == other.get_bar() and
-            self.get_off_board() == other.get_off_board()
-        )
+        return self.__position == other.get_position()
 
     def __hash__(self) -> int:
         """Devuelve el hash del tablero."""
-        return hash((tuple(tuple(point) for point in self.points),
-                     tuple(sorted((k, tuple(v)) for k, v in self.bar.items())),
-                     tuple(sorted((k, tuple(v)) for k, v in self.bear_off.items()))))
+        return self.__position.position_hash()
+
+    def position_hash(self) -> int:
+        """Devuelve el hash Zobrist de 64 bits de puntos, barra y fichas fuera."""
+        return self.__position.position_hash()
+
+    def get_position_id(self, side_on_roll: int = WHITE) -> str:
+        """
+        Devuelve el Position ID de GNU Backgammon del tablero (ver ``core.positionid``).
+
+        A diferencia de ``__str__``, conserva el dueño de cada punto, la barra y
+        las fichas fuera.
+
+        Args:
+            side_on_roll (int): Lado en turno, que define el orden de la clave.
+
+        Returns:
+            str: Position ID de 14 caracteres.
+        """
+        return encode_position_id(self.__position, side_on_roll)
+
+    def set_position_id(self, position_id: str, side_on_roll: int = WHITE) -> None:
+        """
+        Reemplaza el contenido del tablero por la posición de un Position ID.
+
+        Args:
+            position_id (str): Position ID de 14 caracteres.
+            side_on_roll (int): Lado en turno con el que se codificó.
+
+        Raises:
+            ValueError: Si el identificador no es válido.
+        """
+        decoded = decode_position_id(position_id, side_on_roll)
+        position = self.__position
+        position.clear()
+        for slot, value in enumerate(decoded.get_cells()):
+            if value:
+                position.set_slot(slot, WHITE if value > 0 else BLACK, abs(value))
 
     def calculate_pip_count(self, player: Player) -> int:
-        """Calcula el pip count del jugador."""
-        pip = 0
-        for i in range(24):
-            for checker in self.points[i]:
-                if checker.get_owner() == player:
-                    pip += (24 - i) if player.get_color() == "white" else (i + 1)
-        return pip
+        """Devuelve en O(1) el pip count del jugador, mantenido por la posición."""
+        return self.__position.pip_count(self._side_of(player))
 
     def get_moves_to_bear_off(self, player: Player) -> List[Any]:  # pylint: disable=unused-argument
         """
@@ -263,22 +491,7 @@ class Board:
 
     def is_race_position(self) -> bool:
         """Indica si la posición es de carrera."""
-        players = set()
-        for point in self.points:
-            for checker in point:
-                players.add(checker.get_owner())
-        if len(players) != 2:
-            return True
-        white_outside_home = any(
-            checker.get_owner().get_color() == "white" and not (18 <= i <= 23)
-            for i, point in enumerate(self.points)
-            for checker in point
-        )
-        black_outside_home = any(
-            checker.get_owner().get_color() == "black" and not (0 <= i <= 5)
-            for i, point in enumerate(self.points)
-            for checker in point
-        )
-        if white_outside_home and black_outside_home:
-            return False
-        return True
+        cells = self.__position.get_cells()
+        white_outside_home = any(cells[i] > 0 for i in range(0, 18))
+        black_outside_home = any(cells[i] < 0 for i in range(6, NUM_POINTS))
+        return not (white_outside_home and black_outside_home)
@@ -0,0 +1,105 @@
+"""Módulo bots para Backgammon.
+
+Jugadores automáticos para partidas sin interfaz. Un bot recibe el
+``BackgammonGame`` con los dados ya lanzados y devuelve la jugada completa en
+la notación de puntos de ``get_legal_plays`` (o None si no puede mover).
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+from core.engine import ExpectimaxEngine, PointPlay
+
+
+class Bot(ABC):
+    """Clase base abstracta de los bots."""
+
+    def get_name(self) -> str:
+        """Devuelve el nombre del bot."""
+        return type(self).__name__
+
+    @abstractmethod
+    def choose_play(self, game) -> Optional[PointPlay]:
+        """
+        Elige la jugada para los dados actuales.
+
+        Args:
+            game (BackgammonGame): Juego con los dados ya lanzados.
+
+        Returns:
+            Optional[PointPlay]: Jugada elegida, o None si no hay jugada legal.
+        """
+
+
+class RandomBot(Bot):
+    """Bot que elige una jugada legal al azar."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Inicializa el bot.
+
+        Args:
+            seed (Optional[int]): Semilla del generador propio del bot.
+        """
+        self.__rng: random.Random = random.Random(seed)
+
+    def choose_play(self, game) -> Optional[PointPlay]:
+        """Elige una jugada legal al azar."""
+        plays = game.get_legal_plays()
+        return self.__rng.choice(plays) if plays else None
+
+
+class ExpectimaxBot(Bot):
+    """Bot que juega la mejor jugada según ``ExpectimaxEngine``."""
+
+    def __init__(
+        self,
+        depth: int = 0,
+        time_budget: Optional[float] = None,
+        engine: Optional[ExpectimaxEngine] = None,
+    ) -> None:
+        """
+        Inicializa el bot.
+
+        Args:
+            depth (int): Profundidad de la búsqueda (0 es la heurística pura).
+            time_budget (Optional[float]): Segundos por jugada.
+            engine (Optional[ExpectimaxEngine]): Motor a usar; por defecto uno propio.
+        """
+        self.__depth: int = depth
+        self.__time_budget: Optional[float] = time_budget
+        self.__engine: ExpectimaxEngine = engine or ExpectimaxEngine()
+
+    def get_name(self) -> str:
+        """Devuelve el nombre del bot con su profundidad."""
+        return f"ExpectimaxBot({self.__depth}-ply)"
+
+    def choose_play(self, game) -> Optional[PointPlay]:
+        """Devuelve la mejor jugada encontrada por el motor."""
+        return self.__engine.best_play(game, self.__depth, self.__time_budget)
+
+
+BOT_FACTORIES: Dict[str, Callable[[Optional[int]], Bot]] = {
+    "random": RandomBot,
+    "heuristic": lambda seed: ExpectimaxBot(0),
+    "expectimax": lambda seed: ExpectimaxBot(1),
+}
+
+
+def make_bot(name: str, seed: Optional[int] = None) -> Bot:
+    """
+    Crea un bot por nombre.
+
+    Args:
+        name (str): Una de las claves de ``BOT_FACTORIES``.
+        seed (Optional[int]): Semilla para los bots aleatorios.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún bot.
+    """
+    try:
+        factory = BOT_FACTORIES[name]
+    except KeyError as error:
+        raise ValueError(f"Bot desconocido: {name}") from error
+    return factory(seed)
@@ -3,22 +3,119 @@
 Define la clase Dice que representa los dados utilizados en el juego de Backgammon.
 """
 
+import copy
+import hashlib
 import random
-from typing import List, Tuple
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+DEFAULT_BUFFER_SIZE: int = 1024
+
+
+def derive_seed(seed: int, *keys: object) -> int:
+    """
+    Deriva una semilla de 64 bits a partir de una semilla base y claves.
+
+    La derivación usa SHA-256, así que no depende del proceso ni de
+    ``PYTHONHASHSEED`` y claves distintas dan flujos independientes.
+
+    Args:
+        seed (int): Semilla base.
+        *keys (object): Claves que identifican el flujo (worker, ensayo, etc.).
+
+    Returns:
+        int: Semilla derivada.
+    """
+    text = ":".join(str(part) for part in (seed,) + keys)
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
+
+class DiceState(NamedTuple):
+    """
+    Estado reproducible de unos dados con generador propio.
+
+    Atributos:
+        rng_state: Estado de ``random.Random.getstate`` (None si se usa el generador global).
+        buffer: Tiradas precalculadas en el buffer.
+        index: Posición de la próxima tirada dentro del buffer.
+    """
+    rng_state: Optional[Tuple[Any, ...]]
+    buffer: Tuple[Tuple[int, int], ...]
+    index: int
 
 
 class Dice:
-    """Representa los dados del juego de Backgammon."""
+    """
+    Representa los dados del juego de Backgammon.
 
-    def __init__(self, sides: int = 6) -> None:
+    Sin semilla ni generador, los dados usan el generador global del módulo
+    ``random``. Con ``seed`` o ``rng`` cada instancia tiene su propio
+    generador y sirve las tiradas desde un buffer que se rellena en bloque,
+    de modo que la misma semilla reproduce exactamente la misma secuencia.
+    """
+
+    def __init__(
+        self,
+        sides: int = 6,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
         """
         Inicializa los dados.
 
         Args:
             sides (int): Número de caras de los dados.
+            seed (Optional[int]): Semilla para un generador propio de la instancia.
+            rng (Optional[random.Random]): Generador a usar (tiene prioridad sobre ``seed``).
+            buffer_size (int): Cantidad de bytes aleatorios pedidos en cada recarga.
+
+        Raises:
+            ValueError: Si ``buffer_size`` no es positivo.
         """
+        if buffer_size <= 0:
+            raise ValueError("El tamaño del buffer debe ser positivo")
+        if rng is None and seed is not None:
+            rng = random.Random(seed)
         self.__sides: int = sides
         self.__last_roll: Tuple[int, int] = (1, 1)
+        self.__rng: Optional[random.Random] = rng
+        self.__buffer_size: int = buffer_size
+        self.__buffer: List[Tuple[int, int]] = []
+        self.__index: int = 0
+
+    @classmethod
+    def for_worker(cls, seed: int, worker_id: int, sides: int = 6) -> "Dice":
+        """
+        Crea dados con un flujo independiente para un proceso de trabajo.
+
+        La semilla de cada flujo se deriva de ``seed`` y ``worker_id`` con
+        SHA-256, así dos workers nunca comparten secuencia y el resultado no
+        depende del proceso que lo ejecute.
+
+        Args:
+            seed (int): Semilla base de la simulación.
+            worker_id (int): Identificador del worker.
+            sides (int): Número de caras de los dados.
+
+        Returns:
+            Dice: Dados con generador propio.
+        """
+        return cls(sides, seed=derive_seed(seed, worker_id))
+
+    def reseed(self, seed: int) -> None:
+        """
+        Reinicia los dados con un generador propio y la semilla indicada.
+
+        Args:
+            seed (int): Nueva semilla; descarta las tiradas que quedaban en el buffer.
+        """
+        self.__rng = random.Random(seed)
+        self.__buffer = []
+        self.__index = 0
+
+    def get_rng(self) -> Optional[random.Random]:
+        """Devuelve el generador propio de la instancia, o None si usa el global."""
+        return self.__rng
 
     def roll(self) -> Tuple[int, int]:
         """
@@ -27,11 +124,78 @@ class Dice:
         Returns:
             Tuple[int, int]: Resultado del lanzamiento de los dos dados.
         """
-        die1: int = random.randint(1, self.__sides)
-        die2: int = random.randint(1, self.__sides)
-        self.__last_roll = (die1, die2)
+        if self.__rng is None:
+            die1: int = random.randint(1, self.__sides)
+            die2: int = random.randint(1, self.__sides)
+            self.__last_roll = (die1, die2)
+            return self.__last_roll
+        if self.__index >= len(self.__buffer):
+            self.__refill()
+        self.__last_roll = self.__buffer[self.__index]
+        self.__index += 1
         return self.__last_roll
 
+    def __refill(self) -> None:
+        """
+        Rellena el buffer de tiradas con una sola petición al generador.
+
+        Cada byte aleatorio se convierte en uno de los ``sides ** 2`` resultados;
+        los bytes del tramo final que no se reparte parejo se descartan para no
+        sesgar la distribución.
+        """
+        sides = self.__sides
+        outcomes = sides * sides
+        self.__index = 0
+        if outcomes > 256:
+            randint = self.__rng.randint
+            self.__buffer = [
+                (randint(1, sides), randint(1, sides)) for _ in range(self.__buffer_size)
+            ]
+            return
+        limit = 256 - 256 % outcomes
+        table = [(i // sides + 1, i % sides + 1) for i in range(outcomes)]
+        buffer: List[Tuple[int, int]] = []
+        while not buffer:
+            data = self.__rng.randbytes(self.__buffer_size)
+            buffer = [table[byte % outcomes] for byte in data if byte < limit]
+        self.__buffer = buffer
+
+    def copy(self) -> "Dice":
+        """
+        Devuelve dados independientes en el mismo punto de la secuencia.
+
+        Returns:
+            Dice: Copia (de la misma clase) con su propio estado de generador.
+        """
+        clone = copy.copy(self)
+        clone.set_state(self.get_state())
+        return clone
+
+    def get_state(self) -> DiceState:
+        """
+        Devuelve el estado del generador y del buffer de tiradas.
+
+        Returns:
+            DiceState: Estado que ``set_state`` restaura.
+        """
+        rng_state = self.__rng.getstate() if self.__rng is not None else None
+        return DiceState(rng_state, tuple(self.__buffer), self.__index)
+
+    def set_state(self, state: DiceState) -> None:
+        """
+        Restaura un estado obtenido con ``get_state`` en un generador propio nuevo.
+
+        Args:
+            state (DiceState): Estado a restaurar.
+        """
+        if state.rng_state is None:
+            self.__rng = None
+        else:
+            self.__rng = random.Random()
+            self.__rng.setstate(state.rng_state)
+        self.__buffer = list(state.buffer)
+        self.__index = state.index
+
     def get_last_roll(self) -> Tuple[int, int]:
         """
         Devuelve el último lanzamiento de los dados.
@@ -67,6 +231,8 @@ class Dice:
             sides (int): Número de caras.
         """
         self.__sides = sides
+        self.__buffer = []
+        self.__index = 0
 
     def is_double(self, roll: Tuple[int, int]) -> bool:
         """
@@ -0,0 +1,419 @@
+"""Módulo engine para Backgammon.
+
+Motor de búsqueda expectimax sobre ``BackgammonGame``. La búsqueda alterna
+nodos de decisión (elegir la mejor jugada de una tirada) y nodos de azar (las
+21 tiradas distintas ponderadas por su probabilidad):
+
+- 0-ply: cada jugada candidata se evalúa estáticamente.
+- 1-ply: se promedia la mejor respuesta del rival (0-ply) sobre sus 21 tiradas.
+- 2-ply: además se promedia nuestra mejor respuesta a cada respuesta del rival.
+
+Los nodos de azar se guardan en una tabla de transposición acotada indexada
+por el hash canónico de la posición vista desde el lado que tira
+(``Position.side_hash``), de modo que las posiciones espejo comparten entrada.
+
+Con un ``OpeningBook`` las posiciones de apertura que están en el libro se
+responden sin buscar. Con una ``EvaluationCache`` las evaluaciones estáticas se guardan entre
+búsquedas (el motor compartido de ``best_play`` usa una). Si el evaluador tiene
+``evaluate_batch`` (por ejemplo ``core.neuralnet``), las
+posiciones hijas de cada tirada se evalúan en una sola llamada.
+"""
+
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from core.evalcache import CachedEvaluator, EvaluationCache
+from core.evaluation import BatchEvaluator, Evaluator, heuristic_evaluation, terminal_value
+from core.movegen import Play, generate_successors, to_point_step
+from core.openingbook import OpeningBook, load_book
+from core.position import Position, SIDE_BY_COLOR
+
+PointPlay = Tuple[Tuple[int, int, int], ...]
+
+# Las 21 tiradas distintas con su probabilidad; los dobles se juegan cuatro veces.
+DICE_OUTCOMES: Tuple[Tuple[Tuple[int, ...], float], ...] = tuple(
+    ((die1,) * 4, 1 / 36) if die1 == die2 else ((die1, die2), 2 / 36)
+    for die1 in range(1, 7)
+    for die2 in range(die1, 7)
+)
+
+DEFAULT_TABLE_SIZE: int = 1 << 16
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición de tamaño fijo con reemplazo por profundidad.
+
+    Cada clave se ubica en una única casilla (``clave & máscara``). Una entrada
+    nueva reemplaza a la existente si es la misma clave, si es de una búsqueda
+    anterior o si fue calculada con al menos la misma profundidad.
+    """
+
+    def __init__(self, size: int = DEFAULT_TABLE_SIZE) -> None:
+        """
+        Inicializa la tabla.
+
+        Args:
+            size (int): Cantidad de casillas (se redondea a la potencia de 2 superior).
+
+        Raises:
+            ValueError: Si ``size`` no es positivo.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño de la tabla debe ser positivo")
+        capacity = 1 << (size - 1).bit_length()
+        self.__mask: int = capacity - 1
+        self.__slots: List[Optional[Tuple[int, int, float, int]]] = [None] * capacity
+        self.__generation: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__replacements: int = 0
+
+    def get_capacity(self) -> int:
+        """Devuelve la cantidad de casillas de la tabla."""
+        return len(self.__slots)
+
+    def get_hits(self) -> int:
+        """Devuelve la cantidad de consultas resueltas por la tabla."""
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """Devuelve la cantidad de consultas no resueltas."""
+        return self.__misses
+
+    def get_replacements(self) -> int:
+        """Devuelve cuántas entradas fueron desplazadas por otra clave."""
+        return self.__replacements
+
+    def new_search(self) -> None:
+        """Marca el comienzo de una búsqueda; las entradas previas pasan a ser reemplazables."""
+        self.__generation += 1
+
+    def probe(self, key: int, depth: int) -> Optional[float]:
+        """
+        Busca el valor de una clave calculado con al menos ``depth`` de profundidad.
+
+        Returns:
+            Optional[float]: El valor guardado o None.
+        """
+        entry = self.__slots[key & self.__mask]
+        if entry is not None and entry[0] == key and entry[1] >= depth:
+            self.__hits += 1
+            return entry[2]
+        self.__misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float) -> None:
+        """Guarda un valor aplicando la política de reemplazo."""
+        index = key & self.__mask
+        entry = self.__slots[index]
+        if entry is not None and entry[0] != key:
+            if entry[3] == self.__generation and entry[1] > depth:
+                return
+            self.__replacements += 1
+        self.__slots[index] = (key, depth, value, self.__generation)
+
+    def clear(self) -> None:
+        """Vacía la tabla y reinicia los contadores."""
+        self.__slots = [None] * len(self.__slots)
+        self.__hits = 0
+        self.__misses = 0
+        self.__replacements = 0
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de casillas ocupadas."""
+        return sum(1 for entry in self.__slots if entry is not None)
+
+
+class SearchResult(NamedTuple):
+    """
+    Resultado de una búsqueda.
+
+    Atributos:
+        play: Mejor jugada en notación de puntos de ``BackgammonGame`` (None si no hay).
+        value: Equity estimada de la jugada para el jugador en turno.
+        depth: Última profundidad completada.
+        nodes: Nodos de decisión expandidos.
+        elapsed: Segundos empleados.
+    """
+    play: Optional[PointPlay]
+    value: float
+    depth: int
+    nodes: int
+    elapsed: float
+
+
+class EngineSettings(NamedTuple):
+    """
+    Parámetros de ajuste de ``ExpectimaxEngine``.
+
+    Atributos:
+        table_size: Casillas de la tabla de transposición.
+        root_width: Jugadas candidatas que se analizan a 1-ply.
+        deep_width: Jugadas candidatas que se analizan a 2-ply o más.
+        reply_width: Respuestas (ordenadas a 0-ply) exploradas en nodos internos.
+    """
+    table_size: int = DEFAULT_TABLE_SIZE
+    root_width: int = 8
+    deep_width: int = 3
+    reply_width: int = 2
+
+
+class _SearchTimeout(Exception):
+    """Se lanza internamente cuando se agota el tiempo de búsqueda."""
+
+
+class ExpectimaxEngine:
+    """Motor expectimax de 0, 1 y 2 plies con tabla de transposición."""
+
+    def __init__(
+        self,
+        evaluator: Evaluator = heuristic_evaluation,
+        settings: EngineSettings = EngineSettings(),
+        cache: Optional[EvaluationCache] = None,
+        book: Optional[OpeningBook] = None,
+    ) -> None:
+        """
+        Inicializa el motor.
+
+        Args:
+            evaluator (Evaluator): Evaluación estática ``(position, side) -> equity``.
+            settings (EngineSettings): Tamaño de la tabla y anchos de la búsqueda.
+            cache (Optional[EvaluationCache]): Caché de evaluaciones estáticas
+                (puede compartirse con otros motores del mismo evaluador).
+            book (Optional[OpeningBook]): Libro de aperturas consultado antes de buscar.
+        """
+        if cache is not None:
+            evaluator = CachedEvaluator(evaluator, cache)
+        self.__cache: Optional[EvaluationCache] = cache
+        self.__book: Optional[OpeningBook] = book
+        self.__evaluator: Evaluator = evaluator
+        self.__batch_evaluator: Optional[BatchEvaluator] = getattr(
+            evaluator, "evaluate_batch", None
+        )
+        self.__table: TranspositionTable = TranspositionTable(settings.table_size)
+        self.__settings: EngineSettings = settings
+        self.__deadline: Optional[float] = None
+        self.__nodes: int = 0
+
+    def get_table(self) -> TranspositionTable:
+        """Devuelve la tabla de transposición del motor."""
+        return self.__table
+
+    def get_cache(self) -> Optional[EvaluationCache]:
+        """Devuelve la caché de evaluaciones, o None si el motor no usa caché."""
+        return self.__cache
+
+    def get_book(self) -> Optional[OpeningBook]:
+        """Devuelve el libro de aperturas, o None si el motor no usa libro."""
+        return self.__book
+
+    def get_evaluator(self) -> Evaluator:
+        """Devuelve la función de evaluación estática."""
+        return self.__evaluator
+
+    def best_play(
+        self, game, depth: int = 1, time_budget: Optional[float] = None
+    ) -> Optional[PointPlay]:
+        """
+        Devuelve la mejor jugada para los dados restantes del jugador en turno.
+
+        Args:
+            game (BackgammonGame): Juego con los dados ya lanzados.
+            depth (int): Profundidad de la búsqueda (0, 1 o 2).
+            time_budget (Optional[float]): Segundos disponibles; si se agotan se
+                devuelve la mejor jugada de la última profundidad completada.
+
+        Returns:
+            Optional[PointPlay]: Pasos ``(origen, destino, dado)`` a jugar con
+            ``make_move`` / ``make_move_from_bar``, o None si no hay jugada legal.
+        """
+        return self.search(game, depth, time_budget).play
+
+    def search(self, game, depth: int = 1, time_budget: Optional[float] = None) -> SearchResult:
+        """
+        Busca la mejor jugada y devuelve también su valor y estadísticas.
+
+        Raises:
+            ValueError: Si el juego no comenzó, terminó, no se lanzaron los dados
+                o la profundidad es negativa.
+        """
+        if depth < 0:
+            raise ValueError("La profundidad no puede ser negativa")
+        if not game.is_started():
+            raise ValueError("El juego no ha comenzado")
+        if game.is_finished():
+            raise ValueError("El juego ha finalizado")
+        if not game.has_dice_been_rolled():
+            raise ValueError("Debes lanzar los dados primero")
+        side = SIDE_BY_COLOR[game.get_current_player().get_color()]
+        position = game.get_board().get_position()
+        return self.search_position(position, side, game.get_last_dice_roll(), depth, time_budget)
+
+    def search_position(
+        self,
+        position: Position,
+        side: int,
+        dice: Tuple[int, ...],
+        depth: int = 1,
+        time_budget: Optional[float] = None,
+    ) -> SearchResult:
+        """
+        Busca la mejor jugada de ``side`` en ``position`` con los dados indicados.
+
+        Si la posición y los dados están en el libro de aperturas se devuelve su
+        jugada sin buscar (con profundidad y nodos 0).
+
+        Args:
+            position (Position): Posición (no se modifica).
+            side (int): Lado que mueve.
+            dice (Tuple[int, ...]): Dados disponibles (cuatro valores en dobles).
+            depth (int): Profundidad de la búsqueda.
+            time_budget (Optional[float]): Segundos disponibles.
+
+        Returns:
+            SearchResult: Mejor jugada y estadísticas.
+        """
+        start = time.perf_counter()
+        if self.__book is not None:
+            entry = self.__book.lookup(position, side, dice)
+            if entry is not None:
+                return SearchResult(
+                    self.__to_points(side, entry.play), entry.equity, 0, 0,
+                    time.perf_counter() - start,
+                )
+        self.__deadline = None if time_budget is None else start + time_budget
+        self.__nodes = 1
+        self.__table.new_search()
+        successors = generate_successors(position, side, dice)
+        if not successors:
+            return SearchResult(
+                None, self.__evaluator(position, side), 0, 1, time.perf_counter() - start
+            )
+        ranked, completed = self.__deepen(self.__rank_static(successors, side), side, depth)
+        value, play, _ = ranked[0]
+        return SearchResult(
+            self.__to_points(side, play), value, completed, self.__nodes,
+            time.perf_counter() - start,
+        )
+
+    def __deepen(
+        self, ranked: List[Tuple[float, Play, Position]], side: int, depth: int
+    ) -> Tuple[List[Tuple[float, Play, Position]], int]:
+        """
+        Profundiza de a un ply sobre las mejores candidatas hasta ``depth`` o el límite de tiempo.
+
+        Returns:
+            Tuple[List[Tuple[float, Play, Position]], int]: Candidatas ordenadas por
+            la última profundidad completada y esa profundidad.
+        """
+        settings = self.__settings
+        completed = 0
+        if len(ranked) > 1:
+            for current in range(1, depth + 1):
+                width = settings.root_width if current == 1 else settings.deep_width
+                try:
+                    scored = [
+                        (self.__value_after_play(child, side, current), play, child)
+                        for _, play, child in ranked[:width]
+                    ]
+                except _SearchTimeout:
+                    break
+                scored.sort(key=lambda entry: entry[0], reverse=True)
+                ranked = scored
+                completed = current
+        return ranked, completed
+
+    def __rank_static(
+        self, successors: List[Tuple[Play, Position]], side: int
+    ) -> List[Tuple[float, Play, Position]]:
+        """Ordena jugadas por evaluación estática, de mejor a peor."""
+        values = self.__evaluate_all([child for _, child in successors], side)
+        ranked = [(value, play, child) for value, (play, child) in zip(values, successors)]
+        ranked.sort(key=lambda entry: entry[0], reverse=True)
+        return ranked
+
+    def __evaluate_all(self, positions: Sequence[Position], side: int) -> List[float]:
+        """Evalúa estáticamente varias posiciones, en lote si el evaluador lo permite."""
+        if self.__batch_evaluator is not None:
+            return self.__batch_evaluator(positions, side)
+        evaluator = self.__evaluator
+        return [evaluator(position, side) for position in positions]
+
+    def __value_after_play(self, position: Position, mover: int, depth: int) -> float:
+        """Valor para ``mover`` de la posición que dejó su jugada, con ``depth`` plies más."""
+        result = terminal_value(position, mover)
+        if result:
+            return float(result)
+        if depth == 0:
+            return self.__evaluator(position, mover)
+        return -self.__chance(position, 1 - mover, depth)
+
+    def __chance(self, position: Position, side: int, depth: int) -> float:
+        """Valor esperado para ``side`` antes de tirar los dados (nodo de azar)."""
+        if self.__deadline is not None and time.perf_counter() > self.__deadline:
+            raise _SearchTimeout()
+        key = position.side_hash(side)
+        cached = self.__table.probe(key, depth)
+        if cached is not None:
+            return cached
+        total = 0.0
+        for dice, weight in DICE_OUTCOMES:
+            total += weight * self.__best_reply(position, side, dice, depth - 1)
+        self.__table.store(key, depth, total)
+        return total
+
+    def __best_reply(
+        self, position: Position, side: int, dice: Tuple[int, ...], depth: int
+    ) -> float:
+        """Valor para ``side`` de su mejor jugada con la tirada dada (nodo de decisión)."""
+        self.__nodes += 1
+        successors = generate_successors(position, side, dice)
+        if not successors:
+            # Sin jugada legal el turno pasa sin mover.
+            return self.__value_after_play(position, side, depth)
+        if depth == 0:
+            if self.__batch_evaluator is not None:
+                return max(self.__batch_evaluator([child for _, child in successors], side))
+            return max(self.__value_after_play(child, side, 0) for _, child in successors)
+        ranked = self.__rank_static(successors, side)[:self.__settings.reply_width]
+        return max(self.__value_after_play(child, side, depth) for _, _, child in ranked)
+
+    @staticmethod
+    def __to_points(side: int, play: Play) -> PointPlay:
+        """Convierte una jugada en casillas a la notación de puntos del juego."""
+        return tuple(to_point_step(side, step) for step in play)
+
+
+_DEFAULT_ENGINE: Optional[ExpectimaxEngine] = None
+
+
+def best_play(game, depth: int = 1, time_budget: Optional[float] = None) -> Optional[PointPlay]:
+    """
+    Devuelve la mejor jugada usando un motor compartido.
+
+    La tabla de transposición y la caché de evaluaciones del motor se reutilizan
+    entre llamadas (ver ``get_default_engine``).
+
+    Args:
+        game (BackgammonGame): Juego con los dados ya lanzados.
+        depth (int): Profundidad de la búsqueda (0, 1 o 2).
+        time_budget (Optional[float]): Segundos disponibles.
+
+    Returns:
+        Optional[PointPlay]: Mejor jugada o None si no hay jugada legal.
+    """
+    return get_default_engine().best_play(game, depth, time_budget)
+
+
+def get_default_engine() -> ExpectimaxEngine:
+    """
+    Devuelve el motor compartido, creándolo la primera vez.
+
+    Usa una caché de evaluaciones y, si existe ``data/opening.bin`` (ver
+    ``core.openingbook``), el libro de aperturas.
+    """
+    global _DEFAULT_ENGINE  # pylint: disable=global-statement
+    if _DEFAULT_ENGINE is None:
+        _DEFAULT_ENGINE = ExpectimaxEngine(cache=EvaluationCache(), book=load_book())
+    return _DEFAULT_ENGINE
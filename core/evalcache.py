@@ -0,0 +1,177 @@
+"""Módulo evalcache para Backgammon.
+
+Caché de evaluaciones estáticas compartible entre la búsqueda expectimax, los
+rollouts y el comando ``hint`` del CLI. Las entradas se indexan por
+``Position.side_hash(side)``, el hash de la posición vista desde el lado
+evaluado, así que una posición y su espejo comparten entrada. La cantidad de
+entradas está acotada y, al llenarse, se descarta la usada hace más tiempo
+(LRU). Los contadores de aciertos, fallos y desalojos se pueden leer en
+cualquier momento, por ejemplo con ``ExpectimaxEngine.get_cache()``.
+
+Una caché vale para un único evaluador: ``CachedEvaluator`` la asocia con él.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from core.evaluation import Evaluator
+from core.position import Position
+
+DEFAULT_CAPACITY: int = 1 << 18
+
+# Bytes aproximados de una entrada (nodo del diccionario ordenado, clave y valor).
+ENTRY_BYTES: int = 160
+
+
+class EvaluationCache:
+    """Caché LRU acotada de valores por clave de posición."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            capacity (int): Máximo de entradas.
+
+        Raises:
+            ValueError: Si ``capacity`` no es positiva.
+        """
+        if capacity <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva")
+        self.__capacity: int = capacity
+        self.__entries: "OrderedDict[int, float]" = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    @classmethod
+    def with_memory_limit(cls, max_bytes: int) -> "EvaluationCache":
+        """
+        Crea una caché cuyo tamaño aproximado no supera ``max_bytes``.
+
+        Raises:
+            ValueError: Si el límite no alcanza para una entrada.
+        """
+        return cls(max_bytes // ENTRY_BYTES)
+
+    def get_capacity(self) -> int:
+        """Devuelve el máximo de entradas."""
+        return self.__capacity
+
+    def get_hits(self) -> int:
+        """Devuelve la cantidad de consultas resueltas por la caché."""
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """Devuelve la cantidad de consultas no resueltas."""
+        return self.__misses
+
+    def get_evictions(self) -> int:
+        """Devuelve cuántas entradas fueron descartadas por falta de lugar."""
+        return self.__evictions
+
+    def hit_rate(self) -> float:
+        """Devuelve la proporción de consultas resueltas (0 si no hubo consultas)."""
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Devuelve los contadores en un diccionario (para informes y métricas)."""
+        return {
+            "entries": len(self.__entries),
+            "capacity": self.__capacity,
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "hit_rate": self.hit_rate(),
+        }
+
+    def get(self, key: int) -> Optional[float]:
+        """
+        Busca un valor y lo marca como usado recientemente.
+
+        Returns:
+            Optional[float]: El valor guardado o None.
+        """
+        value = self.__entries.get(key)
+        if value is None:
+            self.__misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return value
+
+    def put(self, key: int, value: float) -> None:
+        """Guarda un valor, descartando la entrada menos usada si la caché está llena."""
+        entries = self.__entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.__capacity:
+            entries.popitem(last=False)
+            self.__evictions += 1
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia los contadores."""
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de entradas guardadas."""
+        return len(self.__entries)
+
+
+class CachedEvaluator:
+    """Evaluador que consulta una ``EvaluationCache`` antes de llamar al evaluador real."""
+
+    def __init__(self, evaluator: Evaluator, cache: Optional[EvaluationCache] = None) -> None:
+        """
+        Inicializa el evaluador.
+
+        Args:
+            evaluator (Evaluator): Evaluador real (puede ofrecer ``evaluate_batch``).
+            cache (Optional[EvaluationCache]): Caché a usar; por defecto una nueva.
+        """
+        self.__evaluator: Evaluator = evaluator
+        self.__cache: EvaluationCache = cache if cache is not None else EvaluationCache()
+
+    def get_evaluator(self) -> Evaluator:
+        """Devuelve el evaluador real."""
+        return self.__evaluator
+
+    def get_cache(self) -> EvaluationCache:
+        """Devuelve la caché."""
+        return self.__cache
+
+    def __call__(self, position: Position, side: int) -> float:
+        """Evalúa una posición, usando la caché si ya fue evaluada."""
+        key = position.side_hash(side)
+        value = self.__cache.get(key)
+        if value is None:
+            value = self.__evaluator(position, side)
+            self.__cache.put(key, value)
+        return value
+
+    def evaluate_batch(self, positions: Sequence[Position], side: int) -> List[float]:
+        """
+        Evalúa varias posiciones; las que no están en la caché se evalúan juntas.
+
+        Si el evaluador real tiene ``evaluate_batch``, los fallos se le pasan en
+        una sola llamada.
+        """
+        cache = self.__cache
+        keys = [position.side_hash(side) for position in positions]
+        values = [cache.get(key) for key in keys]
+        missing = [index for index, value in enumerate(values) if value is None]
+        if missing:
+            batch = getattr(self.__evaluator, "evaluate_batch", None)
+            if batch is not None:
+                computed = batch([positions[index] for index in missing], side)
+            else:
+                computed = [self.__evaluator(positions[index], side) for index in missing]
+            for index, value in zip(missing, computed):
+                values[index] = value
+                cache.put(keys[index], value)
+        return values
@@ -0,0 +1,116 @@
+"""Módulo evaluation para Backgammon.
+
+Evaluación estática de posiciones para el motor de búsqueda. Un evaluador es
+cualquier función ``(position, side) -> float`` que devuelve la equity desde el
+punto de vista de ``side``: entre -1 y 1 para partidas en curso, y ±1, ±2 o ±3
+(simple, gammon o backgammon) para partidas terminadas. Los evaluadores tratan
+igual a ambos colores: ``evaluator(p, side) == evaluator(p.mirror(), 1 - side)``,
+por eso la caché y la tabla de transposición usan la clave canónica
+``Position.side_hash``.
+
+Un evaluador puede ofrecer además ``evaluate_batch(positions, side)`` (un
+``BatchEvaluator``, con los mismos valores que el evaluador, incluidas las
+partidas terminadas) para evaluar de una vez todas las posiciones hijas de una
+tirada; el motor de búsqueda lo usa cuando existe.
+"""
+
+import math
+from typing import Callable, List, Sequence
+
+from core.position import (
+    Position, WHITE, BLACK, SIGN, NUM_POINTS, CHECKERS_PER_SIDE,
+)
+
+Evaluator = Callable[[Position, int], float]
+BatchEvaluator = Callable[[Sequence[Position], int], List[float]]
+
+HOME_POINTS = (range(18, NUM_POINTS), range(0, 6))
+
+# Pesos de la evaluación heurística (en unidades previas a tanh).
+PIP_WEIGHT = 0.02
+HOME_POINT_WEIGHT = 0.12
+BLOT_WEIGHT = 0.08
+BAR_WEIGHT = 0.15
+OFF_WEIGHT = 0.05
+
+
+def game_result(position: Position, winner: int) -> int:
+    """
+    Devuelve el valor de una partida ganada por ``winner``.
+
+    Args:
+        position (Position): Posición final.
+        winner (int): Lado que sacó todas sus fichas.
+
+    Returns:
+        int: 1 simple, 2 gammon (el rival no sacó fichas) o 3 backgammon (además
+        tiene fichas en la barra o en la zona de casa del ganador).
+    """
+    loser = 1 - winner
+    if position.get_off(loser) > 0:
+        return 1
+    if position.get_bar(loser) > 0:
+        return 3
+    sign = SIGN[loser]
+    cells = position.get_cells()
+    if any(cells[i] * sign > 0 for i in HOME_POINTS[winner]):
+        return 3
+    return 2
+
+
+def terminal_value(position: Position, side: int) -> int:
+    """
+    Devuelve el resultado de la partida desde el punto de vista de ``side``.
+
+    Returns:
+        int: 0 si la partida sigue; positivo si ganó ``side`` y negativo si ganó el rival.
+    """
+    if position.get_off(side) == CHECKERS_PER_SIDE:
+        return game_result(position, side)
+    if position.get_off(1 - side) == CHECKERS_PER_SIDE:
+        return -game_result(position, 1 - side)
+    return 0
+
+
+def is_race(position: Position) -> bool:
+    """Indica si ya no hay contacto posible entre las fichas de ambos lados."""
+    if position.get_bar(WHITE) or position.get_bar(BLACK):
+        return False
+    white_back = position.furthest_point(WHITE)
+    black_back = position.furthest_point(BLACK)
+    if white_back is None or black_back is None:
+        return True
+    return black_back < white_back
+
+
+def heuristic_evaluation(position: Position, side: int) -> float:
+    """
+    Evalúa la posición con una heurística lineal acotada con ``tanh``.
+
+    Considera la diferencia de pips, los puntos hechos en casa, los blots (solo
+    si hay contacto), las fichas en la barra y las fichas ya fuera.
+
+    Args:
+        position (Position): Posición a evaluar.
+        side (int): Lado desde cuyo punto de vista se evalúa.
+
+    Returns:
+        float: Equity estimada.
+    """
+    result = terminal_value(position, side)
+    if result:
+        return float(result)
+    opponent = 1 - side
+    score = PIP_WEIGHT * (position.pip_count(opponent) - position.pip_count(side))
+    score += OFF_WEIGHT * (position.get_off(side) - position.get_off(opponent))
+    if not is_race(position):
+        cells = position.get_cells()
+        sign = SIGN[side]
+        home = sum(1 for i in HOME_POINTS[side] if cells[i] * sign >= 2)
+        opponent_home = sum(1 for i in HOME_POINTS[opponent] if cells[i] * sign <= -2)
+        blots = sum(1 for i in range(NUM_POINTS) if cells[i] * sign == 1)
+        opponent_blots = sum(1 for i in range(NUM_POINTS) if cells[i] * sign == -1)
+        score += HOME_POINT_WEIGHT * (home - opponent_home)
+        score -= BLOT_WEIGHT * (blots - opponent_blots)
+        score -= BAR_WEIGHT * (position.get_bar(side) - position.get_bar(opponent))
+    return math.tanh(score)
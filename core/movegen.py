@@ -0,0 +1,202 @@
+"""Módulo movegen para Backgammon.
+
+Generador de jugadas completas sobre una ``Position``. Un paso (``Step``) es una
+tupla ``(casilla_origen, casilla_destino, dado)`` expresada en casillas del
+arreglo de ``Position``: puntos 0-23, ``BAR_SLOT[lado]`` para entrar desde la
+barra y ``OFF_SLOT[lado]`` para sacar fichas. Una jugada (``Play``) es la
+secuencia de pasos que usa la tirada.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.position import (
+    Position, WHITE, SIGN, NUM_POINTS, BAR_SLOT, OFF_SLOT, decode_record,
+)
+from core.movetables import (
+    DESTINATION, STEP_KIND, ENTRY_POINT, ON_BOARD, BEAR_OFF_EXACT,
+)
+
+Step = Tuple[int, int, int]
+Play = Tuple[Step, ...]
+
+# Notación de puntos de ``BackgammonGame`` para la barra y las fichas fuera, por lado.
+BAR_POINT = (0, 25)
+OFF_POINT = (25, 0)
+
+
+def legal_steps(position: Position, side: int, die: int) -> List[Step]:
+    """
+    Devuelve los pasos legales de un solo dado para el lado indicado.
+
+    Si el lado tiene fichas en la barra, el único paso posible es entrar.
+    Destinos y clases de paso se leen de las tablas de ``core.movetables``.
+
+    Args:
+        position (Position): Posición actual.
+        side (int): Lado que mueve (WHITE o BLACK).
+        die (int): Valor del dado.
+
+    Returns:
+        List[Step]: Pasos legales.
+    """
+    cells = position.get_cells()
+    sign = SIGN[side]
+    bar_slot = BAR_SLOT[side]
+    if cells[bar_slot] * sign > 0:
+        entry = ENTRY_POINT[side][die]
+        if cells[entry] * sign >= -1:
+            return [(bar_slot, entry, die)]
+        return []
+    steps = []
+    can_bear = position.can_bear_off(side)
+    destinations = DESTINATION[side]
+    kinds = STEP_KIND[side]
+    for source in range(NUM_POINTS):
+        if cells[source] * sign <= 0:
+            continue
+        kind = kinds[source][die]
+        if kind == ON_BOARD:
+            dest = destinations[source][die]
+            if cells[dest] * sign >= -1:
+                steps.append((source, dest, die))
+        elif can_bear and (kind == BEAR_OFF_EXACT or source == position.furthest_point(side)):
+            steps.append((source, OFF_SLOT[side], die))
+    return steps
+
+
+def apply_step(position: Position, side: int, step: Step) -> bool:
+    """
+    Aplica un paso sobre la posición, golpeando un blot si corresponde.
+
+    Returns:
+        bool: True si el paso golpeó una ficha rival.
+    """
+    return decode_record(position.apply(side, step))[4]
+
+
+def _progress(side: int, slot: int) -> int:
+    """Orden de avance de una casilla de origen (la barra es la más atrasada)."""
+    if slot == BAR_SLOT[side]:
+        return -1
+    return slot if side == WHITE else NUM_POINTS - 1 - slot
+
+
+class _PlaySearch:
+    """Búsqueda en profundidad de las jugadas de una tirada (aplicar/deshacer sobre una copia)."""
+
+    __slots__ = ("side", "is_double", "keep_positions", "best_length", "plays")
+
+    def __init__(self, side: int, is_double: bool, keep_positions: bool = False) -> None:
+        self.side = side
+        self.is_double = is_double
+        self.keep_positions = keep_positions
+        self.best_length = 0
+        self.plays: Dict[bytes, Tuple[Play, Optional[Position]]] = {}
+
+    def run(self, position: Position, dice: Tuple[int, ...], play: Play, floor: int) -> None:
+        """Explora los pasos posibles con los dados restantes."""
+        moved = False
+        for die in sorted(set(dice), reverse=True):
+            rest = list(dice)
+            rest.remove(die)
+            for step in legal_steps(position, self.side, die):
+                progress = _progress(self.side, step[0])
+                # En dobles se fija el orden de los orígenes para no repetir
+                # permutaciones de la misma jugada.
+                if self.is_double and progress < floor:
+                    continue
+                record = position.apply(self.side, step)
+                moved = True
+                self.run(position, tuple(rest), play + (step,), progress)
+                position.unapply(record)
+        if not moved:
+            self.record(position, play)
+
+    def record(self, position: Position, play: Play) -> None:
+        """Registra una jugada terminal conservando solo las de mayor longitud."""
+        if len(play) < self.best_length:
+            return
+        if len(play) > self.best_length:
+            self.best_length = len(play)
+            self.plays = {}
+        key = position.get_cells().tobytes()
+        if key not in self.plays:
+            self.plays[key] = (play, position.copy() if self.keep_positions else None)
+
+
+def _search_plays(
+    position: Position, side: int, dice: Sequence[int], keep_positions: bool
+) -> List[Tuple[Play, Optional[Position]]]:
+    """Ejecuta la búsqueda de jugadas y aplica la regla del dado mayor."""
+    dice = tuple(dice)
+    if not dice:
+        return []
+    search = _PlaySearch(side, len(set(dice)) == 1, keep_positions)
+    search.run(position.copy(), dice, (), -1)
+    if search.best_length == 0:
+        return []
+    plays = list(search.plays.values())
+    if search.best_length == 1 and len(dice) == 2 and dice[0] != dice[1]:
+        higher = max(dice)
+        with_higher = [entry for entry in plays if entry[0][0][2] == higher]
+        if with_higher:
+            plays = with_higher
+    return plays
+
+
+def generate_plays(position: Position, side: int, dice: Sequence[int]) -> List[Play]:
+    """
+    Genera todas las jugadas legales completas para la tirada.
+
+    Aplica las reglas de usar la mayor cantidad posible de dados y, si solo
+    puede usarse uno de dos dados distintos, el mayor. Las jugadas que llegan a
+    la misma posición final se fusionan en una sola.
+
+    Args:
+        position (Position): Posición actual (no se modifica).
+        side (int): Lado que mueve.
+        dice (Sequence[int]): Dados disponibles (cuatro valores iguales en dobles).
+
+    Returns:
+        List[Play]: Jugadas legales; vacía si no se puede mover.
+    """
+    return [play for play, _ in _search_plays(position, side, dice, False)]
+
+
+def generate_successors(
+    position: Position, side: int, dice: Sequence[int]
+) -> List[Tuple[Play, Position]]:
+    """
+    Genera las jugadas legales junto con la posición a la que llega cada una.
+
+    Evita volver a aplicar cada jugada cuando se necesita evaluar su resultado
+    (por ejemplo, en la búsqueda del motor).
+
+    Args:
+        position (Position): Posición actual (no se modifica).
+        side (int): Lado que mueve.
+        dice (Sequence[int]): Dados disponibles (cuatro valores iguales en dobles).
+
+    Returns:
+        List[Tuple[Play, Position]]: Jugada y posición resultante; vacía si no se puede mover.
+    """
+    return _search_plays(position, side, dice, True)
+
+
+def to_point_step(side: int, step: Step) -> Tuple[int, int, int]:
+    """
+    Convierte un paso en casillas a la notación de puntos 1-24 de ``BackgammonGame``.
+
+    La barra es el punto 0 para blancas y 25 para negras; sacar fichas es el
+    destino 25 para blancas y 0 para negras.
+    """
+    return (_slot_to_point(side, step[0]), _slot_to_point(side, step[1]), step[2])
+
+
+def _slot_to_point(side: int, slot: int) -> int:
+    """Convierte una casilla del arreglo a número de punto 1-based."""
+    if slot < NUM_POINTS:
+        return slot + 1
+    if slot == BAR_SLOT[side]:
+        return BAR_POINT[side]
+    return OFF_POINT[side]
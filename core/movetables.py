@@ -0,0 +1,68 @@
+"""Módulo movetables para Backgammon.
+
+Tablas de movimiento precalculadas una sola vez al importar el módulo. Para
+cada lado, casilla de origen y dado guardan el destino y la clase de paso, de
+modo que el generador de jugadas no calcula direcciones ni límites en su bucle
+interno.
+
+Las tablas se indexan como ``TABLA[lado][casilla][dado]``; la posición 0 de
+dado no se usa y queda marcada como ``NO_MOVE``.
+"""
+
+from typing import Tuple
+
+from core.position import COLORS, NUM_POINTS, NUM_SLOTS, BAR_SLOT, OFF_SLOT, WHITE
+
+DIE_VALUES = (1, 2, 3, 4, 5, 6)
+
+# Clases de paso
+NO_MOVE = -1
+ON_BOARD = 0
+BEAR_OFF_EXACT = 1
+BEAR_OFF_OVER = 2
+
+
+def _entry_point(side: int, die: int) -> int:
+    """Punto de entrada desde la barra con el dado indicado."""
+    return die - 1 if side == WHITE else NUM_POINTS - die
+
+
+def _step_row(side: int, slot: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Calcula destino y clase de paso de una casilla para los dados 0-6."""
+    destinations = [OFF_SLOT[side]]
+    kinds = [NO_MOVE]
+    for die in DIE_VALUES:
+        if slot == BAR_SLOT[side]:
+            destinations.append(_entry_point(side, die))
+            kinds.append(ON_BOARD)
+            continue
+        if slot >= NUM_POINTS:
+            destinations.append(OFF_SLOT[side])
+            kinds.append(NO_MOVE)
+            continue
+        dest = slot + die if side == WHITE else slot - die
+        if 0 <= dest < NUM_POINTS:
+            destinations.append(dest)
+            kinds.append(ON_BOARD)
+        else:
+            destinations.append(OFF_SLOT[side])
+            kinds.append(BEAR_OFF_EXACT if dest in (-1, NUM_POINTS) else BEAR_OFF_OVER)
+    return tuple(destinations), tuple(kinds)
+
+
+def _build_tables():
+    """Construye las tablas de destino, clase de paso y punto de entrada."""
+    destination = []
+    kind = []
+    for side in range(len(COLORS)):
+        rows = [_step_row(side, slot) for slot in range(NUM_SLOTS)]
+        destination.append(tuple(row[0] for row in rows))
+        kind.append(tuple(row[1] for row in rows))
+    entry = tuple(
+        (NO_MOVE,) + tuple(_entry_point(side, die) for die in DIE_VALUES)
+        for side in range(len(COLORS))
+    )
+    return tuple(destination), tuple(kind), entry
+
+
+DESTINATION, STEP_KIND, ENTRY_POINT = _build_tables()
@@ -0,0 +1,268 @@
+"""Módulo neuralnet para Backgammon.
+
+Evaluador neuronal al estilo de TD-Gammon: una red de una capa oculta con
+activación sigmoide, implementada con NumPy, que evalúa lotes de posiciones con
+una multiplicación de matrices por capa.
+
+Codificación (``NUM_INPUTS`` = 196 entradas), siempre desde el punto de vista
+del lado evaluado y con el mismo formato de tablero que ``core.batchengine``
+(fichas propias positivas que avanzan del punto 0 al 23):
+
+- Por cada lado, 4 entradas por punto en el orden en que el lado recorre el
+  tablero: ``n >= 1``, ``n >= 2``, ``n >= 3`` y ``(n - 3) / 2``.
+- Por cada lado, fichas en la barra ``/ 2`` y fichas fuera ``/ 15``.
+
+Las dos entradas de turno de TD-Gammon no se incluyen: como el resto de los
+evaluadores, la red se aplica a la posición que dejó la jugada del lado
+evaluado, así que el turno siempre es del rival y esas entradas serían
+constantes.
+
+Las 5 salidas son las probabilidades de ``OUTPUTS`` (en el orden de las
+primeras métricas de ``core.rollout.METRICS``). Los pesos se guardan en un
+archivo binario de ``float32`` que se abre con ``numpy.memmap``.
+"""
+
+import struct
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from core.evaluation import terminal_value
+from core.position import Position, BLACK, NUM_POINTS, CHECKERS_PER_SIDE, MIRROR_SLOTS
+
+OUTPUTS = ("win", "win_gammon", "win_backgammon", "lose_gammon", "lose_backgammon")
+NUM_OUTPUTS: int = len(OUTPUTS)
+POINT_UNITS: int = 4
+SIDE_INPUTS: int = NUM_POINTS * POINT_UNITS + 2
+NUM_INPUTS: int = 2 * SIDE_INPUTS
+DEFAULT_HIDDEN: int = 80
+
+MAGIC: bytes = b"NNW1"
+HEADER = struct.Struct("<4sIII")
+
+# Índices para ver un tablero desde el otro lado (el espejo de ``Position.mirror``).
+_FLIP = np.array(MIRROR_SLOTS, dtype=np.intp)
+_OWN_BAR, _OPPONENT_BAR, _OWN_OFF, _OPPONENT_OFF = 24, 25, 26, 27
+
+# Pesos de la equity sin cubo para cada salida: 2p - 1 + gammons + backgammons.
+_EQUITY_WEIGHTS = np.array([2.0, 1.0, 1.0, -1.0, -1.0], dtype=np.float32)
+
+
+class NetworkWeights(NamedTuple):
+    """
+    Pesos de la red.
+
+    Atributos:
+        hidden_weights: ``(NUM_INPUTS, ocultas)``.
+        hidden_bias: ``(ocultas,)``.
+        output_weights: ``(ocultas, NUM_OUTPUTS)``.
+        output_bias: ``(NUM_OUTPUTS,)``.
+    """
+    hidden_weights: np.ndarray
+    hidden_bias: np.ndarray
+    output_weights: np.ndarray
+    output_bias: np.ndarray
+
+
+def random_weights(hidden: int = DEFAULT_HIDDEN, seed: Optional[int] = None) -> NetworkWeights:
+    """
+    Devuelve pesos iniciales aleatorios pequeños.
+
+    Args:
+        hidden (int): Unidades ocultas.
+        seed (Optional[int]): Semilla del generador.
+
+    Raises:
+        ValueError: Si ``hidden`` no es positivo.
+    """
+    if hidden <= 0:
+        raise ValueError("La cantidad de unidades ocultas debe ser positiva")
+    rng = np.random.default_rng(seed)
+    return NetworkWeights(
+        rng.normal(0.0, 0.1, (NUM_INPUTS, hidden)).astype(np.float32),
+        np.zeros(hidden, dtype=np.float32),
+        rng.normal(0.0, 0.1, (hidden, NUM_OUTPUTS)).astype(np.float32),
+        np.zeros(NUM_OUTPUTS, dtype=np.float32),
+    )
+
+
+def save_weights(path: str, weights: NetworkWeights) -> None:
+    """
+    Guarda los pesos en ``path``: cabecera y los cuatro arreglos en ``float32``.
+
+    Args:
+        path (str): Archivo de salida.
+        weights (NetworkWeights): Pesos a guardar.
+    """
+    inputs, hidden = weights.hidden_weights.shape
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, inputs, hidden, weights.output_bias.shape[0]))
+        for values in weights:
+            handle.write(np.ascontiguousarray(values, dtype="<f4").tobytes())
+
+
+def load_weights(path: str) -> NetworkWeights:
+    """
+    Abre los pesos de ``path`` con mmap (de solo lectura).
+
+    Raises:
+        ValueError: Si el archivo no es un archivo de pesos compatible.
+    """
+    with open(path, "rb") as handle:
+        header = handle.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError("Archivo de pesos inválido")
+    magic, inputs, hidden, outputs = HEADER.unpack(header)
+    if magic != MAGIC or inputs != NUM_INPUTS or outputs != NUM_OUTPUTS or hidden == 0:
+        raise ValueError("Archivo de pesos inválido")
+    shapes = ((inputs, hidden), (hidden,), (hidden, outputs), (outputs,))
+    total = sum(int(np.prod(shape)) for shape in shapes)
+    values = np.memmap(path, dtype="<f4", mode="r", offset=HEADER.size, shape=(total,))
+    arrays = []
+    start = 0
+    for shape in shapes:
+        size = int(np.prod(shape))
+        arrays.append(values[start:start + size].reshape(shape))
+        start += size
+    return NetworkWeights(*arrays)
+
+
+def positions_to_boards(positions: Sequence[Position], side: int) -> np.ndarray:
+    """
+    Convierte posiciones en tableros ``(N, 28)`` de ``int8`` desde el punto de vista de ``side``.
+
+    El formato es el de ``core.batchengine``: las fichas de ``side`` son positivas
+    y avanzan del punto 0 al 23.
+    """
+    data = b"".join(position.to_bytes() for position in positions)
+    boards = np.frombuffer(data, dtype=np.int8).reshape(len(positions), -1)
+    if side == BLACK:
+        return -boards[:, _FLIP]
+    return boards
+
+
+def encode_boards(boards: np.ndarray) -> np.ndarray:
+    """
+    Codifica tableros en la perspectiva del lado evaluado.
+
+    Args:
+        boards (np.ndarray): ``(N, 28)`` en el formato de ``core.batchengine``.
+
+    Returns:
+        np.ndarray: ``(N, NUM_INPUTS)`` de ``float32``.
+    """
+    points = boards[:, :NUM_POINTS].astype(np.float32)
+    # Fichas del rival en el orden en que él recorre el tablero (del punto 23 al 0).
+    sides = (np.maximum(points, 0.0), np.maximum(-points, 0.0)[:, ::-1])
+    bars = (boards[:, _OWN_BAR], -boards[:, _OPPONENT_BAR])
+    offs = (boards[:, _OWN_OFF], -boards[:, _OPPONENT_OFF])
+    inputs = np.empty((len(boards), NUM_INPUTS), dtype=np.float32)
+    for index, counts in enumerate(sides):
+        start = index * SIDE_INPUTS
+        units = inputs[:, start:start + NUM_POINTS * POINT_UNITS]
+        units = units.reshape(-1, NUM_POINTS, POINT_UNITS)
+        units[:, :, 0] = counts >= 1
+        units[:, :, 1] = counts >= 2
+        units[:, :, 2] = counts >= 3
+        units[:, :, 3] = np.maximum(counts - 3.0, 0.0) / 2.0
+        inputs[:, start + SIDE_INPUTS - 2] = bars[index] / 2.0
+        inputs[:, start + SIDE_INPUTS - 1] = offs[index] / CHECKERS_PER_SIDE
+    return inputs
+
+
+def encode_positions(positions: Sequence[Position], side: int) -> np.ndarray:
+    """Codifica posiciones desde el punto de vista de ``side`` (``(N, NUM_INPUTS)``)."""
+    return encode_boards(positions_to_boards(positions, side))
+
+
+def equities(probabilities: np.ndarray) -> np.ndarray:
+    """Convierte probabilidades ``(N, NUM_OUTPUTS)`` en equity sin cubo ``(N,)``."""
+    return probabilities @ _EQUITY_WEIGHTS - 1.0
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    """Sigmoide logística."""
+    return 1.0 / (1.0 + np.exp(-values))
+
+
+class NeuralNetwork:
+    """Red neuronal de evaluación; sirve como ``Evaluator`` y evalúa lotes."""
+
+    def __init__(self, weights: Optional[NetworkWeights] = None) -> None:
+        """
+        Inicializa la red.
+
+        Args:
+            weights (Optional[NetworkWeights]): Pesos; por defecto aleatorios.
+
+        Raises:
+            ValueError: Si las formas de los pesos no son compatibles.
+        """
+        weights = weights if weights is not None else random_weights()
+        hidden = weights.hidden_bias.shape[0]
+        if (weights.hidden_weights.shape != (NUM_INPUTS, hidden)
+                or weights.output_weights.shape != (hidden, NUM_OUTPUTS)
+                or weights.output_bias.shape != (NUM_OUTPUTS,)):
+            raise ValueError("Formas de pesos incompatibles")
+        self.__weights: NetworkWeights = weights
+
+    @classmethod
+    def from_file(cls, path: str) -> "NeuralNetwork":
+        """Crea una red con los pesos de ``path`` abiertos con mmap."""
+        return cls(load_weights(path))
+
+    def get_weights(self) -> NetworkWeights:
+        """Devuelve los pesos de la red."""
+        return self.__weights
+
+    def get_hidden(self) -> int:
+        """Devuelve la cantidad de unidades ocultas."""
+        return self.__weights.hidden_bias.shape[0]
+
+    def set_weights(self, weights: NetworkWeights) -> None:
+        """Reemplaza los pesos (por ejemplo, tras un paso de entrenamiento)."""
+        self.__weights = weights
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Propaga un lote de entradas codificadas.
+
+        Args:
+            inputs (np.ndarray): ``(N, NUM_INPUTS)``.
+
+        Returns:
+            np.ndarray: Probabilidades ``(N, NUM_OUTPUTS)``.
+        """
+        weights = self.__weights
+        hidden = _sigmoid(inputs @ weights.hidden_weights + weights.hidden_bias)
+        return _sigmoid(hidden @ weights.output_weights + weights.output_bias)
+
+    def probabilities(self, positions: Sequence[Position], side: int) -> np.ndarray:
+        """Devuelve las probabilidades ``(N, NUM_OUTPUTS)`` de ``side`` para cada posición."""
+        return self.forward(encode_positions(positions, side))
+
+    def evaluate_batch(self, positions: Sequence[Position], side: int) -> List[float]:
+        """
+        Evalúa un lote de posiciones con una sola pasada de la red.
+
+        Las partidas terminadas valen su resultado exacto (±1, ±2 o ±3).
+
+        Args:
+            positions (Sequence[Position]): Posiciones tras la jugada de ``side``.
+            side (int): Lado desde cuyo punto de vista se evalúa.
+
+        Returns:
+            List[float]: Equity de cada posición.
+        """
+        if not positions:
+            return []
+        values = equities(self.probabilities(positions, side)).tolist()
+        for index, position in enumerate(positions):
+            result = terminal_value(position, side)
+            if result:
+                values[index] = float(result)
+        return values
+
+    def __call__(self, position: Position, side: int) -> float:
+        """Evalúa una sola posición (interfaz ``Evaluator``)."""
+        return self.evaluate_batch([position], side)[0]
@@ -0,0 +1,340 @@
+"""Módulo openingbook para Backgammon.
+
+Libro de aperturas: la mejor jugada precalculada para cada una de las 21
+tiradas desde la posición inicial y para cada tirada de respuesta del rival
+tras las jugadas del libro. ``ExpectimaxEngine`` lo consulta antes de buscar,
+así que las primeras jugadas de cada partida se resuelven con una búsqueda en
+un diccionario.
+
+Las entradas se indexan por ``Position.side_hash(side)`` combinado con la
+clave de los dados (``dice_key``); como el hash es canónico, la misma entrada
+sirve para las blancas y para las negras. Las jugadas se guardan desde el
+punto de vista de las blancas y se espejan al consultarlas para las negras.
+
+El libro se genera con rollouts: para cada posición y tirada se juegan las
+``candidates`` mejores jugadas según la evaluación estática, con los mismos
+dados para todas (números aleatorios comunes), y se elige la de mayor equity.
+Las posiciones se reparten entre los procesos de un ``ProcessPoolExecutor``.
+
+El archivo tiene una cabecera y un registro de tamaño fijo por entrada
+(clave, equity y hasta 4 pasos ``(origen, destino, dado)``).
+
+Uso:
+    python -m core.openingbook --trials 216 --workers 4 --output data/opening.bin
+"""
+
+import argparse
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.evaluation import heuristic_evaluation
+from core.movegen import Play, generate_successors
+from core.position import Position, WHITE, BLACK, MIRROR_SLOTS, dice_key
+from core.rollout import RolloutSettings, run_rollout
+
+MAGIC: bytes = b"OBK1"
+HEADER = struct.Struct("<4sII")
+MAX_STEPS: int = 4
+RECORD = struct.Struct(f"<QfB{3 * MAX_STEPS}B")
+
+DEFAULT_PATH: str = "data/opening.bin"
+DEFAULT_TRIALS: int = 216
+DEFAULT_CANDIDATES: int = 3
+DEFAULT_TRUNCATE: int = 20
+# Rollouts del libro; ``workers`` es la cantidad de procesos que reparten las posiciones.
+DEFAULT_SETTINGS = RolloutSettings(trials=DEFAULT_TRIALS, truncate=DEFAULT_TRUNCATE)
+
+# Las 21 tiradas distintas; los dobles se juegan cuatro veces.
+OPENING_ROLLS: Tuple[Tuple[int, ...], ...] = tuple(
+    (die1,) * 4 if die1 == die2 else (die1, die2)
+    for die1 in range(1, 7)
+    for die2 in range(die1, 7)
+)
+
+
+class BookEntry(NamedTuple):
+    """
+    Jugada del libro.
+
+    Atributos:
+        play: Pasos ``(origen, destino, dado)`` en casillas del lado consultado.
+        equity: Equity estimada por el rollout para el lado que mueve.
+    """
+    play: Play
+    equity: float
+
+
+def book_key(position: Position, side: int, dice: Sequence[int]) -> int:
+    """Devuelve la clave del libro para ``side`` en turno con los dados indicados."""
+    return position.side_hash(side) ^ dice_key(dice)
+
+
+def _mirror_play(play: Play) -> Play:
+    """Devuelve la jugada equivalente en la posición espejada."""
+    return tuple((MIRROR_SLOTS[source], MIRROR_SLOTS[dest], die) for source, dest, die in play)
+
+
+def initial_position() -> Position:
+    """Devuelve la posición inicial estándar."""
+    position = Position()
+    position.setup_initial_points()
+    return position
+
+
+class OpeningBook:
+    """Libro de aperturas indexado por posición, lado en turno y dados."""
+
+    def __init__(self, trials: int = 0) -> None:
+        """
+        Inicializa un libro vacío.
+
+        Args:
+            trials (int): Ensayos por jugada con que se generó (informativo).
+        """
+        self.__entries: Dict[int, BookEntry] = {}
+        self.__trials: int = trials
+
+    @classmethod
+    def from_file(cls, path: str) -> "OpeningBook":
+        """
+        Carga un libro guardado con ``save``.
+
+        Raises:
+            ValueError: Si el archivo no es un libro de aperturas válido.
+        """
+        with open(path, "rb") as handle:
+            data = handle.read()
+        if len(data) < HEADER.size:
+            raise ValueError("Archivo de libro de aperturas inválido")
+        magic, count, trials = HEADER.unpack_from(data)
+        if magic != MAGIC or len(data) != HEADER.size + count * RECORD.size:
+            raise ValueError("Archivo de libro de aperturas inválido")
+        book = cls(trials)
+        for fields in RECORD.iter_unpack(data[HEADER.size:]):
+            key, equity, steps = fields[:3]
+            values = fields[3:3 + 3 * steps]
+            play = tuple(tuple(values[index:index + 3]) for index in range(0, len(values), 3))
+            book.__entries[key] = BookEntry(play, equity)
+        return book
+
+    def save(self, path: str) -> None:
+        """Guarda el libro en ``path`` (ordenado por clave)."""
+        with open(path, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, len(self.__entries), self.__trials))
+            for key in sorted(self.__entries):
+                play, equity = self.__entries[key]
+                values = [value for step in play for value in step]
+                values += [0] * (3 * MAX_STEPS - len(values))
+                handle.write(RECORD.pack(key, equity, len(play), *values))
+
+    def get_trials(self) -> int:
+        """Devuelve los ensayos por jugada con que se generó el libro."""
+        return self.__trials
+
+    def add(
+        self, position: Position, side: int, dice: Sequence[int], play: Play, equity: float
+    ) -> None:
+        """
+        Agrega (o reemplaza) la jugada de ``side`` con los dados indicados.
+
+        Args:
+            position (Position): Posición antes de la jugada.
+            side (int): Lado que mueve.
+            dice (Sequence[int]): Dados (cuatro valores en dobles).
+            play (Play): Pasos en casillas de ``side``.
+            equity (float): Equity de la jugada para ``side``.
+
+        Raises:
+            ValueError: Si la jugada tiene más de 4 pasos.
+        """
+        if len(play) > MAX_STEPS:
+            raise ValueError("Una jugada tiene como máximo 4 pasos")
+        stored = _mirror_play(play) if side == BLACK else tuple(play)
+        self.__entries[book_key(position, side, dice)] = BookEntry(stored, equity)
+
+    def lookup(self, position: Position, side: int, dice: Sequence[int]) -> Optional[BookEntry]:
+        """
+        Busca la jugada del libro.
+
+        Returns:
+            Optional[BookEntry]: La jugada en casillas de ``side``, o None si no está.
+        """
+        entry = self.__entries.get(book_key(position, side, dice))
+        if entry is None or side == WHITE:
+            return entry
+        return BookEntry(_mirror_play(entry.play), entry.equity)
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de entradas."""
+        return len(self.__entries)
+
+
+def analyze_roll(
+    encoded: bytes,
+    side: int,
+    dice: Tuple[int, ...],
+    settings: RolloutSettings = DEFAULT_SETTINGS,
+    candidates: int = DEFAULT_CANDIDATES,
+) -> Optional[BookEntry]:
+    """
+    Elige por rollouts la mejor jugada de una tirada (tarea de cada worker).
+
+    Args:
+        encoded (bytes): Posición codificada con ``Position.to_bytes``.
+        side (int): Lado que mueve.
+        dice (Tuple[int, ...]): Dados a jugar.
+        settings (RolloutSettings): Ensayos por candidata, truncamiento y semilla
+            común a los rollouts de todas las candidatas; se juegan en este proceso.
+        candidates (int): Jugadas (las mejores a 0-ply) que se evalúan con rollouts.
+
+    Returns:
+        Optional[BookEntry]: La mejor jugada, o None si no hay jugada legal.
+    """
+    position = Position.from_bytes(encoded)
+    successors = generate_successors(position, side, dice)
+    successors.sort(key=lambda entry: heuristic_evaluation(entry[1], side), reverse=True)
+    settings = settings._replace(workers=1)
+    best: Optional[BookEntry] = None
+    for play, child in successors[:candidates]:
+        stats = run_rollout(child, 1 - side, settings)
+        equity = -stats.mean("equity")
+        if best is None or equity > best.equity:
+            best = BookEntry(play, equity)
+    return best
+
+
+def _apply_play(position: Position, side: int, play: Play) -> Position:
+    """Devuelve una copia de ``position`` con la jugada aplicada."""
+    child = position.copy()
+    for step in play:
+        child.apply(side, step)
+    return child
+
+
+def _analyze_all(
+    pool: Optional[ProcessPoolExecutor],
+    tasks: List[Tuple[Position, int, Tuple[int, ...]]],
+    options: Tuple[RolloutSettings, int],
+) -> Iterator[Optional[BookEntry]]:
+    """Analiza las tareas ``(posición, lado, dados)`` en el pool o en este proceso."""
+    columns = [
+        [position.to_bytes() for position, _, _ in tasks],
+        [side for _, side, _ in tasks],
+        [dice for _, _, dice in tasks],
+    ] + [[value] * len(tasks) for value in options]
+    if pool is None:
+        return map(analyze_roll, *columns)
+    return pool.map(analyze_roll, *columns)
+
+
+def _add_entries(
+    book: OpeningBook,
+    tasks: List[Tuple[Position, int, Tuple[int, ...]]],
+    entries: Iterator[Optional[BookEntry]],
+) -> List[Tuple[Position, int, BookEntry]]:
+    """Agrega al libro las tareas que tienen jugada y devuelve ``(posición, lado, jugada)``."""
+    added = []
+    for (position, side, dice), entry in zip(tasks, entries):
+        if entry is not None:
+            book.add(position, side, dice, entry.play, entry.equity)
+            added.append((position, side, entry))
+    return added
+
+
+def _reply_tasks(
+    added: List[Tuple[Position, int, BookEntry]], rolls: Sequence[Tuple[int, ...]]
+) -> List[Tuple[Position, int, Tuple[int, ...]]]:
+    """Devuelve cada tirada del rival tras las jugadas elegidas, sin repetir posiciones."""
+    replies: Dict[int, Tuple[Position, int, Tuple[int, ...]]] = {}
+    for position, side, entry in added:
+        reply = _apply_play(position, side, entry.play)
+        for dice in rolls:
+            replies.setdefault(book_key(reply, 1 - side, dice), (reply, 1 - side, dice))
+    return list(replies.values())
+
+
+def build_book(
+    settings: RolloutSettings = DEFAULT_SETTINGS,
+    candidates: int = DEFAULT_CANDIDATES,
+    rolls: Sequence[Tuple[int, ...]] = OPENING_ROLLS,
+) -> OpeningBook:
+    """
+    Genera el libro: aperturas de las blancas y respuestas de las negras.
+
+    Primero se analizan las tiradas desde la posición inicial; después, cada
+    tirada del rival en las posiciones que dejan las jugadas elegidas.
+
+    Args:
+        settings (RolloutSettings): Ensayos por jugada candidata, truncamiento (None
+            juega hasta el final), semilla y procesos que reparten las posiciones
+            (None usa todos los núcleos y 1 trabaja en este proceso).
+        candidates (int): Jugadas candidatas por tirada.
+        rolls (Sequence[Tuple[int, ...]]): Tiradas a cubrir en ambos niveles.
+
+    Returns:
+        OpeningBook: El libro generado.
+
+    Raises:
+        ValueError: Si ``trials``, ``candidates`` o ``workers`` no son positivos.
+    """
+    workers = settings.workers if settings.workers is not None else os.cpu_count() or 1
+    if min(settings.trials, candidates, workers) <= 0:
+        raise ValueError("Los ensayos, las candidatas y los workers deben ser positivos")
+    options = (settings, candidates)
+    book = OpeningBook(settings.trials)
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        openings = [(initial_position(), WHITE, dice) for dice in rolls]
+        added = _add_entries(book, openings, _analyze_all(pool, openings, options))
+        tasks = _reply_tasks(added, rolls)
+        _add_entries(book, tasks, _analyze_all(pool, tasks, options))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return book
+
+
+def load_book(path: str = DEFAULT_PATH) -> Optional[OpeningBook]:
+    """Carga el libro de ``path``, o devuelve None si el archivo no existe."""
+    if not os.path.exists(path):
+        return None
+    return OpeningBook.from_file(path)
+
+
+def main(argv: Optional[List[str]] = None) -> OpeningBook:
+    """
+    Genera el libro desde la línea de comandos.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (por defecto los del proceso).
+
+    Returns:
+        OpeningBook: El libro generado.
+    """
+    parser = argparse.ArgumentParser(description="Genera el libro de aperturas con rollouts")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS,
+                        help="ensayos por jugada candidata")
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES,
+                        help="jugadas candidatas por tirada")
+    parser.add_argument("--truncate", type=int, default=DEFAULT_TRUNCATE,
+                        help="medios turnos por ensayo (0 juega hasta el final)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args(argv)
+    settings = RolloutSettings(
+        trials=args.trials, seed=args.seed, truncate=args.truncate or None, workers=args.workers,
+    )
+    book = build_book(settings, args.candidates)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    book.save(args.output)
+    print(f"Libro de {len(book)} entradas guardado en {args.output}")
+    return book
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+"""Módulo Position para Backgammon.
+
+Representación compacta del estado del tablero: un arreglo de 28 enteros con
+signo (24 puntos, una barra y una zona de fichas fuera por cada lado). Las
+fichas blancas se cuentan en positivo y las negras en negativo.
+
+La posición espejada intercambia los colores y recorre el tablero al revés, de
+modo que lo que ven las negras queda visto como si fueran las blancas. Junto al
+hash Zobrist se mantiene incrementalmente el de la posición espejada; ``side_hash(side)``
+devuelve el de la posición vista desde ``side`` y es la clave canónica de las
+tablas que guardan valores por (posición, lado): dos posiciones espejo una de
+otra comparten clave.
+"""
+
+import random
+
+from array import array
+from itertools import combinations_with_replacement
+from typing import List, Optional, Sequence, Tuple
+
+WHITE: int = 0
+BLACK: int = 1
+COLORS = ("white", "black")
+SIDE_BY_COLOR = {"white": WHITE, "black": BLACK}
+SIGN = (1, -1)
+
+NUM_POINTS: int = 24
+BAR_SLOT = (24, 25)
+OFF_SLOT = (26, 27)
+NUM_SLOTS: int = 28
+CHECKERS_PER_SIDE: int = 15
+
+# Posición inicial estándar como (índice 0-based, cantidad) por lado.
+INITIAL_LAYOUT = (
+    ((0, 2), (11, 5), (16, 3), (18, 5)),
+    ((23, 2), (12, 5), (7, 3), (5, 5)),
+)
+
+# Claves Zobrist de 64 bits, fijas entre procesos (semilla constante).
+# ZOBRIST_KEYS[casilla][conteo] usa índices negativos para las fichas negras,
+# de modo que el conteo con signo sirve directamente como índice; el conteo 0
+# tiene clave 0 para que las casillas vacías no aporten al hash.
+_KEY_RNG = random.Random(0x6A09E667F3BCC908)
+ZOBRIST_KEYS = tuple(
+    tuple(
+        0 if value == 0 else _KEY_RNG.getrandbits(64)
+        for value in range(2 * CHECKERS_PER_SIDE + 1)
+    )
+    for _ in range(NUM_SLOTS)
+)
+SIDE_TO_MOVE_KEY: int = _KEY_RNG.getrandbits(64)
+DICE_KEYS = {
+    dice: _KEY_RNG.getrandbits(64)
+    for size in range(1, 5)
+    for dice in combinations_with_replacement(range(1, 7), size)
+}
+
+# Conteos con signo en el orden en que los indexa un conteo usado como índice
+# (0..15 y luego -15..-1), compartido por las tablas de aportes por casilla.
+SIGNED_COUNTS = tuple(range(CHECKERS_PER_SIDE + 1)) + tuple(range(-CHECKERS_PER_SIDE, 0))
+
+# Casilla correspondiente en la posición espejada: los puntos se invierten y la
+# barra y las fichas fuera de cada lado pasan a ser las del otro.
+MIRROR_SLOTS = tuple(range(NUM_POINTS - 1, -1, -1)) + (
+    BAR_SLOT[1], BAR_SLOT[0], OFF_SLOT[1], OFF_SLOT[0],
+)
+
+# Claves del hash de la posición espejada: la de (casilla, conteo) es la clave
+# Zobrist de (casilla espejada, -conteo), con el mismo indexado que ZOBRIST_KEYS.
+MIRROR_KEYS = tuple(
+    tuple(ZOBRIST_KEYS[MIRROR_SLOTS[slot]][-value] for value in SIGNED_COUNTS)
+    for slot in range(NUM_SLOTS)
+)
+
+# Aporte al pip count de cada casilla según su conteo con signo, con el mismo
+# indexado que ZOBRIST_KEYS. Los pips de ambos lados se empaquetan en un único
+# entero (blancas en los 16 bits bajos, negras en los siguientes) para que una
+# actualización cueste una resta y una suma.
+PIP_SHIFT = (0, 16)
+PIP_MASK = 0xFFFF
+PIP_WEIGHTS = (
+    tuple(NUM_POINTS - i for i in range(NUM_POINTS)) + (NUM_POINTS + 1, 0, 0, 0),
+    tuple(i + 1 for i in range(NUM_POINTS)) + (0, NUM_POINTS + 1, 0, 0),
+)
+
+# Fichas fuera de la zona de casa: puntos fuera de casa y la barra propia.
+HOME_RANGE = (range(18, NUM_POINTS), range(0, 6))
+OUTSIDE_WEIGHTS = tuple(
+    tuple(
+        int(slot == BAR_SLOT[side] or (slot < NUM_POINTS and slot not in HOME_RANGE[side]))
+        for slot in range(NUM_SLOTS)
+    )
+    for side in (WHITE, BLACK)
+)
+
+
+def _packed_keys(weights: Tuple[Tuple[int, ...], Tuple[int, ...]]) -> Tuple[Tuple[int, ...], ...]:
+    """Construye una tabla de aportes empaquetados por casilla y conteo con signo."""
+    return tuple(
+        tuple(
+            value * weights[WHITE][slot] if value >= 0
+            else (-value * weights[BLACK][slot]) << PIP_SHIFT[BLACK]
+            for value in SIGNED_COUNTS
+        )
+        for slot in range(NUM_SLOTS)
+    )
+
+
+PIP_KEYS = _packed_keys(PIP_WEIGHTS)
+OUTSIDE_KEYS = _packed_keys(OUTSIDE_WEIGHTS)
+
+# Ocupación de los puntos: un bit por punto y lado (blancas en los bits 0-23,
+# negras en los 24-47). Se actualiza con XOR igual que el hash Zobrist.
+OCCUPANCY_SHIFT = (0, NUM_POINTS)
+POINTS_MASK = (1 << NUM_POINTS) - 1
+OCCUPANCY_KEYS = tuple(
+    tuple(
+        0 if slot >= NUM_POINTS or value == 0
+        else 1 << (slot + OCCUPANCY_SHIFT[WHITE if value > 0 else BLACK])
+        for value in SIGNED_COUNTS
+    )
+    for slot in range(NUM_SLOTS)
+)
+
+
+
+def _reverse_points(bits: int) -> int:
+    """Invierte el orden de los 24 bits de ocupación (punto ``i`` pasa a ``23 - i``)."""
+    return int(f"{bits:0{NUM_POINTS}b}"[::-1], 2)
+
+
+class Position:
+    """Estado compacto del tablero basado en conteos con signo por casilla."""
+
+    __slots__ = ("__cells", "__hash", "__mirror_hash", "__pips", "__occupancy", "__outside")
+
+    def __init__(
+        self, cells: Optional[Sequence[int]] = None, *, derived: Optional[Tuple[int, ...]] = None,
+    ) -> None:
+        """
+        Inicializa la posición.
+
+        Args:
+            cells (Optional[Sequence[int]]): Casillas iniciales; si es None el tablero queda vacío.
+            derived (Optional[Tuple[int, ...]]): Hash, hash espejado, pips, fichas fuera
+                de casa y ocupación ya calculados para ``cells`` (ver ``copy``); si es
+                None se calculan recorriendo el tablero.
+        """
+        if cells is None:
+            self.__cells: array = array("b", bytes(NUM_SLOTS))
+        else:
+            if len(cells) != NUM_SLOTS:
+                raise ValueError("La posición debe tener 28 casillas")
+            self.__cells = array("b", cells)
+        if derived is not None:
+            (self.__hash, self.__mirror_hash, self.__pips,
+             self.__outside, self.__occupancy) = derived
+            return
+        self.__hash: int = self.compute_hash()
+        self.__mirror_hash: int = 0
+        for slot, value in enumerate(self.__cells):
+            self.__mirror_hash ^= MIRROR_KEYS[slot][value]
+        self.__pips: int = self.__compute_packed(PIP_KEYS)
+        self.__outside: int = self.__compute_packed(OUTSIDE_KEYS)
+        self.__occupancy: int = 0
+        for slot, value in enumerate(self.__cells):
+            self.__occupancy |= OCCUPANCY_KEYS[slot][value]
+
+    def get_cells(self) -> array:
+        """Devuelve el arreglo interno de casillas (no modificar directamente)."""
+        return self.__cells
+
+    def get_point(self, point: int) -> int:
+        """Devuelve el conteo con signo del punto (positivo blancas, negativo negras)."""
+        if point < 0 or point >= NUM_POINTS:
+            raise ValueError("Punto inválido")
+        return self.__cells[point]
+
+    def get_count(self, slot: int) -> int:
+        """Devuelve la cantidad de fichas en la casilla, sin importar el lado."""
+        return abs(self.__cells[slot])
+
+    def get_owner_side(self, slot: int) -> Optional[int]:
+        """Devuelve el lado que ocupa la casilla o None si está vacía."""
+        value = self.__cells[slot]
+        if value > 0:
+            return WHITE
+        if value < 0:
+            return BLACK
+        return None
+
+    def get_side_count(self, slot: int, side: int) -> int:
+        """Devuelve la cantidad de fichas del lado indicado en la casilla."""
+        value = self.__cells[slot] * SIGN[side]
+        return value if value > 0 else 0
+
+    def get_bar(self, side: int) -> int:
+        """Devuelve la cantidad de fichas del lado en la barra."""
+        return self.__cells[BAR_SLOT[side]] * SIGN[side]
+
+    def get_off(self, side: int) -> int:
+        """Devuelve la cantidad de fichas del lado fuera del tablero."""
+        return self.__cells[OFF_SLOT[side]] * SIGN[side]
+
+    def add_checkers(self, slot: int, side: int, count: int = 1) -> None:
+        """
+        Agrega fichas del lado a la casilla.
+
+        Raises:
+            ValueError: Si la casilla está ocupada por el otro lado.
+        """
+        value = self.__cells[slot]
+        if value * SIGN[side] < 0:
+            raise ValueError("La casilla está ocupada por el oponente")
+        new_value = value + SIGN[side] * count
+        if abs(new_value) > CHECKERS_PER_SIDE:
+            raise ValueError("Cantidad de fichas inválida")
+        self.__update(slot, value, new_value)
+
+    def remove_checkers(self, slot: int, side: int, count: int = 1) -> None:
+        """
+        Remueve fichas del lado de la casilla.
+
+        Raises:
+            ValueError: Si no hay suficientes fichas del lado en la casilla.
+        """
+        if self.get_side_count(slot, side) < count:
+            raise ValueError("No hay fichas para remover")
+        value = self.__cells[slot]
+        self.__update(slot, value, value - SIGN[side] * count)
+
+    def set_slot(self, slot: int, side: int, count: int) -> None:
+        """Establece la cantidad de fichas del lado en la casilla."""
+        if count < 0 or count > CHECKERS_PER_SIDE:
+            raise ValueError("Cantidad de fichas inválida")
+        self.__update(slot, self.__cells[slot], SIGN[side] * count)
+
+    def __update(self, slot: int, old_value: int, new_value: int) -> None:
+        """Escribe la casilla y actualiza en O(1) el hash y los datos derivados."""
+        self.__cells[slot] = new_value
+        keys = ZOBRIST_KEYS[slot]
+        self.__hash ^= keys[old_value] ^ keys[new_value]
+        keys = MIRROR_KEYS[slot]
+        self.__mirror_hash ^= keys[old_value] ^ keys[new_value]
+        keys = OCCUPANCY_KEYS[slot]
+        self.__occupancy ^= keys[old_value] ^ keys[new_value]
+        keys = PIP_KEYS[slot]
+        self.__pips += keys[new_value] - keys[old_value]
+        keys = OUTSIDE_KEYS[slot]
+        self.__outside += keys[new_value] - keys[old_value]
+
+    def clear_points(self) -> None:
+        """Vacía los 24 puntos sin tocar la barra ni las fichas fuera."""
+        cells = self.__cells
+        for i in range(NUM_POINTS):
+            if cells[i]:
+                self.__update(i, cells[i], 0)
+
+    def clear(self) -> None:
+        """Vacía todas las casillas."""
+        cells = self.__cells
+        for i in range(NUM_SLOTS):
+            cells[i] = 0
+        self.__hash = 0
+        self.__mirror_hash = 0
+        self.__pips = 0
+        self.__occupancy = 0
+        self.__outside = 0
+
+    def setup_initial_points(self) -> None:
+        """Coloca en los puntos la posición inicial estándar."""
+        self.clear_points()
+        for side in (WHITE, BLACK):
+            for point, count in INITIAL_LAYOUT[side]:
+                self.__update(point, 0, SIGN[side] * count)
+
+    def count_on_board(self, side: int) -> int:
+        """Cuenta las fichas del lado sobre los 24 puntos."""
+        sign = SIGN[side]
+        return sum(v * sign for v in self.__cells[:NUM_POINTS] if v * sign > 0)
+
+    def occupancy(self, side: int) -> int:
+        """Devuelve la máscara de bits de los puntos ocupados por el lado."""
+        return self.__occupancy >> OCCUPANCY_SHIFT[side] & POINTS_MASK
+
+    def checker_positions(self, side: int) -> List[int]:
+        """Devuelve los índices de los puntos ocupados por el lado."""
+        mask = self.occupancy(side)
+        positions = []
+        while mask:
+            low = mask & -mask
+            positions.append(low.bit_length() - 1)
+            mask ^= low
+        return positions
+
+    def furthest_point(self, side: int) -> Optional[int]:
+        """Devuelve el punto ocupado más alejado de casa para el lado."""
+        mask = self.occupancy(side)
+        if not mask:
+            return None
+        if side == WHITE:
+            return (mask & -mask).bit_length() - 1
+        return mask.bit_length() - 1
+
+    def outside_home(self, side: int) -> int:
+        """Devuelve cuántas fichas del lado están fuera de su zona de casa (incluida la barra)."""
+        return self.__outside >> PIP_SHIFT[side] & PIP_MASK
+
+    def pip_count(self, side: int) -> int:
+        """
+        Devuelve el pip count del lado, mantenido incrementalmente.
+
+        Cada ficha aporta la distancia que le falta para salir; las fichas en
+        la barra cuentan 25 y las que ya salieron no cuentan.
+        """
+        return self.__pips >> PIP_SHIFT[side] & PIP_MASK
+
+    def compute_pip_count(self, side: int) -> int:
+        """Recalcula desde cero el pip count del lado."""
+        sign = SIGN[side]
+        weights = PIP_WEIGHTS[side]
+        return sum(
+            value * sign * weights[slot]
+            for slot, value in enumerate(self.__cells) if value * sign > 0
+        )
+
+    def __compute_packed(self, table: Tuple[Tuple[int, ...], ...]) -> int:
+        """Recalcula desde cero un contador empaquetado a partir de su tabla."""
+        return sum(table[slot][value] for slot, value in enumerate(self.__cells))
+
+    def can_bear_off(self, side: int) -> bool:
+        """Indica si todas las fichas del lado en juego están en su zona de casa."""
+        return self.outside_home(side) == 0
+
+    def apply(self, side: int, step: Sequence[int]) -> int:
+        """
+        Aplica un paso ``(origen, destino, dado)`` y devuelve su registro de deshacer.
+
+        El paso debe ser legal (por ejemplo, obtenido de ``movegen.legal_steps``);
+        no se valida para mantener el costo mínimo. Si el destino tiene un blot
+        rival, se golpea y pasa a la barra.
+
+        Args:
+            side (int): Lado que mueve.
+            step (Sequence[int]): Casilla de origen, casilla de destino y dado.
+
+        Returns:
+            int: Registro compacto para ``unapply`` (ver ``decode_record``).
+        """
+        source, dest, die = step[0], step[1], step[2]
+        sign = SIGN[side]
+        cells = self.__cells
+        self.__update(source, cells[source], cells[source] - sign)
+        hit = 0
+        if dest < NUM_POINTS and cells[dest] == -sign:
+            bar_slot = BAR_SLOT[1 - side]
+            self.__update(dest, -sign, 0)
+            self.__update(bar_slot, cells[bar_slot], cells[bar_slot] - sign)
+            hit = 1
+        self.__update(dest, cells[dest], cells[dest] + sign)
+        return source | dest << 5 | die << 10 | side << 13 | hit << 14
+
+    def unapply(self, record: int) -> None:
+        """
+        Deshace exactamente un paso aplicado con ``apply`` (incluido el golpe y el hash).
+
+        Los registros deben deshacerse en orden inverso al de aplicación.
+        """
+        source, dest, _, side, hit = decode_record(record)
+        sign = SIGN[side]
+        cells = self.__cells
+        self.__update(dest, cells[dest], cells[dest] - sign)
+        if hit:
+            bar_slot = BAR_SLOT[1 - side]
+            self.__update(bar_slot, cells[bar_slot], cells[bar_slot] + sign)
+            self.__update(dest, 0, -sign)
+        self.__update(source, cells[source], cells[source] + sign)
+
+    def compute_hash(self) -> int:
+        """Recalcula desde cero el hash Zobrist de las casillas."""
+        result = 0
+        for slot, value in enumerate(self.__cells):
+            result ^= ZOBRIST_KEYS[slot][value]
+        return result
+
+    def position_hash(self) -> int:
+        """Devuelve el hash Zobrist de 64 bits mantenido incrementalmente."""
+        return self.__hash
+
+    def mirror_hash(self) -> int:
+        """Devuelve el hash Zobrist de la posición espejada (``mirror()``) sin construirla."""
+        return self.__mirror_hash
+
+    def side_hash(self, side: int) -> int:
+        """
+        Devuelve el hash canónico de la posición vista desde ``side``.
+
+        Para las blancas es el hash Zobrist y para las negras el de la posición
+        espejada, así que ``p.side_hash(BLACK) == p.mirror().side_hash(WHITE)``.
+        Es la clave de las tablas que guardan valores por (posición, lado): la
+        tabla de transposición del motor y la caché de evaluaciones.
+        """
+        return self.__mirror_hash if side == BLACK else self.__hash
+
+    def mirror(self) -> "Position":
+        """
+        Devuelve la posición espejada: colores intercambiados y puntos invertidos.
+
+        Los hashes, los pips y las fichas fuera de casa se obtienen intercambiando
+        los valores ya mantenidos, sin recorrer el tablero.
+        """
+        cells = self.__cells
+        shift = PIP_SHIFT[BLACK]
+        white = self.__occupancy & POINTS_MASK
+        black = self.__occupancy >> OCCUPANCY_SHIFT[BLACK]
+        return Position([-cells[slot] for slot in MIRROR_SLOTS], derived=(
+            self.__mirror_hash,
+            self.__hash,
+            self.__pips >> shift | (self.__pips & PIP_MASK) << shift,
+            self.__outside >> shift | (self.__outside & PIP_MASK) << shift,
+            _reverse_points(black) | _reverse_points(white) << OCCUPANCY_SHIFT[BLACK],
+        ))
+
+    def copy(self) -> "Position":
+        """Devuelve una copia independiente de la posición sin recalcular el hash."""
+        return Position(self.__cells, derived=(
+            self.__hash, self.__mirror_hash, self.__pips, self.__outside, self.__occupancy,
+        ))
+
+    def to_bytes(self) -> bytes:
+        """Devuelve la posición codificada en 28 bytes (un conteo con signo por casilla)."""
+        return self.__cells.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Position":
+        """
+        Reconstruye una posición codificada con ``to_bytes``.
+
+        Args:
+            data (bytes): Los 28 bytes de la posición.
+
+        Raises:
+            ValueError: Si la longitud no es 28.
+        """
+        cells = array("b")
+        cells.frombytes(data)
+        return cls(cells)
+
+    def __eq__(self, other: object) -> bool:
+        """Compara dos posiciones casilla por casilla."""
+        if not isinstance(other, Position):
+            return False
+        return self.__cells == other.get_cells()
+
+    def __hash__(self) -> int:
+        """Devuelve el hash de la posición."""
+        return self.__hash
+
+    def __str__(self) -> str:
+        """Representación en string de la posición."""
+        return f"Position({self.__cells.tolist()})"
+
+
+def decode_record(record: int) -> Tuple[int, int, int, int, bool]:
+    """
+    Decodifica un registro de ``Position.apply``.
+
+    Returns:
+        Tuple[int, int, int, int, bool]: Origen, destino, dado, lado y si hubo golpe.
+    """
+    return record & 31, record >> 5 & 31, record >> 10 & 7, record >> 13 & 1, bool(record >> 14 & 1)
+
+
+def dice_key(dice: Sequence[int]) -> int:
+    """
+    Devuelve la clave Zobrist de los dados restantes (sin importar el orden).
+
+    Args:
+        dice (Sequence[int]): Valores de dado aún disponibles.
+
+    Returns:
+        int: Clave de 64 bits; 0 si no quedan dados.
+    """
+    if not dice:
+        return 0
+    return DICE_KEYS[tuple(sorted(dice))]
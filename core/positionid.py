@@ -0,0 +1,383 @@
+"""Módulo positionid para Backgammon.
+
+Codificación y decodificación del Position ID y el Match ID de GNU Backgammon,
+los identificadores en base64 que usan los programas de backgammon para
+guardar, registrar e intercambiar posiciones.
+
+Position ID (14 caracteres): clave de 80 bits. Para cada jugador, primero el
+que no está en turno y después el que está en turno, se recorren sus puntos
+del 1 al 24 desde su propio punto de vista (el 1 es el último de su casa) y
+después su barra; cada casilla con ``n`` fichas aporta ``n`` unos seguidos de
+un cero. Los bits se empaquetan en 10 bytes, el primero en el bit menos
+significativo del primer byte, y se codifican en base64 sin relleno. Las
+fichas fuera no se guardan: son las que faltan para 15.
+
+Match ID (12 caracteres): 66 bits empaquetados del mismo modo con el cubo, el
+turno, los dados, la longitud del match y el marcador (ver ``MatchState``).
+Los jugadores 0 y 1 del Match ID son ``WHITE`` y ``BLACK``.
+
+Las funciones por lotes trabajan con tableros ``(N, 28)`` en el formato de
+``core.batchengine`` (desde el punto de vista del jugador en turno) y
+codifican o decodifican todo el lote con NumPy y una sola llamada a base64.
+"""
+
+import base64
+import binascii
+from array import array
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from core.position import (
+    Position, WHITE, BLACK, NUM_POINTS, NUM_SLOTS, BAR_SLOT, OFF_SLOT, CHECKERS_PER_SIDE,
+    MIRROR_SLOTS,
+)
+
+POSITION_ID_LENGTH: int = 14
+MATCH_ID_LENGTH: int = 12
+KEY_BITS: int = 80
+KEY_BYTES: int = 10
+MATCH_ID_BYTES: int = 9
+SIDE_SLOTS: int = NUM_POINTS + 1  # 24 puntos + barra
+
+START_POSITION_ID: str = "4HPwATDgc/ABMA"
+
+# Dueño del cubo en el Match ID cuando está en el centro.
+CENTERED_CUBE: int = 3
+
+# Estado de la partida en el Match ID.
+NO_GAME: int = 0
+PLAYING: int = 1
+GAME_OVER: int = 2
+RESIGNED: int = 3
+DROPPED: int = 4
+
+# Campos del Match ID en orden, con su cantidad de bits.
+MATCH_FIELDS = (
+    ("cube_log", 4), ("cube_owner", 2), ("dice_owner", 1), ("crawford", 1),
+    ("game_state", 3), ("turn", 1), ("doubled", 1), ("resigned", 2),
+    ("die1", 3), ("die2", 3), ("match_length", 15), ("score0", 15), ("score1", 15),
+)
+
+# Índices para ver un tablero desde el otro lado (el espejo de ``Position.mirror``).
+_FLIP = np.array(MIRROR_SLOTS, dtype=np.intp)
+_OWN_BAR, _OPPONENT_BAR, _OWN_OFF, _OPPONENT_OFF = 24, 25, 26, 27
+# Relleno que lleva cada clave de 10 bytes a 12 (múltiplo de 3) para codificar el lote de una vez.
+_PADDED_BYTES: int = 12
+_PADDED_CHARS: int = 16
+
+
+class MatchState(NamedTuple):
+    """
+    Contenido de un Match ID.
+
+    Atributos:
+        cube_value: Valor del cubo (1, 2, 4...).
+        cube_owner: ``WHITE``, ``BLACK`` o ``CENTERED_CUBE``.
+        dice_owner: Lado que tiró (o debe tirar) los dados.
+        crawford: True si es la partida Crawford.
+        game_state: ``NO_GAME``, ``PLAYING``, ``GAME_OVER``, ``RESIGNED`` o ``DROPPED``.
+        turn: Lado que debe decidir (difiere de ``dice_owner`` si hay un doblaje ofrecido).
+        doubled: True si hay un doblaje ofrecido.
+        resigned: 0 sin abandono, 1 simple, 2 gammon, 3 backgammon.
+        dice: Dados tirados; vacío si todavía no se tiró.
+        match_length: Puntos del match (0 en partidas por dinero).
+        score: Puntos de ``WHITE`` y ``BLACK``.
+    """
+    cube_value: int = 1
+    cube_owner: int = CENTERED_CUBE
+    dice_owner: int = WHITE
+    crawford: bool = False
+    game_state: int = NO_GAME
+    turn: int = WHITE
+    doubled: bool = False
+    resigned: int = 0
+    dice: Tuple[int, ...] = ()
+    match_length: int = 0
+    score: Tuple[int, int] = (0, 0)
+
+
+def _side_counts(cells: array, side: int) -> List[int]:
+    """Devuelve las 25 casillas del lado (puntos 1 a 24 desde su punto de vista y barra)."""
+    if side == WHITE:
+        counts = [max(cells[NUM_POINTS - point], 0) for point in range(1, NUM_POINTS + 1)]
+    else:
+        counts = [max(-cells[point - 1], 0) for point in range(1, NUM_POINTS + 1)]
+    counts.append(abs(cells[BAR_SLOT[side]]))
+    return counts
+
+
+def encode_position_id(position: Position, side_on_roll: int) -> str:
+    """
+    Devuelve el Position ID de una posición.
+
+    Args:
+        position (Position): Posición a codificar.
+        side_on_roll (int): Lado en turno (``WHITE`` o ``BLACK``).
+
+    Returns:
+        str: Position ID de 14 caracteres.
+
+    Raises:
+        ValueError: Si algún lado tiene más de 15 fichas entre el tablero y la barra.
+    """
+    cells = position.get_cells()
+    key = 0
+    bit = 0
+    for side in (1 - side_on_roll, side_on_roll):
+        counts = _side_counts(cells, side)
+        if sum(counts) > CHECKERS_PER_SIDE:
+            raise ValueError("Demasiadas fichas para un Position ID")
+        for count in counts:
+            key |= ((1 << count) - 1) << bit
+            bit += count + 1
+    return base64.b64encode(key.to_bytes(KEY_BYTES, "little")).decode("ascii")[:POSITION_ID_LENGTH]
+
+
+def _decode_base64(text: str, length: int, size: int) -> bytes:
+    """Decodifica ``text`` (base64 sin relleno); lanza ValueError si no es válido."""
+    if not isinstance(text, str) or len(text) != length:
+        raise ValueError("Identificador inválido")
+    try:
+        data = base64.b64decode(text + "=" * (-length % 4), validate=True)
+    except (binascii.Error, ValueError) as error:
+        raise ValueError("Identificador inválido") from error
+    return data[:size]
+
+
+def decode_position_id(position_id: str, side_on_roll: int) -> Position:
+    """
+    Reconstruye la posición de un Position ID.
+
+    Args:
+        position_id (str): Position ID de 14 caracteres.
+        side_on_roll (int): Lado en turno, que el Position ID no guarda.
+
+    Returns:
+        Position: Posición con las fichas que faltan para 15 fuera del tablero.
+
+    Raises:
+        ValueError: Si el identificador no es válido, un lado tiene más de 15
+            fichas o ambos lados ocupan el mismo punto.
+    """
+    key = int.from_bytes(_decode_base64(position_id, POSITION_ID_LENGTH, KEY_BYTES), "little")
+    counts: List[int] = []
+    run = 0
+    for bit in range(KEY_BITS):
+        if key >> bit & 1:
+            run += 1
+        else:
+            counts.append(run)
+            run = 0
+            if len(counts) == 2 * SIDE_SLOTS:
+                break
+    if len(counts) < 2 * SIDE_SLOTS or key >> (bit + 1):
+        raise ValueError("Position ID inválido")
+    cells = array("b", bytes(NUM_SLOTS))
+    for index, side in enumerate((1 - side_on_roll, side_on_roll)):
+        side_counts = counts[index * SIDE_SLOTS:(index + 1) * SIDE_SLOTS]
+        total = sum(side_counts)
+        if total > CHECKERS_PER_SIDE:
+            raise ValueError("Position ID inválido")
+        sign = 1 if side == WHITE else -1
+        for point in range(1, NUM_POINTS + 1):
+            count = side_counts[point - 1]
+            if count:
+                slot = NUM_POINTS - point if side == WHITE else point - 1
+                if cells[slot]:
+                    raise ValueError("Position ID inválido")
+                cells[slot] = sign * count
+        cells[BAR_SLOT[side]] = sign * side_counts[NUM_POINTS]
+        cells[OFF_SLOT[side]] = sign * (CHECKERS_PER_SIDE - total)
+    return Position(cells)
+
+
+def _board_counts(boards: np.ndarray) -> np.ndarray:
+    """Casillas ``(N, 50)`` de la clave: las del rival y después las del jugador en turno."""
+    boards = boards.astype(np.int16)
+    counts = np.empty((len(boards), 2 * SIDE_SLOTS), dtype=np.int16)
+    # El punto p del rival es la casilla p - 1; el propio, la casilla 24 - p.
+    counts[:, :NUM_POINTS] = np.maximum(-boards[:, :NUM_POINTS], 0)
+    counts[:, NUM_POINTS] = -boards[:, _OPPONENT_BAR]
+    counts[:, SIDE_SLOTS:SIDE_SLOTS + NUM_POINTS] = np.maximum(boards[:, NUM_POINTS - 1::-1], 0)
+    counts[:, -1] = boards[:, _OWN_BAR]
+    return counts
+
+
+def boards_to_ids(boards: np.ndarray) -> List[str]:
+    """
+    Devuelve el Position ID de cada tablero de un lote.
+
+    Args:
+        boards (np.ndarray): ``(N, 28)`` en el formato de ``core.batchengine``.
+
+    Returns:
+        List[str]: Un Position ID por tablero.
+
+    Raises:
+        ValueError: Si algún lado tiene más de 15 fichas entre el tablero y la barra.
+    """
+    counts = _board_counts(boards)
+    if (counts[:, :SIDE_SLOTS].sum(axis=1) > CHECKERS_PER_SIDE).any() \
+            or (counts[:, SIDE_SLOTS:].sum(axis=1) > CHECKERS_PER_SIDE).any():
+        raise ValueError("Demasiadas fichas para un Position ID")
+    widths = counts + 1
+    starts = np.cumsum(widths, axis=1) - widths
+    bits = np.zeros((len(boards), _PADDED_BYTES * 8), dtype=np.uint8)
+    for checker in range(CHECKERS_PER_SIDE):
+        rows, columns = np.nonzero(counts > checker)
+        if not rows.size:
+            break
+        bits[rows, starts[rows, columns] + checker] = 1
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    text = base64.b64encode(packed.tobytes()).decode("ascii")
+    return [text[start:start + POSITION_ID_LENGTH] for start in range(0, len(text), _PADDED_CHARS)]
+
+
+def ids_to_boards(position_ids: Sequence[str]) -> np.ndarray:
+    """
+    Reconstruye los tableros de un lote de Position IDs.
+
+    Args:
+        position_ids (Sequence[str]): Position IDs de 14 caracteres.
+
+    Returns:
+        np.ndarray: ``(N, 28)`` de ``int8`` en el formato de ``core.batchengine``.
+
+    Raises:
+        ValueError: Si algún identificador no es válido.
+    """
+    if any(not isinstance(text, str) or len(text) != POSITION_ID_LENGTH for text in position_ids):
+        raise ValueError("Identificador inválido")
+    size = len(position_ids)
+    padding = "A" * (_PADDED_CHARS - POSITION_ID_LENGTH)
+    try:
+        data = base64.b64decode(padding.join(position_ids) + padding, validate=True)
+    except (binascii.Error, ValueError) as error:
+        raise ValueError("Identificador inválido") from error
+    keys = np.frombuffer(data, dtype=np.uint8).reshape(size, _PADDED_BYTES)[:, :KEY_BYTES]
+    bits = np.unpackbits(keys, axis=1, bitorder="little").astype(np.int16)
+    zeros = 1 - bits
+    # Cada uno pertenece a la casilla indicada por la cantidad de ceros anteriores.
+    slots = np.cumsum(zeros, axis=1) - zeros
+    if (zeros.sum(axis=1) < 2 * SIDE_SLOTS).any() or (slots[bits == 1] >= 2 * SIDE_SLOTS).any():
+        raise ValueError("Position ID inválido")
+    rows = np.broadcast_to(np.arange(size)[:, None], bits.shape)[bits == 1]
+    counts = np.bincount(
+        rows * 2 * SIDE_SLOTS + slots[bits == 1], minlength=size * 2 * SIDE_SLOTS,
+    ).reshape(size, 2 * SIDE_SLOTS)
+    opponent, own = counts[:, :SIDE_SLOTS], counts[:, SIDE_SLOTS:]
+    opponent_total, own_total = opponent.sum(axis=1), own.sum(axis=1)
+    own_points = own[:, NUM_POINTS - 1::-1]
+    if (opponent_total > CHECKERS_PER_SIDE).any() or (own_total > CHECKERS_PER_SIDE).any() \
+            or ((own_points > 0) & (opponent[:, :NUM_POINTS] > 0)).any():
+        raise ValueError("Position ID inválido")
+    boards = np.empty((size, NUM_SLOTS), dtype=np.int8)
+    boards[:, :NUM_POINTS] = own_points - opponent[:, :NUM_POINTS]
+    boards[:, _OWN_BAR] = own[:, NUM_POINTS]
+    boards[:, _OPPONENT_BAR] = -opponent[:, NUM_POINTS]
+    boards[:, _OWN_OFF] = CHECKERS_PER_SIDE - own_total
+    boards[:, _OPPONENT_OFF] = opponent_total - CHECKERS_PER_SIDE
+    return boards
+
+
+def encode_position_ids(positions: Sequence[Position], sides_on_roll: Sequence[int]) -> List[str]:
+    """
+    Devuelve el Position ID de cada posición de un lote.
+
+    Args:
+        positions (Sequence[Position]): Posiciones a codificar.
+        sides_on_roll (Sequence[int]): Lado en turno de cada posición.
+
+    Returns:
+        List[str]: Un Position ID por posición.
+    """
+    if not positions:
+        return []
+    data = b"".join(position.to_bytes() for position in positions)
+    boards = np.frombuffer(data, dtype=np.int8).reshape(len(positions), NUM_SLOTS)
+    black = np.asarray(sides_on_roll) == BLACK
+    boards = np.where(black[:, None], -boards[:, _FLIP], boards)
+    return boards_to_ids(boards)
+
+
+def decode_position_ids(
+    position_ids: Sequence[str], sides_on_roll: Sequence[int],
+) -> List[Position]:
+    """
+    Reconstruye las posiciones de un lote de Position IDs.
+
+    Args:
+        position_ids (Sequence[str]): Position IDs de 14 caracteres.
+        sides_on_roll (Sequence[int]): Lado en turno de cada posición.
+
+    Returns:
+        List[Position]: Una posición por identificador.
+
+    Raises:
+        ValueError: Si algún identificador no es válido.
+    """
+    if not position_ids:
+        return []
+    boards = ids_to_boards(position_ids)
+    black = np.asarray(sides_on_roll) == BLACK
+    boards = np.where(black[:, None], -boards[:, _FLIP], boards).astype(np.int8)
+    return [Position.from_bytes(row.tobytes()) for row in boards]
+
+
+def encode_match_id(state: MatchState) -> str:
+    """
+    Devuelve el Match ID de un estado de match.
+
+    Raises:
+        ValueError: Si algún campo no entra en su cantidad de bits.
+    """
+    cube_log = state.cube_value.bit_length() - 1
+    if state.cube_value <= 0 or 1 << cube_log != state.cube_value:
+        raise ValueError("El valor del cubo debe ser una potencia de 2")
+    dice = tuple(state.dice[:2]) + (0,) * (2 - len(state.dice[:2]))
+    values = (
+        cube_log, state.cube_owner, state.dice_owner, int(state.crawford),
+        state.game_state, state.turn, int(state.doubled), state.resigned,
+        dice[0], dice[1], state.match_length, state.score[0], state.score[1],
+    )
+    key = 0
+    bit = 0
+    for (_, width), value in zip(MATCH_FIELDS, values):
+        if value < 0 or value >> width:
+            raise ValueError("Valor fuera de rango para el Match ID")
+        key |= value << bit
+        bit += width
+    return base64.b64encode(key.to_bytes(MATCH_ID_BYTES, "little")).decode("ascii")
+
+
+def decode_match_id(match_id: str) -> MatchState:
+    """
+    Decodifica un Match ID.
+
+    Raises:
+        ValueError: Si el identificador no es válido.
+    """
+    key = int.from_bytes(_decode_base64(match_id, MATCH_ID_LENGTH, MATCH_ID_BYTES), "little")
+    fields = {}
+    bit = 0
+    for name, width in MATCH_FIELDS:
+        fields[name] = key >> bit & ((1 << width) - 1)
+        bit += width
+    dice = tuple(die for die in (fields["die1"], fields["die2"]) if die)
+    if fields["cube_owner"] == 2 or fields["game_state"] > DROPPED \
+            or any(die > 6 for die in dice):
+        raise ValueError("Match ID inválido")
+    return MatchState(
+        cube_value=1 << fields["cube_log"],
+        cube_owner=fields["cube_owner"],
+        dice_owner=fields["dice_owner"],
+        crawford=bool(fields["crawford"]),
+        game_state=fields["game_state"],
+        turn=fields["turn"],
+        doubled=bool(fields["doubled"]),
+        resigned=fields["resigned"],
+        dice=dice,
+        match_length=fields["match_length"],
+        score=(fields["score0"], fields["score1"]),
+    )
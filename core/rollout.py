@@ -0,0 +1,328 @@
+"""Módulo rollout para Backgammon.
+
+Rollouts Monte Carlo: una posición se juega hasta el final (o hasta una
+profundidad de truncamiento) muchas veces con una política de bot, y se
+estiman las tasas de victoria, gammon y backgammon con sus intervalos de
+confianza.
+
+Los ensayos se reparten en bloques entre los procesos de un
+``ProcessPoolExecutor``. Cada worker recibe una sola vez la posición codificada
+en 28 bytes (``Position.to_bytes``) y crea sus propios ``RolloutDice`` con la
+semilla del rollout; como los dados de cada ensayo dependen solo de la semilla
+y del número de ensayo, el resultado no depende de la cantidad de workers.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.evaluation import Evaluator, heuristic_evaluation, terminal_value
+from core.movegen import generate_successors
+from core.position import Position
+from core.rolloutdice import OUTCOMES_PER_BLOCK, RolloutDice
+
+# Política de bot: devuelve la posición tras su jugada, o None si no puede mover.
+Policy = Callable[[Position, int, Tuple[int, ...]], Optional[Position]]
+
+# Resultado de un ensayo desde el punto de vista del lado en turno.
+Outcome = Tuple[float, float, float, float, float, float]
+METRICS: Tuple[str, ...] = (
+    "win", "win_gammon", "win_backgammon", "lose_gammon", "lose_backgammon", "equity",
+)
+
+DEFAULT_TRIALS: int = 1296
+Z_95: float = 1.959964
+
+
+def heuristic_policy(position: Position, side: int, dice: Tuple[int, ...]) -> Optional[Position]:
+    """
+    Política 0-ply: elige la jugada con mejor evaluación heurística.
+
+    Args:
+        position (Position): Posición actual (no se modifica).
+        side (int): Lado que mueve.
+        dice (Tuple[int, ...]): Dados a jugar.
+
+    Returns:
+        Optional[Position]: Posición resultante, o None si no hay jugada legal.
+    """
+    best = None
+    best_value = -math.inf
+    for _, child in generate_successors(position, side, dice):
+        value = heuristic_evaluation(child, side)
+        if value > best_value:
+            best, best_value = child, value
+    return best
+
+
+class EvaluatorPolicy:
+    """
+    Política 0-ply con un evaluador cualquiera.
+
+    Evalúa todas las jugadas de la tirada (en lote si el evaluador tiene
+    ``evaluate_batch``) y juega la mejor. Con un ``CachedEvaluator`` las
+    evaluaciones se reutilizan entre ensayos; con varios workers cada proceso
+    trabaja con su propia copia de la caché.
+    """
+
+    def __init__(self, evaluator: Evaluator) -> None:
+        """
+        Inicializa la política.
+
+        Args:
+            evaluator (Evaluator): Evaluador (debe poder serializarse con pickle
+                para usarse con varios workers).
+        """
+        self.__evaluator: Evaluator = evaluator
+
+    def get_evaluator(self) -> Evaluator:
+        """Devuelve el evaluador de la política."""
+        return self.__evaluator
+
+    def __call__(self, position: Position, side: int, dice: Tuple[int, ...]) -> Optional[Position]:
+        """Devuelve la posición tras la mejor jugada, o None si no hay jugada legal."""
+        children = [child for _, child in generate_successors(position, side, dice)]
+        if not children:
+            return None
+        batch = getattr(self.__evaluator, "evaluate_batch", None)
+        if batch is not None:
+            values = batch(children, side)
+        else:
+            values = [self.__evaluator(child, side) for child in children]
+        return children[max(range(len(children)), key=values.__getitem__)]
+
+
+def _outcome(result: int) -> Outcome:
+    """Convierte el resultado de una partida terminada en un ``Outcome``."""
+    return (
+        float(result > 0), float(result >= 2), float(result == 3),
+        float(result <= -2), float(result == -3), float(result),
+    )
+
+
+class RolloutStats:
+    """Medias acumuladas e intervalos de confianza de un rollout."""
+
+    def __init__(self) -> None:
+        """Inicializa las estadísticas sin ensayos."""
+        self.__trials: int = 0
+        self.__sums: List[float] = [0.0] * len(METRICS)
+        self.__squares: List[float] = [0.0] * len(METRICS)
+
+    def add(self, outcome: Sequence[float]) -> None:
+        """Agrega el resultado de un ensayo."""
+        self.__trials += 1
+        for index, value in enumerate(outcome):
+            self.__sums[index] += value
+            self.__squares[index] += value * value
+
+    def get_trials(self) -> int:
+        """Devuelve la cantidad de ensayos acumulados."""
+        return self.__trials
+
+    def mean(self, metric: str) -> float:
+        """
+        Devuelve la media de una métrica.
+
+        Args:
+            metric (str): Uno de los nombres de ``METRICS``.
+
+        Raises:
+            ValueError: Si la métrica no existe.
+        """
+        index = self.__index(metric)
+        if not self.__trials:
+            return 0.0
+        return self.__sums[index] / self.__trials
+
+    def interval(self, metric: str, z: float = Z_95) -> Tuple[float, float]:
+        """
+        Devuelve el intervalo de confianza normal de la media de una métrica.
+
+        Args:
+            metric (str): Uno de los nombres de ``METRICS``.
+            z (float): Cuantil normal (1.96 para el 95%).
+
+        Returns:
+            Tuple[float, float]: Extremos inferior y superior.
+        """
+        mean = self.mean(metric)
+        if self.__trials < 2:
+            return (mean, mean)
+        index = self.__index(metric)
+        variance = (self.__squares[index] - self.__trials * mean * mean) / (self.__trials - 1)
+        half_width = z * math.sqrt(max(variance, 0.0) / self.__trials)
+        return (mean - half_width, mean + half_width)
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """Devuelve ``{métrica: (media, inferior, superior)}`` para todas las métricas."""
+        return {metric: (self.mean(metric), *self.interval(metric)) for metric in METRICS}
+
+    @staticmethod
+    def __index(metric: str) -> int:
+        """Devuelve la posición de una métrica en los acumuladores."""
+        try:
+            return METRICS.index(metric)
+        except ValueError as error:
+            raise ValueError(f"Métrica desconocida: {metric}") from error
+
+
+class RolloutSettings(NamedTuple):
+    """
+    Opciones de un rollout.
+
+    La política y el evaluador deben poder serializarse con pickle (funciones de
+    módulo) cuando se usan varios workers.
+
+    Atributos:
+        trials: Cantidad de ensayos.
+        seed: Semilla del rollout.
+        policy: Política de ambos jugadores.
+        truncate: Medios turnos tras los cuales se evalúa en lugar de seguir (None: sin truncar).
+        evaluator: Evaluación usada en los ensayos truncados; si tiene
+            ``probabilities(positions, side)`` se registran también los gammons.
+        workers: Procesos; None usa todos los núcleos y 1 juega en este proceso.
+        chunk_size: Ensayos por tarea (múltiplo de 36 para conservar la estratificación).
+        antithetic: Si se usan pares de ensayos antitéticos.
+    """
+    trials: int = DEFAULT_TRIALS
+    seed: int = 0
+    policy: Policy = heuristic_policy
+    truncate: Optional[int] = None
+    evaluator: Evaluator = heuristic_evaluation
+    workers: Optional[int] = None
+    chunk_size: int = OUTCOMES_PER_BLOCK
+    antithetic: bool = False
+
+
+class _TrialRunner:
+    """Juega ensayos de una posición fija; vive en cada worker."""
+
+    def __init__(self, encoded: bytes, side: int, settings: RolloutSettings) -> None:
+        self.__position: Position = Position.from_bytes(encoded)
+        self.__side: int = side
+        self.__policy: Policy = settings.policy
+        self.__truncate: Optional[int] = settings.truncate
+        self.__evaluator: Evaluator = settings.evaluator
+        self.__probabilities = getattr(settings.evaluator, "probabilities", None)
+        self.__dice: RolloutDice = RolloutDice(settings.seed, antithetic=settings.antithetic)
+
+    def run(self, start: int, stop: int) -> List[Outcome]:
+        """Juega los ensayos ``start`` a ``stop - 1``."""
+        return [self.play_trial(trial) for trial in range(start, stop)]
+
+    def play_trial(self, trial: int) -> Outcome:
+        """
+        Juega un ensayo completo (o truncado) y devuelve su resultado.
+
+        Un ensayo truncado registra las probabilidades de victoria, gammon y
+        backgammon del evaluador si éste las ofrece (``probabilities``, como
+        ``core.neuralnet.NeuralNetwork``). Si no, solo hay una equity: se
+        registra acotada a [-1, 1] y la probabilidad de ganar se aproxima con
+        ``(equity + 1) / 2``, sin gammons.
+        """
+        dice = self.__dice
+        dice.start_trial(trial)
+        root = self.__side
+        position = self.__position
+        mover = root
+        plies = 0
+        while self.__truncate is None or plies < self.__truncate:
+            roll = dice.roll()
+            child = self.__policy(position, mover, tuple(dice.get_moves(roll)))
+            if child is not None:
+                position = child
+                result = terminal_value(position, root)
+                if result:
+                    return _outcome(result)
+            mover = 1 - mover
+            plies += 1
+        if self.__probabilities is not None:
+            probabilities = [float(value) for value in self.__probabilities([position], root)[0]]
+            # Equity sin cubo: 2p - 1 + gammons y backgammons propios - los del rival.
+            equity = (2.0 * probabilities[0] - 1.0 + probabilities[1] + probabilities[2]
+                      - probabilities[3] - probabilities[4])
+            return (*probabilities, equity)
+        # Sin probabilidades, la equity del evaluador aproxima la probabilidad de ganar.
+        equity = max(-1.0, min(1.0, self.__evaluator(position, root)))
+        return ((equity + 1.0) / 2.0, 0.0, 0.0, 0.0, 0.0, equity)
+
+
+_WORKER_RUNNER: Optional[_TrialRunner] = None
+
+
+def _init_worker(*args) -> None:
+    """Inicializador de cada proceso del pool: crea su ``_TrialRunner``."""
+    global _WORKER_RUNNER  # pylint: disable=global-statement
+    _WORKER_RUNNER = _TrialRunner(*args)
+
+
+def _run_chunk(start: int, stop: int) -> List[Outcome]:
+    """Tarea del pool: juega un bloque de ensayos con el runner del worker."""
+    return _WORKER_RUNNER.run(start, stop)
+
+
+def _chunk_outcomes(
+    init_args: Tuple[bytes, int, RolloutSettings],
+    chunks: List[Tuple[int, int]],
+    workers: int,
+) -> Iterator[List[Outcome]]:
+    """Juega los bloques en este proceso o en un pool y los devuelve a medida que terminan."""
+    if workers == 1:
+        runner = _TrialRunner(*init_args)
+        for start, stop in chunks:
+            yield runner.run(start, stop)
+        return
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=init_args
+    ) as pool:
+        futures = [pool.submit(_run_chunk, start, stop) for start, stop in chunks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def rollout(
+    position: Position, side: int, settings: RolloutSettings = RolloutSettings()
+) -> Iterator[RolloutStats]:
+    """
+    Ejecuta un rollout y va devolviendo las estadísticas a medida que terminan los bloques.
+
+    Args:
+        position (Position): Posición a evaluar (no se modifica).
+        side (int): Lado en turno, desde cuyo punto de vista se informan los resultados.
+        settings (RolloutSettings): Ensayos, semilla, política, truncamiento y workers.
+
+    Yields:
+        RolloutStats: Las estadísticas acumuladas (el mismo objeto) tras cada bloque.
+
+    Raises:
+        ValueError: Si ``trials``, ``workers`` o ``chunk_size`` no son positivos.
+    """
+    trials, chunk_size = settings.trials, settings.chunk_size
+    if trials <= 0 or chunk_size <= 0:
+        raise ValueError("La cantidad de ensayos y el tamaño de bloque deben ser positivos")
+    workers = settings.workers if settings.workers is not None else os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("La cantidad de workers debe ser positiva")
+    init_args = (position.to_bytes(), side, settings)
+    chunks = [(start, min(start + chunk_size, trials)) for start in range(0, trials, chunk_size)]
+    stats = RolloutStats()
+    for outcomes in _chunk_outcomes(init_args, chunks, workers):
+        for outcome in outcomes:
+            stats.add(outcome)
+        yield stats
+
+
+def run_rollout(
+    position: Position, side: int, settings: RolloutSettings = RolloutSettings()
+) -> RolloutStats:
+    """
+    Ejecuta un rollout completo y devuelve las estadísticas finales.
+
+    Acepta los mismos argumentos que ``rollout``.
+    """
+    stats = RolloutStats()
+    for stats in rollout(position, side, settings):
+        pass
+    return stats
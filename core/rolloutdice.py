@@ -0,0 +1,137 @@
+"""Módulo rolloutdice para Backgammon.
+
+Dados con reducción de varianza para rollouts. Cada ensayo (partida simulada)
+se identifica por su número y los dados se reinician con ``start_trial``:
+
+- Primera tirada estratificada: en cada bloque de 36 ensayos cada uno de los
+  36 resultados aparece exactamente una vez como primera tirada.
+- Números aleatorios comunes: la secuencia de un ensayo depende solo de la
+  semilla y del número de ensayo, así que todas las jugadas candidatas
+  evaluadas con el mismo ensayo ven los mismos dados.
+- Pares antitéticos: opcionalmente, el ensayo impar ``2k + 1`` usa los dados
+  espejados (``7 - d``) del ensayo ``2k``.
+"""
+
+import random
+from typing import List, Optional, Tuple
+
+from core.dice import Dice, derive_seed
+
+OUTCOMES_PER_BLOCK: int = 36
+ROLLOUT_BUFFER_SIZE: int = 128
+
+
+def mirror_roll(roll: Tuple[int, int]) -> Tuple[int, int]:
+    """Devuelve la tirada antitética (cada dado ``d`` pasa a ``7 - d``)."""
+    return (7 - roll[0], 7 - roll[1])
+
+
+class RolloutDice(Dice):
+    """Dados de seis caras para rollouts con estratificación, CRN y antitéticos."""
+
+    def __init__(self, seed: int, stratified: bool = True, antithetic: bool = False) -> None:
+        """
+        Inicializa los dados de rollout y comienza el ensayo 0.
+
+        Args:
+            seed (int): Semilla base de todos los ensayos.
+            stratified (bool): Si la primera tirada de cada ensayo se estratifica.
+            antithetic (bool): Si los ensayos se agrupan en pares antitéticos.
+        """
+        super().__init__(6, seed=seed, buffer_size=ROLLOUT_BUFFER_SIZE)
+        self.__seed: int = seed
+        self.__stratified: bool = stratified
+        self.__antithetic: bool = antithetic
+        self.__trial: int = 0
+        self.__mirror: bool = False
+        self.__first_pending: bool = False
+        self.__block: Optional[int] = None
+        self.__block_rolls: List[Tuple[int, int]] = []
+        self.start_trial(0)
+
+    def get_trial(self) -> int:
+        """Devuelve el número de ensayo en curso."""
+        return self.__trial
+
+    def is_antithetic(self) -> bool:
+        """Indica si los ensayos se agrupan en pares antitéticos."""
+        return self.__antithetic
+
+    def is_stratified(self) -> bool:
+        """Indica si la primera tirada de cada ensayo está estratificada."""
+        return self.__stratified
+
+    def start_trial(self, trial: int) -> None:
+        """
+        Reinicia los dados al comienzo del ensayo indicado.
+
+        Llamarlo con el mismo número de ensayo reproduce exactamente la misma
+        secuencia de tiradas, sin importar cuántas se consumieron antes.
+
+        Args:
+            trial (int): Número de ensayo (0 o mayor).
+
+        Raises:
+            ValueError: Si ``trial`` es negativo.
+        """
+        if trial < 0:
+            raise ValueError("El número de ensayo no puede ser negativo")
+        self.__trial = trial
+        self.__mirror = self.__antithetic and trial % 2 == 1
+        stream = trial // 2 if self.__antithetic else trial
+        self.reseed(derive_seed(self.__seed, "trial", stream))
+        self.__first_pending = self.__stratified
+
+    def roll(self) -> Tuple[int, int]:
+        """
+        Lanza los dados dentro del ensayo en curso.
+
+        Returns:
+            Tuple[int, int]: Resultado del lanzamiento de los dos dados.
+        """
+        if self.__first_pending:
+            self.__first_pending = False
+            result = self.first_roll(self.__trial)
+        else:
+            result = super().roll()
+            if self.__mirror:
+                result = mirror_roll(result)
+        self.set_last_roll(result)
+        return result
+
+    def first_roll(self, trial: int) -> Tuple[int, int]:
+        """
+        Devuelve la primera tirada estratificada del ensayo.
+
+        Cada bloque de 36 ensayos recorre una permutación aleatoria de los 36
+        resultados. Con pares antitéticos la permutación se arma por pares
+        espejados, de modo que el ensayo impar recibe el espejo del anterior y
+        el bloque sigue cubriendo cada resultado una vez.
+
+        Args:
+            trial (int): Número de ensayo.
+
+        Returns:
+            Tuple[int, int]: Primera tirada del ensayo.
+        """
+        block, offset = divmod(trial, OUTCOMES_PER_BLOCK)
+        if block != self.__block:
+            self.__block = block
+            self.__block_rolls = self.__permutation(block)
+        return self.__block_rolls[offset]
+
+    def __permutation(self, block: int) -> List[Tuple[int, int]]:
+        """Construye la permutación de primeras tiradas de un bloque."""
+        rng = random.Random(derive_seed(self.__seed, "strata", block))
+        if not self.__antithetic:
+            rolls = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+            rng.shuffle(rolls)
+            return rolls
+        # Un representante por par espejado: el espejo de (d1, d2) tiene d1 > 3
+        # si d1 < 4, así que basta con tomar d1 en 1-3.
+        leaders = [(d1, d2) for d1 in range(1, 4) for d2 in range(1, 7)]
+        rng.shuffle(leaders)
+        rolls = []
+        for leader in leaders:
+            rolls.extend((leader, mirror_roll(leader)))
+        return rolls
@@ -0,0 +1,211 @@
+"""Módulo simulation para Backgammon.
+
+Partidas automáticas entre bots sin interfaz, usando la API pública de
+``BackgammonGame`` (``roll_dice``, ``can_player_move``, ``make_move`` y
+``make_move_from_bar``). Informa el rendimiento (partidas y movimientos por
+segundo) y el tiempo acumulado de cada fase del turno:
+
+- ``roll``: lanzar los dados.
+- ``legal``: comprobar si el jugador puede mover.
+- ``decide``: elegir la jugada (bot).
+- ``apply``: aplicar los pasos en el juego.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.backgammongame import BackgammonGame
+from core.bots import BOT_FACTORIES, Bot, make_bot
+from core.dice import Dice, derive_seed
+from core.evaluation import game_result
+from core.movegen import BAR_POINT
+from core.position import SIDE_BY_COLOR, WHITE, BLACK
+
+PHASES: Tuple[str, ...] = ("roll", "legal", "decide", "apply")
+
+
+class SimulationReport(NamedTuple):
+    """
+    Resultado de una simulación.
+
+    Atributos:
+        games: Partidas jugadas.
+        turns: Turnos jugados (incluye los pasados).
+        moves: Pasos aplicados con ``make_move`` / ``make_move_from_bar``.
+        passes: Turnos sin jugada legal.
+        wins: Partidas ganadas por (blancas, negras).
+        points: Puntos ganados por (blancas, negras), contando gammons y backgammons.
+        elapsed: Segundos totales.
+        phase_times: Segundos acumulados por fase.
+    """
+    games: int
+    turns: int
+    moves: int
+    passes: int
+    wins: Tuple[int, int]
+    points: Tuple[int, int]
+    elapsed: float
+    phase_times: Dict[str, float]
+
+    def games_per_second(self) -> float:
+        """Devuelve las partidas por segundo."""
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def moves_per_second(self) -> float:
+        """Devuelve los pasos aplicados por segundo."""
+        return self.moves / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        """Devuelve el informe en texto."""
+        lines = [
+            f"Partidas: {self.games}  Turnos: {self.turns}  Pasos: {self.moves}  "
+            f"Turnos pasados: {self.passes}",
+            f"Victorias: blancas {self.wins[WHITE]}, negras {self.wins[BLACK]}  "
+            f"Puntos: blancas {self.points[WHITE]}, negras {self.points[BLACK]}",
+            f"Tiempo: {self.elapsed:.2f} s  ({self.games_per_second():.1f} partidas/s, "
+            f"{self.moves_per_second():.0f} pasos/s)",
+        ]
+        for phase in PHASES:
+            seconds = self.phase_times[phase]
+            share = seconds / self.elapsed * 100 if self.elapsed else 0.0
+            lines.append(f"  {phase:<7} {seconds:8.3f} s  {share:5.1f}%")
+        return "\n".join(lines)
+
+
+class _GameStats:
+    """Contadores mutables que acumula ``play_game``."""
+
+    def __init__(self) -> None:
+        self.turns: int = 0
+        self.moves: int = 0
+        self.passes: int = 0
+        self.phase_times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+
+def play_game(game: BackgammonGame, bots: Sequence[Bot], stats: _GameStats) -> Tuple[int, int]:
+    """
+    Juega una partida ya iniciada hasta que termine.
+
+    Args:
+        game (BackgammonGame): Juego iniciado.
+        bots (Sequence[Bot]): Bot de las blancas y bot de las negras.
+        stats (_GameStats): Contadores a actualizar.
+
+    Returns:
+        Tuple[int, int]: Lado ganador y puntos ganados (1, 2 o 3).
+
+    Raises:
+        RuntimeError: Si el juego rechaza un paso elegido por un bot.
+    """
+    times = stats.phase_times
+    clock = time.perf_counter
+    while not game.is_finished():
+        player = game.get_current_player()
+        side = SIDE_BY_COLOR[player.get_color()]
+        stats.turns += 1
+        start = clock()
+        game.roll_dice()
+        after_roll = clock()
+        can_move = game.can_player_move(player)
+        after_legal = clock()
+        times["roll"] += after_roll - start
+        times["legal"] += after_legal - after_roll
+        if not can_move:
+            stats.passes += 1
+            game.end_turn()
+            continue
+        play = bots[side].choose_play(game)
+        after_decide = clock()
+        for source, dest, _ in play:
+            if source == BAR_POINT[side]:
+                applied = game.make_move_from_bar(dest)
+            else:
+                applied = game.make_move(source, dest)
+            if not applied:
+                raise RuntimeError(f"Paso rechazado: {source} -> {dest}")
+        stats.moves += len(play)
+        # Si la jugada no usa todos los dados (por bloqueo) el turno se cierra a mano.
+        if game.has_dice_been_rolled() and not game.is_finished():
+            game.end_turn()
+        times["decide"] += after_decide - after_legal
+        times["apply"] += clock() - after_decide
+    winner = SIDE_BY_COLOR[game.get_winner().get_color()]
+    return winner, game_result(game.get_board().get_position(), winner)
+
+
+def simulate(
+    games: int,
+    white: Bot,
+    black: Bot,
+    seed: Optional[int] = None,
+) -> SimulationReport:
+    """
+    Juega ``games`` partidas completas entre dos bots.
+
+    El jugador que abre alterna entre partidas. Con ``seed`` los dados de cada
+    partida son reproducibles (y lo es toda la simulación si los bots también
+    lo son).
+
+    Args:
+        games (int): Cantidad de partidas.
+        white (Bot): Bot de las blancas.
+        black (Bot): Bot de las negras.
+        seed (Optional[int]): Semilla base de los dados.
+
+    Returns:
+        SimulationReport: Resultados y tiempos.
+
+    Raises:
+        ValueError: Si ``games`` no es positivo.
+    """
+    if games <= 0:
+        raise ValueError("La cantidad de partidas debe ser positiva")
+    if seed is None:
+        seed = random.getrandbits(64)
+    stats = _GameStats()
+    wins = [0, 0]
+    points = [0, 0]
+    start = time.perf_counter()
+    for index in range(games):
+        game = BackgammonGame(
+            f"Blancas ({white.get_name()})",
+            f"Negras ({black.get_name()})",
+            dice=Dice(seed=derive_seed(seed, "game", index)),
+        )
+        game.start_game()
+        if index % 2:
+            game.set_current_player(game.get_player2())
+        winner, value = play_game(game, (white, black), stats)
+        wins[winner] += 1
+        points[winner] += value
+    return SimulationReport(
+        games, stats.turns, stats.moves, stats.passes, (wins[0], wins[1]),
+        (points[0], points[1]), time.perf_counter() - start, stats.phase_times,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> SimulationReport:
+    """
+    Punto de entrada de línea de comandos.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (por defecto los del proceso).
+
+    Returns:
+        SimulationReport: El informe impreso.
+    """
+    parser = argparse.ArgumentParser(description="Partidas automáticas entre bots de Backgammon")
+    parser.add_argument("-n", "--games", type=int, default=100, help="cantidad de partidas")
+    parser.add_argument("--white", choices=sorted(BOT_FACTORIES), default="heuristic")
+    parser.add_argument("--black", choices=sorted(BOT_FACTORIES), default="random")
+    parser.add_argument("--seed", type=int, default=None, help="semilla de dados y bots")
+    args = parser.parse_args(argv)
+    white_seed = None if args.seed is None else derive_seed(args.seed, "white")
+    black_seed = None if args.seed is None else derive_seed(args.seed, "black")
+    report = simulate(
+        args.games, make_bot(args.white, white_seed), make_bot(args.black, black_seed), args.seed
+    )
+    print(report.format())
+    return report
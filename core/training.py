@@ -0,0 +1,339 @@
+"""Módulo training para Backgammon.
+
+Entrenamiento TD(lambda) por autojuego de ``core.neuralnet``. Las partidas se
+juegan sobre ``Position`` y ``generate_successors`` (sin objetos por ficha): en
+cada turno la red evalúa en un solo lote todas las posiciones hijas de la
+tirada y se juega la mejor. De cada partida se guarda la trayectoria de
+entradas codificadas, el lado que movió y el resultado final.
+
+El aprendizaje usa la vista hacia adelante de TD(lambda) fuera de línea: con
+los pesos fijos durante la partida, el objetivo de cada estado es el retorno
+lambda, ``G_t = (1 - lambda) V(s_t+1) + lambda G_t+1`` (espejado cuando los
+estados son de lados distintos), y el gradiente de toda la trayectoria se
+calcula con una pasada hacia atrás vectorizada.
+
+Los workers de un ``ProcessPoolExecutor`` juegan partidas con una copia de los
+pesos de cada ronda y devuelven las trayectorias a un único proceso que
+aprende y guarda puntos de control periódicos.
+
+Uso:
+    python -m core.training --games 20000 --workers 4 --output data/weights.bin
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from core.dice import Dice, derive_seed
+from core.evaluation import terminal_value
+from core.movegen import generate_successors
+from core.neuralnet import (
+    DEFAULT_HIDDEN, NUM_OUTPUTS, NetworkWeights, NeuralNetwork, encode_boards, equities,
+    load_weights, positions_to_boards, random_weights, save_weights,
+)
+from core.position import Position, SIGN
+
+DEFAULT_ALPHA: float = 0.1
+DEFAULT_LAMBDA: float = 0.7
+DEFAULT_PATH: str = "data/weights.bin"
+
+# Índices que convierten las probabilidades de un lado en las del rival:
+# (ganar, ganar gammon, ganar backgammon, perder gammon, perder backgammon).
+_MIRROR = np.array([0, 3, 4, 1, 2], dtype=np.intp)
+
+
+class Trajectory(NamedTuple):
+    """
+    Partida de autojuego.
+
+    Atributos:
+        inputs: ``(T, NUM_INPUTS)`` con la posición tras cada jugada, desde el lado que movió.
+        movers: ``(T,)`` lado que hizo cada jugada.
+        result: Resultado final desde el punto de vista de las blancas (±1, ±2 o ±3).
+    """
+    inputs: np.ndarray
+    movers: np.ndarray
+    result: int
+
+
+class TrainingSettings(NamedTuple):
+    """
+    Parámetros del entrenamiento por autojuego.
+
+    Atributos:
+        games: Partidas a jugar.
+        seed: Semilla base de las partidas (None elige una al azar).
+        alpha: Tasa de aprendizaje por estado.
+        lam: Parámetro lambda.
+        workers: Procesos; None usa todos los núcleos y 1 juega en este proceso.
+        games_per_task: Partidas por tarea de un worker.
+        checkpoint_path: Archivo donde guardar los pesos (None no guarda).
+        checkpoint_every: Partidas entre puntos de control (y al terminar).
+    """
+    games: int
+    seed: Optional[int] = None
+    alpha: float = DEFAULT_ALPHA
+    lam: float = DEFAULT_LAMBDA
+    workers: Optional[int] = None
+    games_per_task: int = 8
+    checkpoint_path: Optional[str] = None
+    checkpoint_every: int = 1000
+
+
+class TrainingProgress(NamedTuple):
+    """
+    Avance del entrenamiento.
+
+    Atributos:
+        games: Partidas jugadas.
+        positions: Estados usados para aprender.
+        white_points: Puntos netos de las blancas en las partidas jugadas.
+        elapsed: Segundos transcurridos.
+    """
+    games: int
+    positions: int
+    white_points: int
+    elapsed: float
+
+
+def mirror_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    """Convierte probabilidades ``(..., NUM_OUTPUTS)`` de un lado en las del rival."""
+    mirrored = probabilities[..., _MIRROR].copy()
+    mirrored[..., 0] = 1.0 - mirrored[..., 0]
+    return mirrored
+
+
+def outcome_vector(result: int) -> np.ndarray:
+    """Devuelve las probabilidades exactas de una partida terminada con ``result``."""
+    return np.array(
+        [result > 0, result >= 2, result == 3, result <= -2, result == -3], dtype=np.float32
+    )
+
+
+def copy_weights(weights: NetworkWeights) -> NetworkWeights:
+    """Devuelve una copia modificable de los pesos (por ejemplo, de un archivo mapeado)."""
+    return NetworkWeights(*(np.array(values, dtype=np.float32) for values in weights))
+
+
+def play_game(network: NeuralNetwork, seed: int) -> Trajectory:
+    """
+    Juega una partida de autojuego eligiendo siempre la jugada mejor evaluada.
+
+    Args:
+        network (NeuralNetwork): Red usada por ambos lados.
+        seed (int): Semilla de los dados y del lado que abre.
+
+    Returns:
+        Trajectory: Estados, lados y resultado de la partida.
+    """
+    dice = Dice(seed=seed)
+    position = Position()
+    position.setup_initial_points()
+    mover = dice.get_rng().randrange(2)
+    inputs: List[np.ndarray] = []
+    movers: List[int] = []
+    while True:
+        successors = generate_successors(position, mover, tuple(dice.get_moves(dice.roll())))
+        if successors:
+            children = [child for _, child in successors]
+            encoded = encode_boards(positions_to_boards(children, mover))
+            finished = [terminal_value(child, mover) for child in children]
+            if any(finished):
+                best = max(range(len(children)), key=finished.__getitem__)
+            else:
+                best = int(np.argmax(equities(network.forward(encoded))))
+            position = children[best]
+            inputs.append(encoded[best])
+            movers.append(mover)
+            if finished[best]:
+                return Trajectory(
+                    np.stack(inputs), np.array(movers, dtype=np.int8),
+                    finished[best] * SIGN[mover],
+                )
+        mover = 1 - mover
+
+
+def td_targets(values: np.ndarray, movers: np.ndarray, result: int, lam: float) -> np.ndarray:
+    """
+    Calcula los retornos lambda de una trayectoria.
+
+    Args:
+        values (np.ndarray): ``(T, NUM_OUTPUTS)`` salidas de la red en cada estado.
+        movers (np.ndarray): ``(T,)`` lado de cada estado.
+        result (int): Resultado final desde el punto de vista de las blancas.
+        lam (float): Parámetro lambda (0 es TD(0), 1 es Monte Carlo).
+
+    Returns:
+        np.ndarray: ``(T, NUM_OUTPUTS)`` objetivos, cada uno desde el lado de su estado.
+    """
+    count = len(movers)
+    targets = np.empty((count, NUM_OUTPUTS), dtype=np.float32)
+    last = count - 1
+    targets[last] = outcome_vector(result * SIGN[int(movers[last])])
+    for index in range(last - 1, -1, -1):
+        following = (1.0 - lam) * values[index + 1] + lam * targets[index + 1]
+        if movers[index] != movers[index + 1]:
+            following = mirror_probabilities(following)
+        targets[index] = following
+    return targets
+
+
+def td_update(
+    weights: NetworkWeights,
+    trajectory: Trajectory,
+    alpha: float = DEFAULT_ALPHA,
+    lam: float = DEFAULT_LAMBDA,
+) -> float:
+    """
+    Aplica sobre ``weights`` (en el lugar) la actualización TD(lambda) de una partida.
+
+    Args:
+        weights (NetworkWeights): Pesos modificables.
+        trajectory (Trajectory): Partida jugada.
+        alpha (float): Tasa de aprendizaje por estado.
+        lam (float): Parámetro lambda.
+
+    Returns:
+        float: Error cuadrático medio de la trayectoria antes de la actualización.
+    """
+    inputs = trajectory.inputs
+    hidden_weights, hidden_bias, output_weights, output_bias = weights
+    hidden = 1.0 / (1.0 + np.exp(-(inputs @ hidden_weights + hidden_bias)))
+    outputs = 1.0 / (1.0 + np.exp(-(hidden @ output_weights + output_bias)))
+    errors = td_targets(outputs, trajectory.movers, trajectory.result, lam) - outputs
+    output_delta = errors * outputs * (1.0 - outputs)
+    hidden_delta = (output_delta @ output_weights.T) * hidden * (1.0 - hidden)
+    output_weights += alpha * (hidden.T @ output_delta)
+    output_bias += alpha * output_delta.sum(axis=0)
+    hidden_weights += alpha * (inputs.T @ hidden_delta)
+    hidden_bias += alpha * hidden_delta.sum(axis=0)
+    return float(np.mean(errors * errors))
+
+
+def play_games(weights: NetworkWeights, seeds: Sequence[int]) -> List[Trajectory]:
+    """Juega una partida por semilla con los pesos dados (tarea de los workers)."""
+    network = NeuralNetwork(weights)
+    return [play_game(network, seed) for seed in seeds]
+
+
+def _save_checkpoint(path: str, weights: NetworkWeights) -> None:
+    """Guarda los pesos reemplazando el archivo de forma atómica."""
+    temporary = f"{path}.tmp"
+    save_weights(temporary, weights)
+    os.replace(temporary, path)
+
+
+def _play_round(
+    pool: Optional[ProcessPoolExecutor],
+    weights: NetworkWeights,
+    seeds: List[int],
+    games_per_task: int,
+) -> Iterator[Trajectory]:
+    """Juega las partidas de una ronda en el pool (o en este proceso) con los mismos pesos."""
+    tasks = [seeds[offset:offset + games_per_task]
+             for offset in range(0, len(seeds), games_per_task)]
+    if pool is None:
+        batches = [play_games(weights, task) for task in tasks]
+    else:
+        batches = list(pool.map(play_games, [weights] * len(tasks), tasks))
+    return (trajectory for batch in batches for trajectory in batch)
+
+
+def train(weights: NetworkWeights, settings: TrainingSettings) -> Iterator[TrainingProgress]:
+    """
+    Entrena por autojuego y va devolviendo el avance tras cada ronda.
+
+    En cada ronda cada worker juega ``games_per_task`` partidas con una copia de
+    los pesos; el proceso principal aplica la actualización de cada trayectoria.
+
+    Args:
+        weights (NetworkWeights): Pesos modificables; se actualizan en el lugar.
+        settings (TrainingSettings): Partidas, semilla, hiperparámetros, workers y
+            puntos de control.
+
+    Yields:
+        TrainingProgress: Avance acumulado tras cada ronda.
+
+    Raises:
+        ValueError: Si ``games``, ``workers``, ``games_per_task`` o ``checkpoint_every``
+            no son positivos.
+    """
+    workers = settings.workers if settings.workers is not None else os.cpu_count() or 1
+    games = settings.games
+    if min(games, workers, settings.games_per_task, settings.checkpoint_every) <= 0:
+        raise ValueError(
+            "Las cantidades de partidas, workers y puntos de control deben ser positivas"
+        )
+    seed = settings.seed if settings.seed is not None else random.getrandbits(64)
+    start = time.perf_counter()
+    played = positions = white_points = 0
+    next_checkpoint = settings.checkpoint_every
+    checkpoint_path = settings.checkpoint_path
+    round_size = workers * settings.games_per_task
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        while played < games:
+            seeds = [derive_seed(seed, "game", index)
+                     for index in range(played, min(played + round_size, games))]
+            for trajectory in _play_round(pool, weights, seeds, settings.games_per_task):
+                td_update(weights, trajectory, settings.alpha, settings.lam)
+                positions += len(trajectory.movers)
+                white_points += trajectory.result
+            played += len(seeds)
+            if checkpoint_path is not None and (played >= next_checkpoint or played == games):
+                _save_checkpoint(checkpoint_path, weights)
+                next_checkpoint = played + settings.checkpoint_every
+            yield TrainingProgress(played, positions, white_points, time.perf_counter() - start)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def main(argv: Optional[List[str]] = None) -> TrainingProgress:
+    """
+    Punto de entrada de línea de comandos.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (por defecto los del proceso).
+
+    Returns:
+        TrainingProgress: El avance final.
+    """
+    parser = argparse.ArgumentParser(description="Entrena la red de evaluación por autojuego")
+    parser.add_argument("-n", "--games", type=int, default=10000, help="cantidad de partidas")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="archivo de pesos")
+    parser.add_argument("--resume", action="store_true", help="continuar desde --output")
+    parser.add_argument("--hidden", type=int, default=DEFAULT_HIDDEN,
+                        help="unidades ocultas de una red nueva")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--lambda", dest="lam", type=float, default=DEFAULT_LAMBDA)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.resume:
+        weights = copy_weights(load_weights(args.output))
+    else:
+        weights = random_weights(args.hidden, args.seed)
+    progress = TrainingProgress(0, 0, 0, 0.0)
+    reported = 0
+    settings = TrainingSettings(
+        games=args.games, seed=args.seed, alpha=args.alpha, lam=args.lam, workers=args.workers,
+        checkpoint_path=args.output, checkpoint_every=args.checkpoint_every,
+    )
+    for progress in train(weights, settings):
+        if progress.games - reported >= args.checkpoint_every or progress.games == args.games:
+            reported = progress.games
+            print(f"{progress.games} partidas, {progress.positions} estados, "
+                  f"{progress.games / progress.elapsed:.1f} partidas/s")
+    print(f"Pesos guardados en {args.output}")
+    return progress
+
+
+if __name__ == "__main__":
+    main()
@@ -630,74 +630,45 @@ class TableroBackgammon:
         # Obtener movimientos válidos desde el punto seleccionado
         movimientos_validos = []
         if self.juego.has_dice_been_rolled():
-            dados_disponibles = self.juego.get_last_dice_roll()
-
-            # Manejar tuplas de cualquier longitud (dobles tienen 4 elementos)
-            if len(dados_disponibles) >= 1:
-                # Dobles: (2,2,2,2) o normales: (2,5) o parcial: (2,)
-                dados_a_procesar = list(dados_disponibles)
-            else:
-                return
-
             punto_seleccionado = self.seleccionado + 1
+            color = self.juego.get_current_player().get_color()
+            bear_destino = 25 if color == "white" else 0
 
-            # Calcular posibles destinos
-            jugador_actual = self.juego.get_current_player()
-
-            color = jugador_actual.get_color()
-            can_bear = self.juego.can_bear_off(jugador_actual)
-
-            for dado in dados_a_procesar:
-                # En Backgammon:
-                # - Fichas blancas van hacia números más altos (1->24)
-                # - Fichas negras van hacia números más bajos (24->1)
-                if jugador_actual.get_color() == "white":
-                    destino = punto_seleccionado + dado
+            # Destinos legales calculados por el motor una vez por tirada o movimiento
+            destinos = self.juego.get_legal_destinations(punto_seleccionado)
+            movimientos_validos = sorted(
+                destino - 1 for destino in destinos if 1 <= destino <= 24
+            )
+            # Bear off: dibujar el indicador si la ficha seleccionada puede salir
+            if bear_destino in destinos:
+                x_bear = self.x_bear + self.ancho_bear // 2
+                if color == "white":
+                    # Posición para blancas: en el cuarto superior del área de bear off
+                    y_bear = self.y_bear + self.alto_tablero // 4
+                    pygame.draw.circle(
+                        self.pantalla,
+                        self.colores["mov_valido"],
+                        (x_bear, y_bear),
+                        self.radio_ficha + 8,
+                        3
+                    )
+                    # También dibujar un círculo más grande para mejor visibilidad
+                    pygame.draw.circle(
+                        self.pantalla,
+                        self.colores["mov_valido"],
+                        (x_bear, y_bear),
+                        self.radio_ficha + 12,
+                        2
+                    )
                 else:
-                    destino = punto_seleccionado - dado
-
-                # Movimientos normales en el tablero
-                if 1 <= destino <= 24:
-                    if self.juego.is_valid_move(punto_seleccionado, destino):
-                        movimientos_validos.append(destino - 1)  # Convertir a índice 0-based
-
-            # Bear off: verificar SIEMPRE si puede sacar fichas (fuera del bucle de dados)
-            if can_bear:
-                if color == "white" and 19 <= punto_seleccionado <= 24:
-                    # Verificar si el bear off es válido con los dados disponibles
-                    if self.juego.is_valid_move(punto_seleccionado, 25):
-                        # Dibujar indicador de bear off en zona de bear off para BLANCAS (arriba)
-                        x_bear = self.x_bear + self.ancho_bear // 2
-                        # Posición para blancas: en el cuarto superior del área de bear off
-                        y_bear = self.y_bear + self.alto_tablero // 4
-                        pygame.draw.circle(
-                            self.pantalla,
-                            self.colores["mov_valido"],
-                            (x_bear, y_bear),
-                            self.radio_ficha + 8,
-                            3
-                        )
-                        # También dibujar un círculo más grande para mejor visibilidad
-                        pygame.draw.circle(
-                            self.pantalla,
-                            self.colores["mov_valido"],
-                            (x_bear, y_bear),
-                            self.radio_ficha + 12,
-                            2
-                        )
-                elif color == "black" and 1 <= punto_seleccionado <= 6:
-                    # Verificar si el bear off es válido con los dados disponibles
-                    if self.juego.is_valid_move(punto_seleccionado, 0):
-                        # Dibujar indicador de bear off en zona de bear off
-                        x_bear = self.x_bear + self.ancho_bear // 2
-                        y_bear = self.y_bear + 3 * self.alto_tablero // 4
-                        pygame.draw.circle(
-                            self.pantalla,
-                            self.colores["mov_valido"],
-                            (x_bear, y_bear),
-                            self.radio_ficha + 8,
-                            3
-                        )
+                    y_bear = self.y_bear + 3 * self.alto_tablero // 4
+                    pygame.draw.circle(
+                        self.pantalla,
+                        self.colores["mov_valido"],
+                        (x_bear, y_bear),
+                        self.radio_ficha + 8,
+                        3
+                    )
 
         # Dibujar círculos de destino válidos
         for destino_idx in movimientos_validos:
@@ -0,0 +1,11 @@
+"""Punto de entrada para simular partidas entre bots sin interfaz.
+
+Uso:
+    python simulate.py --games 100 --white heuristic --black random --seed 1
+"""
+
+from core.simulation import main
+
+
+if __name__ == "__main__":
+    main()
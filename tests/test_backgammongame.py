@@ -2,10 +2,13 @@
 Tests unitarios para la clase BackgammonGame.
 """
 import unittest
+from unittest.mock import patch
 from core.backgammongame import BackgammonGame
 from core.player import Player
 from core.board import Board
 from core.dice import Dice
+from core.checker import Checker
+from core.position import WHITE, BLACK, BAR_SLOT
 # pylint: disable=C0116  # many simple test methods without individual docstrings
 
 class TestBackgammonGame(unittest.TestCase):
@@ -1358,6 +1361,291 @@ class TestBackgammonGame(unittest.TestCase):
         if result:
             self.assertGreaterEqual(len(board.points[0]), 1)
 
+    def _roll(self, game, roll):
+        with patch.object(game.get_dice(), "roll", return_value=roll):
+            return game.roll_dice()
+
+    def test_game_position_hash_matches_full_recompute(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        self.__game__.make_move(19, 20)
+        position = self.__game__.get_board().get_position()
+        self.assertEqual(position.position_hash(), position.compute_hash())
+
+    def test_game_position_hash_includes_side_and_dice(self):
+        self.__game__.start_game()
+        before_roll = self.__game__.position_hash()
+        self._roll(self.__game__, (6, 5))
+        after_roll = self.__game__.position_hash()
+        self.assertNotEqual(before_roll, after_roll)
+        self.__game__.switch_player()
+        self.assertNotEqual(after_roll, self.__game__.position_hash())
+
+    def test_game_position_hash_transposition(self):
+        game2 = BackgammonGame()
+        for game, order in ((self.__game__, ((1, 7), (12, 18))), (game2, ((12, 18), (1, 7)))):
+            game.start_game()
+            self._roll(game, (6, 6))
+            for from_point, to_point in order:
+                self.assertTrue(game.make_move(from_point, to_point))
+        self.assertEqual(self.__game__.position_hash(), game2.position_hash())
+
+    def test_game_clone_is_independent(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        clone = self.__game__.clone()
+        self.assertEqual(clone.position_hash(), self.__game__.position_hash())
+        self.assertTrue(clone.make_move(17, 20))
+        self.assertNotEqual(clone.position_hash(), self.__game__.position_hash())
+        self.assertEqual(self.__game__.get_board().get_checkers_count_on_point(16), 3)
+        self.assertEqual(self.__game__.get_last_dice_roll(), (3, 1))
+        self.assertIs(clone.get_player1(), self.__game__.get_player1())
+
+    def test_game_get_legal_plays_opening(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        plays = self.__game__.get_legal_plays()
+        self.assertEqual(len(plays), 16)
+        self.assertIn(((17, 20, 3), (19, 20, 1)), plays)
+        self.assertEqual(self.__game__.get_possible_moves_count(), 16)
+        self.assertFalse(self.__game__.is_forced_move())
+        self.assertEqual(self.__game__.get_forced_moves(), [])
+
+    def test_game_forced_move_single_play(self):
+        self.__game__.start_game()
+        board = self.__game__.get_board()
+        player1 = self.__game__.get_player1()
+        player2 = self.__game__.get_player2()
+        board.points = [[] for _ in range(24)]
+        board.points[0] = [Checker(player1)]
+        board.points[11] = [Checker(player2), Checker(player2)]
+        self._roll(self.__game__, (5, 6))
+        self.assertTrue(self.__game__.is_forced_move())
+        self.assertEqual(self.__game__.get_forced_moves(), [(1, 7, 6)])
+
+    def test_game_legal_plays_without_dice(self):
+        self.assertEqual(self.__game__.get_legal_plays(), [])
+
+    def test_game_move_records_history(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        history = self.__game__.get_move_history()
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0].get_step(), (17, 20, 3))
+        self.assertEqual(history[0].dice_before, (3, 1))
+        self.assertFalse(history[0].ended_turn)
+
+    def test_game_undo_restores_full_turn(self):
+        self.__game__.start_game()
+        start_hash = self.__game__.get_board().position_hash()
+        self._roll(self.__game__, (3, 1))
+        rolled_hash = self.__game__.position_hash()
+        self.__game__.make_move(17, 20)
+        self.__game__.make_move(19, 20)
+        self.assertEqual(self.__game__.get_current_player(), self.__game__.get_player2())
+        self.assertTrue(self.__game__.undo_last_move())
+        self.assertEqual(self.__game__.get_current_player(), self.__game__.get_player1())
+        self.assertEqual(self.__game__.get_last_dice_roll(), (1,))
+        self.assertEqual(self.__game__.get_turn_number(), 1)
+        self.assertTrue(self.__game__.undo_last_move())
+        self.assertEqual(self.__game__.get_last_dice_roll(), (3, 1))
+        self.assertEqual(self.__game__.get_moves_count(), 0)
+        self.assertEqual(self.__game__.position_hash(), rolled_hash)
+        self.assertEqual(self.__game__.get_board().position_hash(), start_hash)
+        self.assertFalse(self.__game__.undo_last_move())
+
+    def test_game_redo_replays_undone_moves(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        self.__game__.make_move(19, 20)
+        final_hash = self.__game__.position_hash()
+        self.__game__.undo_last_move()
+        self.__game__.undo_last_move()
+        self.assertTrue(self.__game__.can_redo_move())
+        self.assertTrue(self.__game__.redo_move())
+        self.assertTrue(self.__game__.redo_move())
+        self.assertFalse(self.__game__.redo_move())
+        self.assertEqual(self.__game__.position_hash(), final_hash)
+        self.assertEqual(self.__game__.get_turn_number(), 2)
+
+    def test_game_redo_does_not_survive_turn(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (5, 6))
+        self.assertTrue(self.__game__.make_move(12, 17))
+        self.__game__.undo_last_move()
+        self.__game__.end_turn()
+        self.assertFalse(self.__game__.can_redo_move())
+        self._roll(self.__game__, (6, 4))
+        self.assertFalse(self.__game__.redo_move())
+        self.assertEqual(self.__game__.get_current_player(), self.__game__.get_player2())
+        self.assertEqual(self.__game__.get_last_dice_roll(), (6, 4))
+
+    def test_game_new_roll_discards_redo(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (5, 6))
+        self.__game__.make_move(12, 17)
+        self.__game__.undo_last_move()
+        self._roll(self.__game__, (3, 1))
+        self.assertFalse(self.__game__.can_redo_move())
+
+    def test_game_redo_requires_same_player(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (5, 6))
+        self.__game__.make_move(12, 17)
+        self.__game__.undo_last_move()
+        self.__game__.switch_player()
+        self.assertFalse(self.__game__.redo_move())
+        self.__game__.switch_player()
+        self.assertTrue(self.__game__.redo_move())
+
+    def test_game_new_move_discards_redo(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        self.__game__.undo_last_move()
+        self.__game__.make_move(1, 2)
+        self.assertFalse(self.__game__.can_redo_move())
+
+    def test_game_undo_restores_hit_checker(self):
+        self.__game__.start_game()
+        board = self.__game__.get_board()
+        player1 = self.__game__.get_player1()
+        player2 = self.__game__.get_player2()
+        board.points = [[] for _ in range(24)]
+        board.points[0] = [Checker(player1)]
+        board.points[2] = [Checker(player2)]
+        self._roll(self.__game__, (2, 5))
+        self.assertTrue(self.__game__.make_move(1, 3))
+        self.assertTrue(self.__game__.get_move_history()[-1].was_hit())
+        self.assertEqual(len(board.bar["black"]), 1)
+        self.__game__.undo_last_move()
+        self.assertEqual(len(board.bar["black"]), 0)
+        self.assertEqual(board.get_point_owner(2), player2)
+        self.assertEqual(board.get_point_owner(0), player1)
+
+    def test_game_undo_winning_move(self):
+        self.__game__.start_game()
+        board = self.__game__.get_board()
+        player1 = self.__game__.get_player1()
+        board.points = [[] for _ in range(24)]
+        board.bear_off["white"] = [Checker(player1) for _ in range(14)]
+        board.points[23] = [Checker(player1)]
+        self._roll(self.__game__, (1, 2))
+        self.assertTrue(self.__game__.make_move(24, 25))
+        self.assertTrue(self.__game__.is_finished())
+        self.__game__.undo_last_move()
+        self.assertFalse(self.__game__.is_finished())
+        self.assertIsNone(self.__game__.get_winner())
+        self.assertEqual(board.get_checkers_count_on_point(23), 1)
+
+    def test_game_move_must_follow_direction(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.assertTrue(self.__game__.is_valid_move(17, 20))
+        self.assertFalse(self.__game__.is_valid_move(17, 14))
+
+    def test_game_checker_on_bar_must_enter_first(self):
+        self.__game__.start_game()
+        board = self.__game__.get_board()
+        player1 = self.__game__.get_player1()
+        board.points[0].pop()
+        board.bar["white"] = [Checker(player1)]
+        self._roll(self.__game__, (3, 1))
+        self.assertFalse(self.__game__.is_valid_move(17, 20))
+        self.assertEqual(
+            sorted(self.__game__.get_available_moves()), [(0, 1, 1), (0, 3, 3)]
+        )
+        self.assertFalse(self.__game__.make_move_from_bar(2))
+        self.assertTrue(self.__game__.make_move_from_bar(3))
+
+    def test_game_bear_off_with_higher_die_uses_rearmost(self):
+        self.__game__.start_game()
+        board = self.__game__.get_board()
+        player1 = self.__game__.get_player1()
+        board.points = [[] for _ in range(24)]
+        board.points[20] = [Checker(player1)]
+        board.points[22] = [Checker(player1)]
+        board.bear_off["white"] = [Checker(player1) for _ in range(13)]
+        self._roll(self.__game__, (6, 5))
+        self.assertTrue(self.__game__.is_valid_move(21, 25))
+        self.assertFalse(self.__game__.is_valid_move(23, 25))
+        self.assertTrue(self.__game__.make_move(21, 25))
+        self.assertEqual(self.__game__.get_last_dice_roll(), (6,))
+
+
+    def test_game_pip_count_follows_moves(self):
+        self.__game__.start_game()
+        player1 = self.__game__.get_player1()
+        self.assertEqual(self.__game__.get_pip_count(player1), 167)
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        self.assertEqual(self.__game__.get_pip_count(player1), 164)
+
+    def test_game_player_checkers_follow_board(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.__game__.make_move(17, 20)
+        positions = [c.get_position() for c in self.__game__.get_player1_checkers()]
+        self.assertEqual(positions.count(19), 1)
+        self.assertEqual(positions.count(16), 2)
+
+
+    def test_game_legal_destinations(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.assertEqual(self.__game__.get_legal_destinations(17), frozenset({18, 20}))
+        self.assertEqual(self.__game__.get_legal_destinations(5), frozenset())
+
+    def test_game_legal_steps_refresh_after_move(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.assertTrue(self.__game__.is_valid_move(17, 18))
+        self.__game__.make_move(17, 20)
+        self.assertFalse(self.__game__.is_valid_move(17, 20))
+        self.assertTrue(self.__game__.is_valid_move(17, 18))
+        self.assertEqual(self.__game__.get_legal_destinations(20), frozenset({21}))
+
+    def test_game_legal_steps_refresh_after_board_change(self):
+        self.__game__.start_game()
+        self._roll(self.__game__, (3, 1))
+        self.assertTrue(self.__game__.is_valid_move(17, 20))
+        board = self.__game__.get_board()
+        board.points[19] = [Checker(self.__game__.get_player2()) for _ in range(2)]
+        self.assertFalse(self.__game__.is_valid_move(17, 20))
+
+
+    def test_game_accepts_injected_dice(self):
+        dice = Dice(seed=11)
+        game = BackgammonGame("Ana", "Beto", dice=dice)
+        self.assertIs(game.get_dice(), dice)
+        expected = Dice(seed=11).roll()
+        game.start_game()
+        self.assertEqual(game.roll_dice(), expected)
+
+    def test_game_clone_dice_are_independent(self):
+        game = BackgammonGame("Ana", "Beto", dice=Dice(seed=4))
+        game.start_game()
+        clone = game.clone()
+        self.assertEqual(clone.roll_dice(), game.roll_dice())
+
+    def test_game_can_player_move_detects_blocked_entry(self):
+        self.__game__.start_game()
+        position = self.__game__.get_board().get_position()
+        position.clear()
+        position.add_checkers(BAR_SLOT[WHITE], WHITE)
+        for slot in range(6):
+            position.add_checkers(slot, BLACK, 2)
+        player = self.__game__.get_current_player()
+        self.assertFalse(self.__game__.can_player_move(player))
+        self._roll(self.__game__, (3, 1))
+        self.assertFalse(self.__game__.can_player_move(player))
+        position.remove_checkers(2, BLACK, 2)
+        self.assertTrue(self.__game__.can_player_move(player))
+        self.assertFalse(self.__game__.can_player_move(self.__game__.get_player2()))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+'''Tests unitarios para los dados por lotes.'''
+import unittest
+import numpy as np
+from core.dice import Dice
+from core.batchdice import (
+    BatchDice, OUTCOMES, OUTCOME_MOVES, MOVE_VALUES, MOVE_COUNTS, outcome_index,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestBatchDice(unittest.TestCase):
+    '''Clase de tests para BatchDice.'''
+
+    def setUp(self):
+        self.__dice__ = BatchDice(1000, seed=123, block_turns=4)
+
+    def test_roll_shape_and_range(self):
+        rolls = self.__dice__.roll()
+        self.assertEqual(rolls.shape, (1000, 2))
+        self.assertEqual(rolls.dtype, np.uint8)
+        self.assertTrue(((rolls >= 1) & (rolls <= 6)).all())
+
+    def test_rolls_are_reproducible(self):
+        other = BatchDice(1000, seed=123, block_turns=4)
+        for _ in range(10):
+            np.testing.assert_array_equal(self.__dice__.roll_indices(), other.roll_indices())
+
+    def test_last_roll_matches_indices(self):
+        rolls = self.__dice__.roll()
+        np.testing.assert_array_equal(self.__dice__.get_last_roll(), rolls)
+        np.testing.assert_array_equal(outcome_index(rolls), self.__dice__.get_last_indices())
+
+    def test_outcome_tables_match_dice_get_moves(self):
+        dice = Dice()
+        for index, (die1, die2) in enumerate(OUTCOMES):
+            roll = (int(die1), int(die2))
+            self.assertEqual(list(OUTCOME_MOVES[index]), dice.get_moves(roll))
+            self.assertEqual(BatchDice.get_moves(index), OUTCOME_MOVES[index])
+            count = MOVE_COUNTS[index]
+            self.assertEqual(tuple(MOVE_VALUES[index, :count]), OUTCOME_MOVES[index])
+
+    def test_all_outcomes_appear(self):
+        self.assertEqual(len(np.unique(self.__dice__.roll_indices())), 36)
+
+    def test_is_double(self):
+        rolls = np.array([[3, 3], [2, 5]], dtype=np.uint8)
+        np.testing.assert_array_equal(BatchDice.is_double(rolls), [True, False])
+
+    def test_worker_streams_differ(self):
+        first = BatchDice.for_worker(1, 0, 50).roll_indices()
+        second = BatchDice.for_worker(1, 1, 50).roll_indices()
+        self.assertFalse(np.array_equal(first, second))
+
+    def test_invalid_size_raises(self):
+        with self.assertRaises(ValueError):
+            BatchDice(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
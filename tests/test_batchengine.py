@@ -0,0 +1,104 @@
+'''Tests unitarios para el motor por lotes.'''
+import unittest
+import numpy as np
+from core.batchdice import BatchDice
+from core.batchengine import (
+    BatchGameEngine, FLIP, initial_boards, greedy_policy,
+)
+from core.evaluation import game_result
+from core.movegen import legal_steps
+from core.position import Position, WHITE, BLACK, CHECKERS_PER_SIDE
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+def _expected_steps(engine, index):
+    position = engine.get_position(index)
+    side = int(engine.get_sides()[index])
+    steps = set()
+    for die in set(int(value) for value in engine.get_dice()[index] if value):
+        steps |= set(legal_steps(position, side, die))
+    return steps
+
+
+class TestBatchGameEngine(unittest.TestCase):
+    '''Clase de tests para BatchGameEngine.'''
+
+    def setUp(self):
+        self.__engine__ = BatchGameEngine(16, seed=3)
+
+    def test_starts_in_initial_position(self):
+        position = Position()
+        position.setup_initial_points()
+        self.assertEqual(self.__engine__.get_position(5), position)
+        self.assertTrue((self.__engine__.get_sides() == WHITE).all())
+        self.assertFalse(self.__engine__.get_finished().any())
+
+    def test_flip_is_an_involution(self):
+        boards = initial_boards(2)
+        self.assertTrue((boards[:, FLIP][:, FLIP] == boards).all())
+
+    def test_legal_steps_match_movegen(self):
+        for policy_engine in (self.__engine__, BatchGameEngine(16, seed=4, policy=greedy_policy)):
+            for _ in range(60):
+                policy_engine.roll()
+                for _ in range(4):
+                    for index in np.flatnonzero(~policy_engine.get_finished()):
+                        self.assertEqual(policy_engine.legal_steps(index),
+                                         _expected_steps(policy_engine, index))
+                    if not policy_engine.play_step():
+                        break
+                policy_engine.end_turn()
+
+    def test_turn_switches_side_and_mirrors_board(self):
+        self.__engine__.play_turn()
+        self.assertTrue((self.__engine__.get_sides() == BLACK).all())
+        self.assertEqual(self.__engine__.get_turns(), 1)
+        for index in range(16):
+            position = self.__engine__.get_position(index)
+            self.assertEqual(position.get_side_count(23, BLACK), 2)
+            self.assertNotEqual(position.pip_count(WHITE), 167)
+
+    def test_checkers_are_conserved(self):
+        for _ in range(40):
+            self.__engine__.play_turn()
+        boards = self.__engine__.get_boards()
+        white = np.where(boards > 0, boards, 0).sum(axis=1)
+        black = np.where(boards < 0, -boards, 0).sum(axis=1)
+        self.assertTrue((white == CHECKERS_PER_SIDE).all())
+        self.assertTrue((black == CHECKERS_PER_SIDE).all())
+
+    def test_run_finishes_every_game(self):
+        self.__engine__.run()
+        winners = self.__engine__.get_winners()
+        results = self.__engine__.get_results()
+        self.assertTrue(self.__engine__.get_finished().all())
+        for index in range(16):
+            position = self.__engine__.get_position(index)
+            self.assertEqual(position.get_off(int(winners[index])), CHECKERS_PER_SIDE)
+            self.assertEqual(results[index], game_result(position, int(winners[index])))
+        self.assertGreater(self.__engine__.get_steps(), 16 * 15)
+
+    def test_run_is_reproducible(self):
+        other = BatchGameEngine(16, seed=3)
+        self.__engine__.run(30)
+        other.run(30)
+        self.assertTrue((self.__engine__.get_boards() == other.get_boards()).all())
+
+    def test_run_respects_turn_limit(self):
+        self.assertEqual(self.__engine__.run(max_turns=3), 3)
+        self.assertEqual(self.__engine__.get_turns(), 3)
+
+    def test_reset_restores_initial_state(self):
+        self.__engine__.run(10)
+        self.__engine__.reset()
+        self.assertEqual(self.__engine__.get_turns(), 0)
+        self.assertTrue((self.__engine__.get_boards() == initial_boards(16)).all())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            BatchGameEngine(0)
+        with self.assertRaises(ValueError):
+            BatchGameEngine(4, dice=BatchDice(8))
+
+
+if __name__ == '__main__':
+    unittest.main()
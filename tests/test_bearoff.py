@@ -0,0 +1,99 @@
+'''Tests unitarios para la base de bear off de un solo lado.'''
+import os
+import shutil
+import tempfile
+import unittest
+from core.bearoff import (
+    BearoffDatabase, generate_distributions, home_counts, make_bearoff_evaluator,
+    position_count, rank_counts, unrank_counts, write_database,
+)
+from core.position import Position, WHITE, BLACK
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestBearoff(unittest.TestCase):
+    '''Clase de tests para la base de bear off.'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "bearoff1.bin")
+        write_database(cls.path, 4)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.__database__ = BearoffDatabase(self.path)
+
+    def test_rank_is_a_bijection(self):
+        total = position_count(4)
+        self.assertEqual(total, 210)
+        ranks = [rank_counts(unrank_counts(rank, 4)) for rank in range(total)]
+        self.assertEqual(ranks, list(range(total)))
+        self.assertEqual(rank_counts((0,) * 6), 0)
+        with self.assertRaises(ValueError):
+            unrank_counts(total, 4)
+
+    def test_distributions_sum_to_one(self):
+        distributions = generate_distributions(3)
+        for row in distributions:
+            self.assertAlmostEqual(row.sum(), 1.0)
+
+    def test_database_is_loaded_lazily(self):
+        self.assertFalse(self.__database__.is_loaded())
+        self.assertEqual(self.__database__.get_checkers(), 4)
+        self.assertTrue(self.__database__.is_loaded())
+
+    def test_known_distributions(self):
+        self.assertAlmostEqual(self.__database__.expected_rolls((2, 0, 0, 0, 0, 0)), 1.0)
+        single_six = self.__database__.distribution((0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(single_six[1], 27 / 36, places=4)
+        self.assertAlmostEqual(single_six[2], 9 / 36, places=4)
+        with self.assertRaises(ValueError):
+            self.__database__.distribution((5, 0, 0, 0, 0, 0))
+
+    def test_home_counts(self):
+        position = Position()
+        position.add_checkers(23, WHITE, 2)
+        position.add_checkers(18, WHITE)
+        position.add_checkers(4, BLACK, 3)
+        self.assertEqual(home_counts(position, WHITE), (2, 0, 0, 0, 0, 1))
+        self.assertEqual(home_counts(position, BLACK), (0, 0, 0, 0, 3, 0))
+        position.add_checkers(10, WHITE)
+        self.assertIsNone(home_counts(position, WHITE))
+
+    def test_win_probability(self):
+        position = Position()
+        position.add_checkers(23, WHITE, 2)
+        position.add_checkers(0, BLACK, 2)
+        self.assertAlmostEqual(self.__database__.win_probability(position, WHITE), 1.0)
+        position.clear()
+        position.add_checkers(18, WHITE)
+        position.add_checkers(5, BLACK)
+        on_roll = self.__database__.win_probability(position, WHITE)
+        self.assertAlmostEqual(on_roll, 27 / 36 + 9 / 36 * 9 / 36, places=4)
+        position.add_checkers(12, WHITE)
+        self.assertIsNone(self.__database__.win_probability(position, WHITE))
+
+    def test_evaluator_uses_database(self):
+        evaluator = make_bearoff_evaluator(self.__database__)
+        position = Position()
+        position.add_checkers(18, WHITE)
+        position.add_checkers(5, BLACK)
+        # Las blancas acaban de jugar: el turno es de las negras.
+        black_wins = self.__database__.win_probability(position, BLACK)
+        self.assertAlmostEqual(evaluator(position, WHITE), 1 - 2 * black_wins)
+        position.setup_initial_points()
+        self.assertLess(abs(evaluator(position, WHITE)), 1.0)
+
+    def test_invalid_file(self):
+        path = os.path.join(self.directory, "invalid.bin")
+        with open(path, "wb") as handle:
+            handle.write(b"XXXX")
+        with self.assertRaises(ValueError):
+            BearoffDatabase(path).get_checkers()
+
+
+if __name__ == '__main__':
+    unittest.main()
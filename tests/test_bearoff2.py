@@ -0,0 +1,97 @@
+'''Tests unitarios para la base de bear off de dos lados.'''
+import os
+import shutil
+import tempfile
+import unittest
+from core.bearoff import BearoffDatabase, make_bearoff_evaluator, position_count, rank_counts
+from core.bearoff import write_database as write_one_sided
+from core.bearoff2 import TwoSidedBearoffDatabase, build_children, write_database
+from core.position import Position, WHITE, BLACK
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestTwoSidedBearoff(unittest.TestCase):
+    '''Clase de tests para la base de dos lados.'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "bearoff2.bin")
+        write_database(cls.path, 3)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.__database__ = TwoSidedBearoffDatabase(self.path)
+
+    def test_children_cover_every_roll(self):
+        children = build_children(2)
+        self.assertEqual(len(children), position_count(2))
+        self.assertTrue(all(len(rolls) == 21 for rolls in children))
+        # Dos fichas en el punto 1 terminan con cualquier tirada.
+        finals = children[rank_counts((2, 0, 0, 0, 0, 0))]
+        self.assertTrue(all(list(rank) == [0] for rank in finals))
+
+    def test_single_checker_race(self):
+        self.assertFalse(self.__database__.is_loaded())
+        value = self.__database__.lookup((0, 0, 0, 0, 0, 1), (0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(value, 27 / 36 + 9 / 36 * 9 / 36, places=4)
+        value = self.__database__.lookup((1, 0, 0, 0, 0, 0), (3, 0, 0, 0, 0, 0))
+        self.assertAlmostEqual(value, 1.0)
+        self.assertEqual(self.__database__.get_checkers(), 3)
+
+    def test_win_probability_from_position(self):
+        position = Position()
+        position.add_checkers(20, WHITE, 2)
+        position.add_checkers(1, BLACK, 3)
+        expected = self.__database__.lookup((0, 0, 0, 2, 0, 0), (0, 3, 0, 0, 0, 0))
+        self.assertAlmostEqual(self.__database__.win_probability(position, WHITE), expected)
+        position.add_checkers(2, BLACK)
+        self.assertIsNone(self.__database__.win_probability(position, WHITE))
+        with self.assertRaises(ValueError):
+            self.__database__.lookup((4, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0))
+
+    def test_agrees_with_one_sided_for_single_checkers(self):
+        one_sided_path = os.path.join(self.directory, "bearoff1.bin")
+        write_one_sided(one_sided_path, 1)
+        one_sided = BearoffDatabase(one_sided_path)
+        for own in range(6):
+            for other in range(6):
+                position = Position()
+                position.add_checkers(23 - own, WHITE)
+                position.add_checkers(other, BLACK)
+                self.assertAlmostEqual(self.__database__.win_probability(position, WHITE),
+                                       one_sided.win_probability(position, WHITE), places=4)
+
+    def test_parallel_generation_matches_serial(self):
+        path = os.path.join(self.directory, "parallel.bin")
+        write_database(path, 3, workers=2)
+        with open(path, "rb") as parallel, open(self.path, "rb") as serial:
+            self.assertEqual(parallel.read(), serial.read())
+
+    def test_evaluator_accepts_two_sided_database(self):
+        evaluator = make_bearoff_evaluator(self.__database__)
+        position = Position()
+        position.add_checkers(18, WHITE)
+        position.add_checkers(5, BLACK)
+        self.assertAlmostEqual(evaluator(position, WHITE),
+                               1 - 2 * self.__database__.win_probability(position, BLACK))
+
+    def test_formats_are_not_interchangeable(self):
+        one_sided_path = os.path.join(self.directory, "format1.bin")
+        write_one_sided(one_sided_path, 1)
+        with self.assertRaises(ValueError):
+            TwoSidedBearoffDatabase(one_sided_path).get_checkers()
+        with self.assertRaises(ValueError):
+            BearoffDatabase(self.path).get_checkers()
+        with open(self.path, "rb") as handle:
+            self.assertEqual(len(handle.read()), 6 + 2 * position_count(3) ** 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            write_database(os.path.join(self.directory, "x.bin"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
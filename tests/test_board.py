@@ -304,6 +304,15 @@ class TestBoard(unittest.TestCase):
             self.__board__.get_checkers_count_on_point(0),
         )
 
+    def test_board_copy_is_independent_and_shares_players(self):
+        self.__board__.setup_initial_position(self.__player1__, self.__player2__)
+        board_copy = self.__board__.copy()
+        board_copy.remove_checker_from_point(0)
+        self.assertEqual(self.__board__.get_checkers_count_on_point(0), 2)
+        self.assertEqual(board_copy.get_checkers_count_on_point(0), 1)
+        self.assertIs(board_copy.get_point_owner(11), self.__board__.get_point_owner(11))
+        self.assertEqual(board_copy.position_hash(), board_copy.get_position().compute_hash())
+
     def test_board_string_representation(self):
         board_str = str(self.__board__)
         self.assertIsInstance(board_str, str)
@@ -344,6 +353,12 @@ class TestBoard(unittest.TestCase):
         pip_count = self.__board__.calculate_pip_count(self.__player1__)
         self.assertEqual(pip_count, 0)
 
+    def test_board_pip_count_counts_bar(self):
+        self.__board__.setup_initial_position(self.__player1__, self.__player2__)
+        self.__board__.points[0].pop()
+        self.__board__.add_checker_to_bar(Checker(self.__player1__))
+        self.assertEqual(self.__board__.calculate_pip_count(self.__player1__), 167 - 24 + 25)
+
     def test_board_get_moves_to_bear_off(self):
         for i in range(19, 24):
             checker = Checker(self.__player1__)
@@ -367,6 +382,32 @@ class TestBoard(unittest.TestCase):
         self.__board__.setup_initial_position(self.__player1__, self.__player2__)
         self.assertFalse(self.__board__.is_race_position())
 
+    def test_board_backed_by_position_counts(self):
+        self.__board__.setup_initial_position(self.__player1__, self.__player2__)
+        cells = self.__board__.get_position().get_cells()
+        self.assertEqual(cells[0], 2)
+        self.assertEqual(cells[5], -5)
+
+    def test_board_points_view_assignment(self):
+        self.__board__.points[3] = [Checker(self.__player2__), Checker(self.__player2__)]
+        self.assertEqual(self.__board__.get_checkers_count_on_point(3), 2)
+        self.assertEqual(self.__board__.points[3][0].get_owner(), self.__player2__)
+
+    def test_board_points_view_rejects_mixed_owners(self):
+        with self.assertRaises(ValueError):
+            self.__board__.points[3] = [Checker(self.__player1__), Checker(self.__player2__)]
+
+    def test_board_bar_view_append_and_pop(self):
+        self.__board__.bar["black"].append(Checker(self.__player2__))
+        self.assertEqual(len(self.__board__.bar["black"]), 1)
+        checker = self.__board__.bar["black"].pop()
+        self.assertEqual(checker.get_owner(), self.__player2__)
+        self.assertEqual(self.__board__.get_bar_checkers_count(self.__player2__), 0)
+
+    def test_board_bear_off_view_assignment(self):
+        self.__board__.bear_off["white"] = [Checker(self.__player1__) for _ in range(4)]
+        self.assertEqual(self.__board__.get_off_board_checkers_count(self.__player1__), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
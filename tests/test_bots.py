@@ -0,0 +1,42 @@
+'''Tests unitarios para los bots.'''
+import unittest
+from unittest.mock import patch
+from core.backgammongame import BackgammonGame
+from core.bots import Bot, RandomBot, ExpectimaxBot, make_bot
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestBots(unittest.TestCase):
+    '''Clase de tests para los bots.'''
+
+    def setUp(self):
+        self.__game__ = BackgammonGame()
+        self.__game__.start_game()
+        with patch.object(self.__game__.get_dice(), "roll", return_value=(6, 1)):
+            self.__game__.roll_dice()
+
+    def test_random_bot_plays_legal_move(self):
+        play = RandomBot(seed=1).choose_play(self.__game__)
+        self.assertIn(play, self.__game__.get_legal_plays())
+
+    def test_random_bot_is_reproducible(self):
+        first = [RandomBot(seed=5).choose_play(self.__game__) for _ in range(3)]
+        self.assertEqual(len(set(first)), 1)
+
+    def test_expectimax_bot_plays_legal_move(self):
+        bot = ExpectimaxBot(depth=0)
+        self.assertIn(bot.choose_play(self.__game__), self.__game__.get_legal_plays())
+        self.assertEqual(bot.get_name(), "ExpectimaxBot(0-ply)")
+
+    def test_make_bot_by_name(self):
+        self.assertIsInstance(make_bot("random", 3), RandomBot)
+        self.assertIsInstance(make_bot("heuristic"), ExpectimaxBot)
+        with self.assertRaises(ValueError):
+            make_bot("gnubg")
+
+    def test_base_bot_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Bot()  # pylint: disable=abstract-class-instantiated
+
+
+if __name__ == '__main__':
+    unittest.main()
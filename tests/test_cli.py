@@ -379,6 +379,29 @@ class TestRunCliFunction(unittest.TestCase):
         mock_run.assert_called_once()
 
 
+class TestCLIHint(unittest.TestCase):
+    """Tests para el comando hint."""
+
+    def setUp(self):
+        """Configura el CLI con un juego real."""
+        self.cli = CLIInterface()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_hint_requires_started_game(self, mock_stdout):
+        """Test que avisa si el juego no comenzó."""
+        self.cli._handle_command_('hint')
+        self.assertIn("no ha comenzado", mock_stdout.getvalue())
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_hint_suggests_legal_play(self, mock_stdout):
+        """Test que sugiere una jugada para los dados tirados."""
+        self.cli._game_.start_game()
+        with patch('random.randint', side_effect=[3, 1]):
+            self.cli._game_.roll_dice()
+        self.cli._handle_command_('pista')
+        self.assertIn("Sugerencia:", mock_stdout.getvalue())
+
+
 class TestCLIEdgeCases(unittest.TestCase):
     """Tests de casos extremos."""
 
@@ -1,4 +1,5 @@
 '''Tests unitarios para la clase Dice.'''
+import random
 import unittest
 from unittest.mock import patch
 from core.dice import Dice
@@ -194,6 +195,57 @@ class TestDice(unittest.TestCase):
                 self.assertTrue(1 <= result[0] <= 6)
                 self.assertTrue(1 <= result[1] <= 6)
 
+    def test_seeded_dice_are_reproducible(self):
+        first = Dice(seed=42)
+        second = Dice(seed=42)
+        rolls = [first.roll() for _ in range(3000)]
+        self.assertEqual(rolls, [second.roll() for _ in range(3000)])
+        self.assertTrue(all(1 <= a <= 6 and 1 <= b <= 6 for a, b in rolls))
+        self.assertEqual(first.get_last_roll(), rolls[-1])
+
+    def test_seeded_dice_do_not_use_global_random(self):
+        with patch("random.randint") as mock_randint:
+            Dice(seed=1).roll()
+        mock_randint.assert_not_called()
+
+    def test_dice_accepts_rng_instance(self):
+        rolls = [Dice(rng=random.Random(7)).roll() for _ in range(2)]
+        self.assertEqual(rolls[0], rolls[1])
+
+    def test_buffered_rolls_cover_all_outcomes(self):
+        dice = Dice(seed=3, buffer_size=16)
+        outcomes = {dice.roll() for _ in range(2000)}
+        self.assertEqual(len(outcomes), 36)
+
+    def test_invalid_buffer_size_raises(self):
+        with self.assertRaises(ValueError):
+            Dice(buffer_size=0)
+
+    def test_worker_streams_are_independent(self):
+        self.assertEqual(Dice.for_worker(5, 0).roll(), Dice.for_worker(5, 0).roll())
+        stream0 = Dice.for_worker(5, 0)
+        stream1 = Dice.for_worker(5, 1)
+        self.assertNotEqual(
+            [stream0.roll() for _ in range(20)], [stream1.roll() for _ in range(20)]
+        )
+
+    def test_copy_continues_same_sequence_independently(self):
+        dice = Dice(seed=9)
+        dice.roll()
+        clone = dice.copy()
+        expected = [dice.roll() for _ in range(5)]
+        self.assertEqual([clone.roll() for _ in range(5)], expected)
+
+    def test_state_round_trip(self):
+        dice = Dice(seed=4)
+        dice.roll()
+        state = dice.get_state()
+        expected = [dice.roll() for _ in range(5)]
+        other = Dice()
+        other.set_state(state)
+        self.assertEqual([other.roll() for _ in range(5)], expected)
+        self.assertIsNone(Dice().get_state().rng_state)
+
 
 if __name__ == "__main__":
     unittest.main()
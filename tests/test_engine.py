@@ -0,0 +1,171 @@
+'''Tests unitarios para el motor expectimax.'''
+import unittest
+from unittest.mock import patch
+from core.backgammongame import BackgammonGame
+from core.position import Position, WHITE, BLACK, BAR_SLOT, OFF_SLOT
+from core.engine import (
+    DICE_OUTCOMES, EngineSettings, TranspositionTable, ExpectimaxEngine, best_play,
+    get_default_engine,
+)
+from core.evalcache import EvaluationCache
+from core.openingbook import OpeningBook
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+def _started_game(roll):
+    game = BackgammonGame()
+    game.start_game()
+    with patch('random.randint', side_effect=list(roll)):
+        game.roll_dice()
+    return game
+
+
+class TestTranspositionTable(unittest.TestCase):
+    '''Clase de tests para TranspositionTable.'''
+
+    def setUp(self):
+        self.__table__ = TranspositionTable(8)
+
+    def test_capacity_is_power_of_two(self):
+        self.assertEqual(TranspositionTable(5).get_capacity(), 8)
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+    def test_probe_requires_enough_depth(self):
+        self.__table__.store(3, 1, 0.5)
+        self.assertEqual(self.__table__.probe(3, 1), 0.5)
+        self.assertEqual(self.__table__.probe(3, 0), 0.5)
+        self.assertIsNone(self.__table__.probe(3, 2))
+        self.assertIsNone(self.__table__.probe(11, 0))
+        self.assertEqual(self.__table__.get_hits(), 2)
+        self.assertEqual(self.__table__.get_misses(), 2)
+
+    def test_deeper_entry_is_kept_within_search(self):
+        self.__table__.store(3, 2, 0.5)
+        self.__table__.store(11, 1, -0.5)
+        self.assertEqual(self.__table__.probe(3, 2), 0.5)
+        self.assertIsNone(self.__table__.probe(11, 1))
+
+    def test_old_generation_is_replaced(self):
+        self.__table__.store(3, 2, 0.5)
+        self.__table__.new_search()
+        self.__table__.store(11, 1, -0.5)
+        self.assertEqual(self.__table__.probe(11, 1), -0.5)
+        self.assertEqual(self.__table__.get_replacements(), 1)
+        self.assertEqual(len(self.__table__), 1)
+
+    def test_clear_empties_table(self):
+        self.__table__.store(3, 1, 0.5)
+        self.__table__.clear()
+        self.assertEqual(len(self.__table__), 0)
+        self.assertIsNone(self.__table__.probe(3, 0))
+
+
+class TestExpectimaxEngine(unittest.TestCase):
+    '''Clase de tests para ExpectimaxEngine.'''
+
+    def setUp(self):
+        self.__engine__ = ExpectimaxEngine()
+
+    def test_dice_outcomes_cover_all_rolls(self):
+        self.assertEqual(len(DICE_OUTCOMES), 21)
+        self.assertAlmostEqual(sum(weight for _, weight in DICE_OUTCOMES), 1.0)
+        self.assertIn(((6, 6, 6, 6), 1 / 36), DICE_OUTCOMES)
+
+    def test_best_play_is_legal(self):
+        game = _started_game((3, 1))
+        for depth in (0, 1):
+            with self.subTest(depth=depth):
+                play = self.__engine__.best_play(game, depth)
+                self.assertIn(play, game.get_legal_plays())
+
+    def test_settings_limit_the_search(self):
+        engine = ExpectimaxEngine(settings=EngineSettings(table_size=16, root_width=1))
+        self.assertEqual(engine.get_table().get_capacity(), 16)
+        game = _started_game((3, 1))
+        self.assertEqual(engine.search(game, 1).play, engine.search(game, 0).play)
+
+    def test_opening_book_is_consulted_first(self):
+        game = _started_game((3, 1))
+        book = OpeningBook()
+        book.add(game.get_board().get_position(), WHITE, (3, 1), ((0, 3, 3), (0, 1, 1)), 0.5)
+        result = ExpectimaxEngine(book=book).search(game, 2)
+        self.assertEqual(result.nodes, 0)
+        self.assertEqual(result.value, 0.5)
+        self.assertIn(result.play, game.get_legal_plays())
+        self.assertEqual(result.play, ExpectimaxEngine(book=book).best_play(game))
+
+    def test_search_without_legal_play(self):
+        position = Position()
+        for point in range(6):
+            position.set_slot(point, BLACK, 2)
+        position.set_slot(BAR_SLOT[WHITE], WHITE, 1)
+        result = self.__engine__.search_position(position, WHITE, (3, 1))
+        self.assertIsNone(result.play)
+        self.assertEqual(result.nodes, 1)
+        self.assertGreater(result.elapsed, 0.0)
+
+    def test_best_play_can_be_played(self):
+        game = _started_game((6, 5))
+        for source, dest, _ in self.__engine__.best_play(game, 1):
+            self.assertTrue(game.make_move(source, dest))
+
+    def test_search_reports_depth_and_nodes(self):
+        result = self.__engine__.search(_started_game((3, 1)), 1)
+        self.assertEqual(result.depth, 1)
+        self.assertGreater(result.nodes, 21)
+        self.assertGreater(len(self.__engine__.get_table()), 0)
+
+    def test_time_budget_returns_completed_depth(self):
+        result = self.__engine__.search(_started_game((3, 1)), 2, time_budget=0.0)
+        self.assertEqual(result.depth, 0)
+        self.assertIsNotNone(result.play)
+
+    def test_winning_bear_off_is_chosen(self):
+        position = Position()
+        position.add_checkers(OFF_SLOT[WHITE], WHITE, 13)
+        position.add_checkers(22, WHITE)
+        position.add_checkers(23, WHITE)
+        position.add_checkers(5, BLACK, 15)
+        result = self.__engine__.search_position(position, WHITE, (2, 1), 1)
+        self.assertEqual(result.value, 2.0)
+
+    def test_no_legal_play(self):
+        position = Position()
+        position.add_checkers(0, WHITE)
+        position.add_checkers(1, BLACK, 2)
+        position.add_checkers(2, BLACK, 2)
+        result = self.__engine__.search_position(position, WHITE, (1, 2), 1)
+        self.assertIsNone(result.play)
+
+    def test_search_requires_rolled_dice(self):
+        game = BackgammonGame()
+        with self.assertRaises(ValueError):
+            best_play(game)
+        game.start_game()
+        with self.assertRaises(ValueError):
+            best_play(game)
+        with self.assertRaises(ValueError):
+            self.__engine__.search(_started_game((3, 1)), -1)
+
+    def test_cache_counters_are_exposed(self):
+        self.assertIsNone(self.__engine__.get_cache())
+        cache = EvaluationCache()
+        engine = ExpectimaxEngine(cache=cache)
+        position = Position()
+        position.setup_initial_points()
+        first = engine.search_position(position, WHITE, (3, 1), 1)
+        engine.get_table().clear()
+        misses = cache.get_misses()
+        second = engine.search_position(position, WHITE, (3, 1), 1)
+        self.assertIs(engine.get_cache(), cache)
+        self.assertEqual(first.play, second.play)
+        self.assertEqual(cache.get_misses(), misses)
+        self.assertGreater(cache.get_hits(), 0)
+
+    def test_default_engine_uses_cache(self):
+        best_play(_started_game((3, 1)), 0)
+        self.assertGreater(len(get_default_engine().get_cache()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+'''Tests unitarios para la caché de evaluaciones.'''
+import unittest
+from core.evalcache import ENTRY_BYTES, CachedEvaluator, EvaluationCache
+from core.evaluation import heuristic_evaluation
+from core.position import Position, WHITE, BLACK
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class _CountingEvaluator:
+    '''Evaluador que cuenta sus llamadas.'''
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, position, side):
+        self.calls += 1
+        return heuristic_evaluation(position, side)
+
+
+class TestEvaluationCache(unittest.TestCase):
+    '''Clase de tests para EvaluationCache.'''
+
+    def setUp(self):
+        self.__cache__ = EvaluationCache(2)
+
+    def test_hits_and_misses(self):
+        self.assertIsNone(self.__cache__.get(1))
+        self.__cache__.put(1, 0.5)
+        self.assertEqual(self.__cache__.get(1), 0.5)
+        self.assertEqual(self.__cache__.get_hits(), 1)
+        self.assertEqual(self.__cache__.get_misses(), 1)
+        self.assertEqual(self.__cache__.hit_rate(), 0.5)
+
+    def test_least_recently_used_is_evicted(self):
+        self.__cache__.put(1, 0.1)
+        self.__cache__.put(2, 0.2)
+        self.__cache__.get(1)
+        self.__cache__.put(3, 0.3)
+        self.assertIsNone(self.__cache__.get(2))
+        self.assertEqual(self.__cache__.get(1), 0.1)
+        self.assertEqual(self.__cache__.get(3), 0.3)
+        self.assertEqual(self.__cache__.get_evictions(), 1)
+        self.assertEqual(len(self.__cache__), 2)
+
+    def test_updating_a_key_does_not_evict(self):
+        self.__cache__.put(1, 0.1)
+        self.__cache__.put(2, 0.2)
+        self.__cache__.put(1, 0.5)
+        self.assertEqual(self.__cache__.get_evictions(), 0)
+        self.assertEqual(self.__cache__.get(1), 0.5)
+
+    def test_stats_and_clear(self):
+        self.__cache__.put(1, 0.1)
+        self.__cache__.get(1)
+        stats = self.__cache__.stats()
+        self.assertEqual((stats["entries"], stats["capacity"], stats["hits"]), (1, 2, 1))
+        self.__cache__.clear()
+        self.assertEqual(len(self.__cache__), 0)
+        self.assertEqual(self.__cache__.get_hits(), 0)
+        self.assertEqual(self.__cache__.hit_rate(), 0.0)
+
+    def test_memory_limit(self):
+        self.assertEqual(EvaluationCache.with_memory_limit(100 * ENTRY_BYTES).get_capacity(), 100)
+        with self.assertRaises(ValueError):
+            EvaluationCache.with_memory_limit(1)
+        with self.assertRaises(ValueError):
+            EvaluationCache(0)
+
+
+class TestCachedEvaluator(unittest.TestCase):
+    '''Clase de tests para CachedEvaluator.'''
+
+    def setUp(self):
+        self.__inner__ = _CountingEvaluator()
+        self.__evaluator__ = CachedEvaluator(self.__inner__, EvaluationCache(16))
+        self.__position__ = Position()
+        self.__position__.setup_initial_points()
+
+    def test_repeated_evaluation_uses_cache(self):
+        first = self.__evaluator__(self.__position__, WHITE)
+        second = self.__evaluator__(self.__position__.copy(), WHITE)
+        self.assertEqual(first, second)
+        self.assertEqual(self.__inner__.calls, 1)
+        self.assertEqual(self.__evaluator__.get_cache().get_hits(), 1)
+
+    def test_side_is_part_of_the_key(self):
+        self.__position__.apply(WHITE, (0, 3, 3))
+        self.assertNotEqual(self.__position__.side_hash(WHITE), self.__position__.side_hash(BLACK))
+        self.assertEqual(self.__evaluator__(self.__position__, BLACK),
+                         heuristic_evaluation(self.__position__, BLACK))
+        self.__evaluator__(self.__position__, WHITE)
+        self.assertEqual(self.__inner__.calls, 2)
+
+    def test_mirrored_position_shares_entry(self):
+        self.__position__.apply(WHITE, (0, 5, 5))
+        value = self.__evaluator__(self.__position__, WHITE)
+        self.assertEqual(self.__evaluator__(self.__position__.mirror(), BLACK), value)
+        self.assertEqual(self.__inner__.calls, 1)
+        self.assertEqual(len(self.__evaluator__.get_cache()), 1)
+
+    def test_batch_only_evaluates_misses(self):
+        other = self.__position__.copy()
+        other.apply(WHITE, (0, 3, 3))
+        self.__evaluator__(self.__position__, WHITE)
+        values = self.__evaluator__.evaluate_batch([self.__position__, other], WHITE)
+        self.assertEqual(values, [heuristic_evaluation(self.__position__, WHITE),
+                                  heuristic_evaluation(other, WHITE)])
+        self.assertEqual(self.__inner__.calls, 2)
+        self.assertIs(self.__evaluator__.get_evaluator(), self.__inner__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+'''Tests unitarios para la evaluación estática.'''
+import unittest
+from core.position import Position, WHITE, BLACK, BAR_SLOT, OFF_SLOT
+from core.evaluation import game_result, terminal_value, is_race, heuristic_evaluation
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestEvaluation(unittest.TestCase):
+    '''Clase de tests para evaluation.'''
+
+    def setUp(self):
+        self.__position__ = Position()
+        self.__position__.setup_initial_points()
+
+    def test_initial_position_is_symmetric(self):
+        white = heuristic_evaluation(self.__position__, WHITE)
+        black = heuristic_evaluation(self.__position__, BLACK)
+        self.assertAlmostEqual(white, 0.0)
+        self.assertAlmostEqual(white, -black)
+
+    def test_evaluation_is_bounded_while_running(self):
+        position = Position()
+        position.add_checkers(23, WHITE, 15)
+        position.add_checkers(0, BLACK, 1)
+        position.add_checkers(BAR_SLOT[BLACK], BLACK, 14)
+        value = heuristic_evaluation(position, WHITE)
+        self.assertGreater(value, 0.0)
+        self.assertLess(value, 1.0)
+
+    def test_mirrored_position_has_same_value(self):
+        self.__position__.apply(WHITE, (0, 5, 5))
+        self.__position__.apply(BLACK, (12, 10, 2))
+        mirrored = self.__position__.mirror()
+        for side in (WHITE, BLACK):
+            self.assertEqual(heuristic_evaluation(self.__position__, side),
+                             heuristic_evaluation(mirrored, 1 - side))
+
+    def test_initial_position_is_not_race(self):
+        self.assertFalse(is_race(self.__position__))
+
+    def test_race_when_sides_have_passed(self):
+        position = Position()
+        position.add_checkers(20, WHITE, 15)
+        position.add_checkers(3, BLACK, 15)
+        self.assertTrue(is_race(position))
+
+    def test_single_game_result(self):
+        position = Position()
+        position.add_checkers(OFF_SLOT[WHITE], WHITE, 15)
+        position.add_checkers(OFF_SLOT[BLACK], BLACK, 1)
+        position.add_checkers(10, BLACK, 14)
+        self.assertEqual(game_result(position, WHITE), 1)
+        self.assertEqual(terminal_value(position, WHITE), 1)
+        self.assertEqual(terminal_value(position, BLACK), -1)
+        self.assertEqual(heuristic_evaluation(position, BLACK), -1.0)
+
+    def test_gammon_and_backgammon(self):
+        position = Position()
+        position.add_checkers(OFF_SLOT[WHITE], WHITE, 15)
+        position.add_checkers(10, BLACK, 15)
+        self.assertEqual(game_result(position, WHITE), 2)
+        position.remove_checkers(10, BLACK)
+        position.add_checkers(20, BLACK)
+        self.assertEqual(game_result(position, WHITE), 3)
+
+    def test_running_game_has_no_terminal_value(self):
+        self.assertEqual(terminal_value(self.__position__, WHITE), 0)
@@ -0,0 +1,86 @@
+'''Tests unitarios para el generador de jugadas.'''
+import unittest
+from core.position import Position, WHITE, BLACK, BAR_SLOT, OFF_SLOT
+from core.movegen import generate_plays, legal_steps, apply_step, to_point_step
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+def _final_cells(position, side, play):
+    clone = position.copy()
+    for step in play:
+        apply_step(clone, side, step)
+    return clone.get_cells().tobytes()
+
+
+class TestMoveGen(unittest.TestCase):
+    '''Clase de tests para movegen.'''
+
+    def setUp(self):
+        self.__position__ = Position()
+        self.__position__.setup_initial_points()
+
+    def test_opening_play_counts(self):
+        expected = {(3, 1): 16, (2, 1): 15, (6, 5): 7, (6, 6, 6, 6): 11, (5, 5, 5, 5): 4}
+        for dice, count in expected.items():
+            with self.subTest(dice=dice):
+                self.assertEqual(len(generate_plays(self.__position__, WHITE, dice)), count)
+                self.assertEqual(len(generate_plays(self.__position__, BLACK, dice)), count)
+
+    def test_plays_reach_distinct_positions(self):
+        plays = generate_plays(self.__position__, WHITE, (2, 2, 2, 2))
+        finals = {_final_cells(self.__position__, WHITE, play) for play in plays}
+        self.assertEqual(len(finals), len(plays))
+        self.assertTrue(all(len(play) == 4 for play in plays))
+
+    def test_both_dice_orders_are_covered(self):
+        position = Position()
+        position.add_checkers(0, WHITE)
+        position.add_checkers(2, BLACK, 2)
+        # El punto 3 está bloqueado: solo sirve jugar primero el 1 y luego el 2.
+        plays = generate_plays(position, WHITE, (2, 1))
+        self.assertEqual(plays, [((0, 1, 1), (1, 3, 2))])
+
+    def test_must_use_both_dice_when_possible(self):
+        position = Position()
+        position.add_checkers(0, WHITE)
+        position.add_checkers(10, WHITE)
+        position.add_checkers(6, BLACK, 2)
+        position.add_checkers(23, BLACK)
+        for play in generate_plays(position, WHITE, (6, 5)):
+            self.assertEqual(len(play), 2)
+
+    def test_must_use_higher_die(self):
+        position = Position()
+        position.add_checkers(0, WHITE)
+        position.add_checkers(11, BLACK, 2)
+        # Con 5 o con 6 se puede mover, pero no con ambos: debe usarse el 6.
+        self.assertEqual(generate_plays(position, WHITE, (5, 6)), [((0, 6, 6),)])
+
+    def test_bar_entry_comes_first(self):
+        self.__position__.remove_checkers(0, WHITE)
+        self.__position__.add_checkers(BAR_SLOT[WHITE], WHITE)
+        for play in generate_plays(self.__position__, WHITE, (4, 3)):
+            self.assertEqual(play[0][0], BAR_SLOT[WHITE])
+
+    def test_no_legal_play(self):
+        position = Position()
+        position.add_checkers(BAR_SLOT[WHITE], WHITE)
+        for point in range(6):
+            position.add_checkers(point, BLACK, 2)
+        self.assertEqual(generate_plays(position, WHITE, (3, 5)), [])
+
+    def test_bear_off_with_higher_die_only_from_rearmost(self):
+        position = Position()
+        position.add_checkers(20, WHITE)
+        position.add_checkers(22, WHITE)
+        steps = legal_steps(position, WHITE, 6)
+        self.assertEqual(steps, [(20, OFF_SLOT[WHITE], 6)])
+
+    def test_to_point_step_notation(self):
+        self.assertEqual(to_point_step(WHITE, (BAR_SLOT[WHITE], 2, 3)), (0, 3, 3))
+        self.assertEqual(to_point_step(BLACK, (BAR_SLOT[BLACK], 21, 3)), (25, 22, 3))
+        self.assertEqual(to_point_step(WHITE, (22, OFF_SLOT[WHITE], 2)), (23, 25, 2))
+        self.assertEqual(to_point_step(BLACK, (1, OFF_SLOT[BLACK], 2)), (2, 0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
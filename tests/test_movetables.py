@@ -0,0 +1,44 @@
+'''Tests unitarios para las tablas de movimiento precalculadas.'''
+import unittest
+from core.position import WHITE, BLACK, BAR_SLOT, OFF_SLOT, NUM_SLOTS
+from core.movetables import (
+    DESTINATION, STEP_KIND, ENTRY_POINT, NO_MOVE, ON_BOARD, BEAR_OFF_EXACT,
+    BEAR_OFF_OVER,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestMoveTables(unittest.TestCase):
+    '''Clase de tests para movetables.'''
+
+    def test_tables_shape(self):
+        for table in (DESTINATION, STEP_KIND):
+            self.assertEqual(len(table), 2)
+            self.assertTrue(all(len(rows) == NUM_SLOTS for rows in table))
+            self.assertTrue(all(len(row) == 7 for rows in table for row in rows))
+
+    def test_destination_follows_direction(self):
+        self.assertEqual(DESTINATION[WHITE][0][6], 6)
+        self.assertEqual(DESTINATION[BLACK][23][6], 17)
+        self.assertEqual(STEP_KIND[WHITE][0][6], ON_BOARD)
+
+    def test_entry_points(self):
+        self.assertEqual(ENTRY_POINT[WHITE][1:], (0, 1, 2, 3, 4, 5))
+        self.assertEqual(ENTRY_POINT[BLACK][1:], (23, 22, 21, 20, 19, 18))
+        self.assertEqual(DESTINATION[WHITE][BAR_SLOT[WHITE]][3], 2)
+        self.assertEqual(DESTINATION[BLACK][BAR_SLOT[BLACK]][3], 21)
+
+    def test_bear_off_classification(self):
+        self.assertEqual(STEP_KIND[WHITE][20][4], BEAR_OFF_EXACT)
+        self.assertEqual(STEP_KIND[WHITE][20][6], BEAR_OFF_OVER)
+        self.assertEqual(STEP_KIND[BLACK][3][4], BEAR_OFF_EXACT)
+        self.assertEqual(STEP_KIND[BLACK][3][5], BEAR_OFF_OVER)
+        self.assertEqual(DESTINATION[WHITE][20][6], OFF_SLOT[WHITE])
+
+    def test_unused_slots_have_no_move(self):
+        self.assertEqual(STEP_KIND[WHITE][BAR_SLOT[BLACK]][3], NO_MOVE)
+        self.assertEqual(STEP_KIND[BLACK][OFF_SLOT[BLACK]][3], NO_MOVE)
+        self.assertEqual(STEP_KIND[WHITE][5][0], NO_MOVE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+'''Tests unitarios para el evaluador neuronal.'''
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.engine import ExpectimaxEngine
+from core.movegen import generate_successors
+from core.neuralnet import (
+    NUM_INPUTS, NUM_OUTPUTS, NeuralNetwork, encode_positions, equities, load_weights,
+    random_weights, save_weights,
+)
+from core.position import Position, WHITE, BLACK, BAR_SLOT, OFF_SLOT
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestNeuralNetwork(unittest.TestCase):
+    '''Clase de tests para la red de evaluación.'''
+
+    def setUp(self):
+        self.__network__ = NeuralNetwork(random_weights(16, seed=3))
+        self.__position__ = Position()
+        self.__position__.setup_initial_points()
+
+    def test_encoding_shape_and_units(self):
+        inputs = encode_positions([self.__position__], WHITE)
+        self.assertEqual(inputs.shape, (1, NUM_INPUTS))
+        # Cinco fichas propias en el punto 18: distancia 6, unidades 1, 1, 1 y 1.
+        self.assertEqual(list(inputs[0, 18 * 4:18 * 4 + 4]), [1.0, 1.0, 1.0, 1.0])
+        # Dos fichas propias en el punto 0.
+        self.assertEqual(list(inputs[0, :4]), [1.0, 1.0, 0.0, 0.0])
+
+    def test_initial_position_is_symmetric(self):
+        white = encode_positions([self.__position__], WHITE)
+        black = encode_positions([self.__position__], BLACK)
+        np.testing.assert_array_equal(white, black)
+
+    def test_sides_swap_blocks(self):
+        position = self.__position__.copy()
+        position.apply(WHITE, (0, 3, 3))
+        position.set_slot(BAR_SLOT[BLACK], BLACK, 1)
+        position.set_slot(OFF_SLOT[WHITE], WHITE, 2)
+        white = encode_positions([position], WHITE)[0]
+        black = encode_positions([position], BLACK)[0]
+        half = NUM_INPUTS // 2
+        np.testing.assert_array_equal(white[:half], black[half:])
+        np.testing.assert_array_equal(white[half:], black[:half])
+        self.assertEqual(white[half - 1], 2 / 15)
+        self.assertEqual(white[NUM_INPUTS - 2], 0.5)
+
+    def test_batch_matches_single_evaluation(self):
+        children = [child for _, child in generate_successors(self.__position__, WHITE, (6, 5))]
+        batch = self.__network__.evaluate_batch(children, WHITE)
+        self.assertEqual(len(batch), len(children))
+        for child, value in zip(children, batch):
+            self.assertAlmostEqual(self.__network__(child, WHITE), value, places=5)
+        self.assertEqual(self.__network__.evaluate_batch([], WHITE), [])
+
+    def test_probabilities_and_equity_range(self):
+        probabilities = self.__network__.probabilities([self.__position__], WHITE)
+        self.assertEqual(probabilities.shape, (1, NUM_OUTPUTS))
+        self.assertTrue(np.all((probabilities > 0) & (probabilities < 1)))
+        self.assertTrue(-3.0 <= self.__network__(self.__position__, WHITE) <= 3.0)
+        self.assertAlmostEqual(float(equities(np.array([[1.0, 1.0, 0.0, 0.0, 0.0]]))[0]), 2.0)
+
+    def test_finished_game_value(self):
+        position = Position()
+        position.set_slot(OFF_SLOT[WHITE], WHITE, 15)
+        position.set_slot(OFF_SLOT[BLACK], BLACK, 1)
+        position.set_slot(0, BLACK, 14)
+        self.assertEqual(self.__network__(position, WHITE), 1.0)
+        self.assertEqual(self.__network__(position, BLACK), -1.0)
+
+    def test_weights_round_trip_through_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.bin")
+            save_weights(path, self.__network__.get_weights())
+            network = NeuralNetwork.from_file(path)
+            self.assertEqual(network.get_hidden(), 16)
+            self.assertIsInstance(network.get_weights().hidden_weights, np.memmap)
+            self.assertAlmostEqual(network(self.__position__, WHITE),
+                                   self.__network__(self.__position__, WHITE), places=6)
+            del network
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            random_weights(0)
+        weights = random_weights(4, seed=1)
+        with self.assertRaises(ValueError):
+            NeuralNetwork(weights._replace(output_bias=np.zeros(3, dtype=np.float32)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.bin")
+            with open(path, "wb") as handle:
+                handle.write(b"XXXX")
+            with self.assertRaises(ValueError):
+                load_weights(path)
+
+    def test_engine_uses_batch_evaluation(self):
+        engine = ExpectimaxEngine(self.__network__)
+        result = engine.search_position(self.__position__, WHITE, (3, 1), depth=1)
+        self.assertIsNotNone(result.play)
+        self.assertEqual(result.depth, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+'''Tests unitarios para el libro de aperturas.'''
+import os
+import tempfile
+import unittest
+from core.movegen import generate_successors
+from core.openingbook import (
+    OPENING_ROLLS, BookEntry, OpeningBook, book_key, build_book, initial_position, load_book,
+)
+from core.position import WHITE, BLACK
+from core.rollout import RolloutSettings
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+
+class TestOpeningBook(unittest.TestCase):
+    '''Clase de tests para OpeningBook.'''
+
+    def setUp(self):
+        self.__start__ = initial_position()
+        self.__book__ = OpeningBook(36)
+        self.__play__ = ((16, 19, 3), (18, 19, 1))
+        self.__book__.add(self.__start__, WHITE, (3, 1), self.__play__, 0.25)
+
+    def test_opening_rolls(self):
+        self.assertEqual(len(OPENING_ROLLS), 21)
+        self.assertIn((6, 6, 6, 6), OPENING_ROLLS)
+
+    def test_lookup(self):
+        self.assertEqual(self.__book__.lookup(self.__start__, WHITE, (3, 1)),
+                         BookEntry(self.__play__, 0.25))
+        self.assertEqual(self.__book__.lookup(self.__start__, WHITE, (1, 3)).play, self.__play__)
+        self.assertIsNone(self.__book__.lookup(self.__start__, WHITE, (4, 2)))
+
+    def test_lookup_for_black_is_mirrored(self):
+        entry = self.__book__.lookup(self.__start__, BLACK, (3, 1))
+        self.assertEqual(entry.play, ((7, 4, 3), (5, 4, 1)))
+        plays = [play for play, _ in generate_successors(self.__start__, BLACK, (3, 1))]
+        self.assertIn(entry.play, plays)
+
+    def test_key_is_canonical(self):
+        mirrored = self.__start__.mirror()
+        self.assertEqual(book_key(self.__start__, WHITE, (3, 1)), book_key(mirrored, BLACK, (1, 3)))
+        self.assertNotEqual(book_key(self.__start__, WHITE, (3, 1)),
+                            book_key(self.__start__, WHITE, (3, 2)))
+
+    def test_save_and_load(self):
+        self.__book__.add(self.__start__, WHITE, (2, 2, 2, 2),
+                          ((0, 2, 2), (0, 2, 2), (11, 13, 2), (11, 13, 2)), -0.125)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "opening.bin")
+            self.__book__.save(path)
+            loaded = OpeningBook.from_file(path)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded.get_trials(), 36)
+        self.assertEqual(loaded.lookup(self.__start__, WHITE, (3, 1)),
+                         BookEntry(self.__play__, 0.25))
+        self.assertEqual(loaded.lookup(self.__start__, WHITE, (2, 2, 2, 2)).equity, -0.125)
+
+    def test_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "opening.bin")
+            with open(path, "wb") as handle:
+                handle.write(b"XXXX")
+            with self.assertRaises(ValueError):
+                OpeningBook.from_file(path)
+            self.assertIsNone(load_book(os.path.join(directory, "missing.bin")))
+
+    def test_too_many_steps(self):
+        with self.assertRaises(ValueError):
+            self.__book__.add(self.__start__, WHITE, (1, 1, 1, 1), ((0, 1, 1),) * 5, 0.0)
+
+
+class TestBuildBook(unittest.TestCase):
+    '''Clase de tests para la generación del libro.'''
+
+    def test_build_covers_openings_and_replies(self):
+        settings = RolloutSettings(trials=36, truncate=2, workers=1)
+        book = build_book(settings, candidates=2, rolls=((3, 1), (6, 5)))
+        start = initial_position()
+        self.assertEqual(len(book), 6)
+        for dice in ((3, 1), (6, 5)):
+            with self.subTest(dice=dice):
+                entry = book.lookup(start, WHITE, dice)
+                successors = dict(generate_successors(start, WHITE, dice))
+                self.assertIn(entry.play, successors)
+                reply = successors[entry.play]
+                for reply_dice in ((3, 1), (6, 5)):
+                    self.assertIsNotNone(book.lookup(reply, BLACK, reply_dice))
+
+    def test_parallel_build_matches_serial(self):
+        settings = RolloutSettings(trials=36, truncate=2, workers=1)
+        serial = build_book(settings, candidates=2, rolls=((4, 2),))
+        parallel = build_book(settings._replace(workers=2), candidates=2, rolls=((4, 2),))
+        start = initial_position()
+        self.assertEqual(serial.lookup(start, WHITE, (4, 2)), parallel.lookup(start, WHITE, (4, 2)))
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            build_book(RolloutSettings(trials=0, workers=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+'''Tests unitarios para la clase Position.'''
+import unittest
+from core.position import (
+    Position, WHITE, BLACK, BAR_SLOT, OFF_SLOT, NUM_SLOTS, dice_key,
+    decode_record,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestPosition(unittest.TestCase):
+    '''Clase de tests para Position.'''
+
+    def setUp(self):
+        self.__position__ = Position()
+
+    def test_position_starts_empty(self):
+        self.assertEqual(len(self.__position__.get_cells()), NUM_SLOTS)
+        self.assertTrue(all(v == 0 for v in self.__position__.get_cells()))
+
+    def test_position_invalid_cells_length(self):
+        with self.assertRaises(ValueError):
+            Position([0] * 10)
+
+    def test_position_initial_points(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.get_point(0), 2)
+        self.assertEqual(self.__position__.get_point(23), -2)
+        self.assertEqual(self.__position__.count_on_board(WHITE), 15)
+        self.assertEqual(self.__position__.count_on_board(BLACK), 15)
+
+    def test_position_initial_pip_count(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.pip_count(WHITE), 167)
+        self.assertEqual(self.__position__.pip_count(BLACK), 167)
+
+    def test_position_add_and_remove_checkers(self):
+        self.__position__.add_checkers(4, BLACK, 2)
+        self.assertEqual(self.__position__.get_point(4), -2)
+        self.assertEqual(self.__position__.get_side_count(4, BLACK), 2)
+        self.assertEqual(self.__position__.get_side_count(4, WHITE), 0)
+        self.__position__.remove_checkers(4, BLACK)
+        self.assertEqual(self.__position__.get_owner_side(4), BLACK)
+        self.__position__.remove_checkers(4, BLACK)
+        self.assertIsNone(self.__position__.get_owner_side(4))
+
+    def test_position_add_on_opponent_point_raises(self):
+        self.__position__.add_checkers(4, BLACK)
+        with self.assertRaises(ValueError):
+            self.__position__.add_checkers(4, WHITE)
+
+    def test_position_remove_missing_checker_raises(self):
+        with self.assertRaises(ValueError):
+            self.__position__.remove_checkers(4, WHITE)
+
+    def test_position_bar_and_off_are_per_side(self):
+        self.__position__.add_checkers(BAR_SLOT[BLACK], BLACK)
+        self.__position__.add_checkers(OFF_SLOT[WHITE], WHITE, 3)
+        self.assertEqual(self.__position__.get_bar(BLACK), 1)
+        self.assertEqual(self.__position__.get_bar(WHITE), 0)
+        self.assertEqual(self.__position__.get_off(WHITE), 3)
+
+    def test_position_can_bear_off(self):
+        self.__position__.add_checkers(20, WHITE, 3)
+        self.assertTrue(self.__position__.can_bear_off(WHITE))
+        self.__position__.add_checkers(BAR_SLOT[WHITE], WHITE)
+        self.assertFalse(self.__position__.can_bear_off(WHITE))
+
+    def test_position_furthest_point(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.furthest_point(WHITE), 0)
+        self.assertEqual(self.__position__.furthest_point(BLACK), 23)
+        self.assertIsNone(Position().furthest_point(WHITE))
+
+    def test_position_copy_is_independent(self):
+        self.__position__.setup_initial_points()
+        clone = self.__position__.copy()
+        self.assertEqual(clone, self.__position__)
+        clone.remove_checkers(0, WHITE)
+        self.assertNotEqual(clone, self.__position__)
+
+    def test_position_hash_matches_equality(self):
+        other = Position()
+        self.assertEqual(hash(self.__position__), hash(other))
+
+    def test_position_hash_is_incremental(self):
+        self.__position__.setup_initial_points()
+        self.__position__.remove_checkers(0, WHITE)
+        self.__position__.add_checkers(BAR_SLOT[WHITE], WHITE)
+        self.assertEqual(self.__position__.position_hash(), self.__position__.compute_hash())
+
+    def test_position_hash_restored_after_inverse_change(self):
+        self.__position__.setup_initial_points()
+        original = self.__position__.position_hash()
+        self.__position__.remove_checkers(11, WHITE)
+        self.assertNotEqual(self.__position__.position_hash(), original)
+        self.__position__.add_checkers(11, WHITE)
+        self.assertEqual(self.__position__.position_hash(), original)
+
+    def test_position_apply_and_unapply_hit(self):
+        self.__position__.add_checkers(3, WHITE)
+        self.__position__.add_checkers(5, BLACK)
+        original = self.__position__.copy()
+        record = self.__position__.apply(WHITE, (3, 5, 2))
+        self.assertEqual(decode_record(record), (3, 5, 2, WHITE, True))
+        self.assertEqual(self.__position__.get_point(5), 1)
+        self.assertEqual(self.__position__.get_bar(BLACK), 1)
+        self.__position__.unapply(record)
+        self.assertEqual(self.__position__, original)
+        self.assertEqual(self.__position__.position_hash(), original.position_hash())
+
+    def test_position_unapply_restores_sequence(self):
+        self.__position__.setup_initial_points()
+        original = self.__position__.copy()
+        records = [
+            self.__position__.apply(WHITE, (0, 3, 3)),
+            self.__position__.apply(BLACK, (5, 3, 2)),
+            self.__position__.apply(WHITE, (BAR_SLOT[WHITE], 2, 3)),
+            self.__position__.apply(BLACK, (7, 2, 5)),
+        ]
+        self.assertEqual(self.__position__.get_bar(WHITE), 1)
+        self.assertEqual(self.__position__.get_point(2), -1)
+        for record in reversed(records):
+            self.__position__.unapply(record)
+        self.assertEqual(self.__position__, original)
+        self.assertEqual(self.__position__.position_hash(), original.compute_hash())
+
+    def test_position_pip_count_is_incremental(self):
+        self.__position__.setup_initial_points()
+        self.__position__.add_checkers(3, BLACK)
+        record = self.__position__.apply(WHITE, (0, 3, 3))
+        for side in (WHITE, BLACK):
+            self.assertEqual(
+                self.__position__.pip_count(side), self.__position__.compute_pip_count(side)
+            )
+        self.assertEqual(self.__position__.pip_count(WHITE), 164)
+        # La ficha golpeada pasa de valer 4 pips a valer 25 desde la barra.
+        self.assertEqual(self.__position__.pip_count(BLACK), 171 - 4 + 25)
+        self.__position__.unapply(record)
+        self.assertEqual(self.__position__.pip_count(BLACK), 171)
+
+    def test_position_pip_count_ignores_borne_off(self):
+        self.__position__.add_checkers(22, WHITE, 2)
+        self.__position__.apply(WHITE, (22, OFF_SLOT[WHITE], 2))
+        self.assertEqual(self.__position__.pip_count(WHITE), 2)
+        self.assertEqual(self.__position__.copy().pip_count(WHITE), 2)
+        self.__position__.clear()
+        self.assertEqual(self.__position__.pip_count(WHITE), 0)
+
+    def test_position_occupancy_tracks_points(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.occupancy(WHITE), 1 | 1 << 11 | 1 << 16 | 1 << 18)
+        self.__position__.apply(WHITE, (0, 3, 3))
+        self.assertEqual(self.__position__.checker_positions(WHITE), [0, 3, 11, 16, 18])
+        self.__position__.apply(WHITE, (0, 2, 2))
+        self.assertEqual(self.__position__.furthest_point(WHITE), 2)
+        self.assertEqual(self.__position__.furthest_point(BLACK), 23)
+
+    def test_position_outside_home_count(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.outside_home(WHITE), 10)
+        self.assertEqual(self.__position__.outside_home(BLACK), 10)
+        self.__position__.set_slot(0, WHITE, 0)
+        self.__position__.add_checkers(BAR_SLOT[WHITE], WHITE)
+        self.assertEqual(self.__position__.outside_home(WHITE), 9)
+        self.assertEqual(self.__position__.copy().outside_home(WHITE), 9)
+
+    def test_dice_key_ignores_order(self):
+        self.assertEqual(dice_key((5, 2)), dice_key((2, 5)))
+        self.assertNotEqual(dice_key((5, 2)), dice_key((5,)))
+        self.assertEqual(dice_key(()), 0)
+
+    def test_position_bytes_round_trip(self):
+        self.__position__.setup_initial_points()
+        self.__position__.add_checkers(BAR_SLOT[BLACK], BLACK)
+        data = self.__position__.to_bytes()
+        self.assertEqual(len(data), NUM_SLOTS)
+        restored = Position.from_bytes(data)
+        self.assertEqual(restored, self.__position__)
+        self.assertEqual(restored.position_hash(), self.__position__.position_hash())
+        self.assertEqual(restored.pip_count(BLACK), self.__position__.pip_count(BLACK))
+        with self.assertRaises(ValueError):
+            Position.from_bytes(data[:10])
+
+    def test_mirror_swaps_sides(self):
+        self.__position__.setup_initial_points()
+        self.__position__.apply(WHITE, (0, 4, 4))
+        self.__position__.add_checkers(BAR_SLOT[BLACK], BLACK)
+        self.__position__.add_checkers(OFF_SLOT[WHITE], WHITE, 2)
+        mirrored = self.__position__.mirror()
+        fresh = Position(mirrored.get_cells())
+        self.assertEqual(mirrored.get_point(19), -1)
+        self.assertEqual(mirrored.get_bar(WHITE), 1)
+        self.assertEqual(mirrored.get_off(BLACK), 2)
+        self.assertEqual(mirrored.position_hash(), fresh.position_hash())
+        self.assertEqual(mirrored.mirror_hash(), fresh.mirror_hash())
+        for side in (WHITE, BLACK):
+            self.assertEqual(mirrored.pip_count(side), self.__position__.pip_count(1 - side))
+            self.assertEqual(mirrored.pip_count(side), fresh.compute_pip_count(side))
+            self.assertEqual(mirrored.outside_home(side), fresh.outside_home(side))
+            self.assertEqual(mirrored.occupancy(side), fresh.occupancy(side))
+        self.assertEqual(mirrored.mirror(), self.__position__)
+
+    def test_side_hash_is_canonical(self):
+        self.__position__.setup_initial_points()
+        self.__position__.apply(WHITE, (0, 3, 3))
+        mirrored = self.__position__.mirror()
+        self.assertEqual(self.__position__.side_hash(BLACK), mirrored.side_hash(WHITE))
+        self.assertEqual(self.__position__.side_hash(WHITE), mirrored.side_hash(BLACK))
+        self.assertNotEqual(self.__position__.side_hash(WHITE), self.__position__.side_hash(BLACK))
+
+    def test_mirror_hash_is_incremental(self):
+        self.__position__.setup_initial_points()
+        self.assertEqual(self.__position__.mirror_hash(), self.__position__.position_hash())
+        record = self.__position__.apply(BLACK, (23, 20, 3))
+        self.assertEqual(self.__position__.mirror_hash(),
+                         Position(self.__position__.mirror().get_cells()).position_hash())
+        self.__position__.unapply(record)
+        self.assertEqual(self.__position__.mirror_hash(), self.__position__.position_hash())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+'''Tests unitarios para el Position ID y el Match ID.'''
+import random
+import unittest
+from array import array
+from core.backgammongame import BackgammonGame
+from core.board import Board
+from core.player import Player
+from core.position import Position, WHITE, BLACK
+from core.positionid import (
+    START_POSITION_ID, CENTERED_CUBE, PLAYING, MatchState, encode_position_id,
+    decode_position_id, encode_position_ids, decode_position_ids, boards_to_ids,
+    ids_to_boards, encode_match_id, decode_match_id,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+# Posición tras abrir las blancas con 24/21 13/9 (43), con las negras en turno.
+AFTER_43_CELLS = (
+    1, 0, 0, 1, 0, -5, 0, -3, 0, 0, 0, 4, -5, 0, 0, 1, 3, 0, 5, 0, 0, 0, 0, -2, 0, 0, 0, 0,
+)
+AFTER_43_ID = "4HPhASLgc/ABMA"
+
+
+def _random_position(rng):
+    cells = array("b", bytes(28))
+    for side, sign in ((WHITE, 1), (BLACK, -1)):
+        for _ in range(15):
+            slot = rng.randrange(27)
+            if slot < 24 and cells[slot] * sign >= 0:
+                cells[slot] += sign
+            elif slot == 24:
+                cells[24 + side] += sign
+            else:
+                cells[26 + side] += sign
+    return Position(cells)
+
+
+class TestPositionId(unittest.TestCase):
+    '''Clase de tests para la codificación del Position ID.'''
+
+    def setUp(self):
+        board = Board()
+        board.setup_initial_position(Player("Blanco", "white"), Player("Negro", "black"))
+        self.__start__ = board.get_position()
+        self.__after__ = Position(array("b", AFTER_43_CELLS))
+
+    def test_start_position(self):
+        self.assertEqual(encode_position_id(self.__start__, WHITE), START_POSITION_ID)
+        self.assertEqual(encode_position_id(self.__start__, BLACK), START_POSITION_ID)
+
+    def test_known_position(self):
+        self.assertEqual(encode_position_id(self.__after__, BLACK), AFTER_43_ID)
+        self.assertEqual(decode_position_id(AFTER_43_ID, BLACK), self.__after__)
+
+    def test_round_trip_keeps_bar_and_off(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            position = _random_position(rng)
+            side = rng.randrange(2)
+            self.assertEqual(decode_position_id(encode_position_id(position, side), side), position)
+
+    def test_side_on_roll_matters(self):
+        self.assertNotEqual(encode_position_id(self.__after__, WHITE), AFTER_43_ID)
+
+    def test_invalid_ids(self):
+        for text in ("", "4HPwATDgc/ABM", "4HPwATDgc/AB!A", "//////////////"):
+            with self.assertRaises(ValueError):
+                decode_position_id(text, WHITE)
+
+    def test_too_many_checkers(self):
+        cells = array("b", bytes(28))
+        cells[0] = 16
+        with self.assertRaises(ValueError):
+            encode_position_id(Position(cells), WHITE)
+
+    def test_batch_matches_single(self):
+        rng = random.Random(11)
+        positions = [_random_position(rng) for _ in range(100)]
+        sides = [rng.randrange(2) for _ in positions]
+        ids = encode_position_ids(positions, sides)
+        self.assertEqual(ids, [encode_position_id(p, s) for p, s in zip(positions, sides)])
+        self.assertEqual(decode_position_ids(ids, sides), positions)
+
+    def test_boards_round_trip(self):
+        boards = ids_to_boards([START_POSITION_ID, AFTER_43_ID])
+        self.assertEqual(boards.shape, (2, 28))
+        self.assertEqual(boards_to_ids(boards), [START_POSITION_ID, AFTER_43_ID])
+
+    def test_empty_batch(self):
+        self.assertEqual(encode_position_ids([], []), [])
+        self.assertEqual(decode_position_ids([], []), [])
+
+    def test_invalid_batch(self):
+        with self.assertRaises(ValueError):
+            ids_to_boards([START_POSITION_ID, "//////////////"])
+
+
+class TestMatchId(unittest.TestCase):
+    '''Clase de tests para la codificación del Match ID.'''
+
+    def test_known_ids(self):
+        rolled = decode_match_id("cAkGAAAAAAAA")
+        self.assertEqual(rolled.dice, (4, 1))
+        self.assertEqual(rolled.dice_owner, BLACK)
+        self.assertEqual(rolled.game_state, PLAYING)
+        self.assertEqual(rolled.cube_owner, CENTERED_CUBE)
+        waiting = decode_match_id("MAEAAAAAAAAA")
+        self.assertEqual(waiting.dice, ())
+        self.assertEqual(waiting.dice_owner, WHITE)
+        self.assertEqual(encode_match_id(rolled), "cAkGAAAAAAAA")
+        self.assertEqual(encode_match_id(waiting), "MAEAAAAAAAAA")
+
+    def test_round_trip(self):
+        state = MatchState(cube_value=4, cube_owner=BLACK, dice_owner=WHITE, crawford=True,
+                           game_state=PLAYING, turn=BLACK, doubled=True, dice=(6, 2),
+                           match_length=7, score=(2, 5))
+        self.assertEqual(decode_match_id(encode_match_id(state)), state)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            encode_match_id(MatchState(cube_value=3))
+        with self.assertRaises(ValueError):
+            encode_match_id(MatchState(match_length=1 << 15))
+        with self.assertRaises(ValueError):
+            decode_match_id("cAkGAAAAAAA")
+
+
+class TestGameIds(unittest.TestCase):
+    '''Clase de tests para los identificadores de Board y BackgammonGame.'''
+
+    def setUp(self):
+        self.__game__ = BackgammonGame("Ana", "Beto")
+
+    def test_board_ids(self):
+        board = self.__game__.get_board()
+        self.assertEqual(board.get_position_id(), START_POSITION_ID)
+        board.set_position_id(AFTER_43_ID, BLACK)
+        self.assertEqual(list(board.get_position().get_cells()), list(AFTER_43_CELLS))
+        self.assertEqual(board.get_position_id(BLACK), AFTER_43_ID)
+
+    def test_game_round_trip(self):
+        self.__game__.start_game()
+        self.__game__.roll_dice()
+        other = BackgammonGame("Carla", "Dario")
+        other.load_ids(self.__game__.get_position_id(), self.__game__.get_match_id())
+        self.assertEqual(other.get_match_state(), self.__game__.get_match_state())
+        self.assertEqual(other.get_position_id(), self.__game__.get_position_id())
+        self.assertEqual(other.position_hash(), self.__game__.position_hash())
+        self.assertEqual(other.get_legal_plays(), self.__game__.get_legal_plays())
+
+    def test_load_known_ids(self):
+        self.__game__.load_ids(AFTER_43_ID, "MAEAAAAAAAAA")
+        self.assertEqual(self.__game__.get_current_player(), self.__game__.get_player1())
+        self.assertTrue(self.__game__.is_started())
+        self.assertFalse(self.__game__.has_dice_been_rolled())
+
+    def test_load_doubles(self):
+        self.__game__.load_ids(START_POSITION_ID, encode_match_id(
+            MatchState(dice_owner=BLACK, turn=BLACK, game_state=PLAYING, dice=(5, 5))))
+        self.assertEqual(self.__game__.get_current_player(), self.__game__.get_player2())
+        self.assertEqual(self.__game__.get_last_dice_roll(), (5, 5, 5, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
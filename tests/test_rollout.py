@@ -0,0 +1,119 @@
+'''Tests unitarios para los rollouts Monte Carlo.'''
+import unittest
+from core.position import Position, WHITE, BLACK, OFF_SLOT
+from core.evalcache import CachedEvaluator, EvaluationCache
+from core.evaluation import heuristic_evaluation
+from core.neuralnet import NeuralNetwork, equities, random_weights
+from core.rollout import (
+    METRICS, EvaluatorPolicy, RolloutSettings, RolloutStats, heuristic_policy, rollout,
+    run_rollout,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+def _race_position():
+    position = Position()
+    position.add_checkers(OFF_SLOT[WHITE], WHITE, 12)
+    position.add_checkers(22, WHITE, 3)
+    position.add_checkers(OFF_SLOT[BLACK], BLACK, 12)
+    position.add_checkers(5, BLACK, 3)
+    return position
+
+
+class TestRolloutStats(unittest.TestCase):
+    '''Clase de tests para RolloutStats.'''
+
+    def setUp(self):
+        self.__stats__ = RolloutStats()
+
+    def test_empty_stats(self):
+        self.assertEqual(self.__stats__.get_trials(), 0)
+        self.assertEqual(self.__stats__.mean("win"), 0.0)
+        self.assertEqual(self.__stats__.interval("win"), (0.0, 0.0))
+
+    def test_mean_and_interval(self):
+        for outcome in ((1, 0, 0, 0, 0, 1), (0, 0, 0, 1, 0, -2)) * 50:
+            self.__stats__.add(outcome)
+        self.assertEqual(self.__stats__.get_trials(), 100)
+        self.assertAlmostEqual(self.__stats__.mean("win"), 0.5)
+        self.assertAlmostEqual(self.__stats__.mean("equity"), -0.5)
+        low, high = self.__stats__.interval("win")
+        self.assertAlmostEqual((low + high) / 2, 0.5)
+        self.assertAlmostEqual(high - low, 2 * 1.959964 * (25 / 99 / 100) ** 0.5)
+        self.assertEqual(set(self.__stats__.summary()), set(METRICS))
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            self.__stats__.mean("draw")
+
+
+class TestRollout(unittest.TestCase):
+    '''Clase de tests para rollout.'''
+
+    def setUp(self):
+        self.__position__ = _race_position()
+
+    def test_policy_plays_legal_move(self):
+        child = heuristic_policy(self.__position__, WHITE, (6, 5))
+        self.assertEqual(child.get_off(WHITE), 14)
+        self.assertEqual(self.__position__.get_off(WHITE), 12)
+
+    def test_rollout_streams_running_stats(self):
+        counts = [stats.get_trials() for stats in rollout(
+            self.__position__, WHITE, RolloutSettings(trials=80, workers=1, chunk_size=36))]
+        self.assertEqual(counts, [36, 72, 80])
+
+    def test_side_on_roll_wins_short_race(self):
+        stats = run_rollout(self.__position__, WHITE, RolloutSettings(trials=72, workers=1))
+        self.assertGreater(stats.mean("win"), 0.5)
+        self.assertEqual(stats.mean("win_gammon"), 0.0)
+
+    def test_rollout_is_reproducible(self):
+        settings = RolloutSettings(trials=36, seed=7, workers=1)
+        first = run_rollout(self.__position__, BLACK, settings)
+        second = run_rollout(self.__position__, BLACK, settings)
+        self.assertEqual(first.summary(), second.summary())
+
+    def test_result_does_not_depend_on_workers(self):
+        settings = RolloutSettings(trials=24, seed=3, workers=1, chunk_size=6)
+        single = run_rollout(self.__position__, WHITE, settings)
+        pooled = run_rollout(self.__position__, WHITE, settings._replace(workers=2))
+        self.assertEqual(single.summary(), pooled.summary())
+
+    def test_truncated_rollout_uses_evaluator(self):
+        position = Position()
+        position.setup_initial_points()
+        stats = run_rollout(position, WHITE, RolloutSettings(
+            trials=4, truncate=0, workers=1, evaluator=lambda pos, side: 0.5))
+        self.assertEqual(stats.mean("equity"), 0.5)
+        self.assertEqual(stats.mean("win"), 0.75)
+
+    def test_truncated_rollout_records_network_probabilities(self):
+        position = Position()
+        position.setup_initial_points()
+        network = NeuralNetwork(random_weights(seed=3))
+        stats = run_rollout(position, WHITE, RolloutSettings(
+            trials=4, truncate=0, workers=1, evaluator=network))
+        probabilities = network.probabilities([position], WHITE)[0]
+        for metric, value in zip(METRICS, probabilities):
+            self.assertAlmostEqual(stats.mean(metric), float(value), places=6)
+        self.assertGreater(stats.mean("win_gammon"), 0.0)
+        self.assertAlmostEqual(stats.mean("equity"), float(equities(probabilities[None])[0]),
+                               places=5)
+
+    def test_evaluator_policy_with_cache(self):
+        policy = EvaluatorPolicy(CachedEvaluator(heuristic_evaluation, EvaluationCache()))
+        settings = RolloutSettings(trials=36, seed=5, workers=1)
+        expected = run_rollout(self.__position__, WHITE, settings)
+        stats = run_rollout(self.__position__, WHITE, settings._replace(policy=policy))
+        self.assertEqual(stats.summary(), expected.summary())
+        self.assertGreater(policy.get_evaluator().get_cache().get_hits(), 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            run_rollout(self.__position__, WHITE, RolloutSettings(trials=0))
+        with self.assertRaises(ValueError):
+            run_rollout(self.__position__, WHITE, RolloutSettings(workers=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
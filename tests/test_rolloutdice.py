@@ -0,0 +1,74 @@
+'''Tests unitarios para los dados de rollout con reducción de varianza.'''
+import unittest
+from core.dice import Dice
+from core.rolloutdice import RolloutDice, mirror_roll
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+def _trial_rolls(dice, trial, count=10):
+    dice.start_trial(trial)
+    return [dice.roll() for _ in range(count)]
+
+
+class TestRolloutDice(unittest.TestCase):
+    '''Clase de tests para RolloutDice.'''
+
+    def setUp(self):
+        self.__dice__ = RolloutDice(seed=2024)
+
+    def test_first_rolls_are_stratified_per_block(self):
+        for block in range(3):
+            firsts = {
+                _trial_rolls(self.__dice__, block * 36 + i, 1)[0] for i in range(36)
+            }
+            self.assertEqual(len(firsts), 36)
+
+    def test_same_trial_replays_same_sequence(self):
+        first = _trial_rolls(self.__dice__, 7, 30)
+        _trial_rolls(self.__dice__, 8, 3)
+        self.assertEqual(_trial_rolls(self.__dice__, 7, 30), first)
+
+    def test_common_random_numbers_across_instances(self):
+        other = RolloutDice(seed=2024)
+        self.assertEqual(_trial_rolls(other, 12), _trial_rolls(self.__dice__, 12))
+
+    def test_trials_use_different_streams(self):
+        self.assertNotEqual(_trial_rolls(self.__dice__, 0), _trial_rolls(self.__dice__, 1))
+
+    def test_antithetic_pairs_mirror_every_roll(self):
+        dice = RolloutDice(seed=5, antithetic=True)
+        for pair in range(40):
+            leader = _trial_rolls(dice, 2 * pair)
+            partner = _trial_rolls(dice, 2 * pair + 1)
+            self.assertEqual(partner, [mirror_roll(roll) for roll in leader])
+
+    def test_antithetic_blocks_stay_stratified(self):
+        dice = RolloutDice(seed=5, antithetic=True)
+        firsts = {_trial_rolls(dice, i, 1)[0] for i in range(36)}
+        self.assertEqual(len(firsts), 36)
+
+    def test_unstratified_first_roll_comes_from_stream(self):
+        dice = RolloutDice(seed=5, stratified=False)
+        self.assertFalse(dice.is_stratified())
+        self.assertTrue(all(1 <= d <= 6 for roll in _trial_rolls(dice, 3) for d in roll))
+
+    def test_is_a_dice(self):
+        self.assertIsInstance(self.__dice__, Dice)
+        self.__dice__.roll()
+        self.assertEqual(self.__dice__.get_moves((2, 2)), [2, 2, 2, 2])
+
+    def test_copy_keeps_class_and_position(self):
+        self.__dice__.start_trial(4)
+        self.__dice__.roll()
+        clone = self.__dice__.copy()
+        self.assertIsInstance(clone, RolloutDice)
+        self.assertEqual(clone.get_trial(), 4)
+        self.assertEqual([clone.roll() for _ in range(5)],
+                         [self.__dice__.roll() for _ in range(5)])
+
+    def test_negative_trial_raises(self):
+        with self.assertRaises(ValueError):
+            self.__dice__.start_trial(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+'''Tests unitarios para la simulación sin interfaz.'''
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from core.bots import RandomBot, ExpectimaxBot
+from core.simulation import PHASES, simulate, main
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestSimulation(unittest.TestCase):
+    '''Clase de tests para simulate.'''
+
+    def test_simulate_plays_complete_games(self):
+        report = simulate(4, RandomBot(seed=1), RandomBot(seed=2), seed=3)
+        self.assertEqual(report.games, 4)
+        self.assertEqual(sum(report.wins), 4)
+        self.assertGreaterEqual(sum(report.points), 4)
+        self.assertGreater(report.moves, report.games * 15)
+        self.assertGreater(report.games_per_second(), 0)
+        self.assertEqual(set(report.phase_times), set(PHASES))
+
+    def test_simulate_is_reproducible(self):
+        first = simulate(3, RandomBot(seed=1), ExpectimaxBot(), seed=9)
+        second = simulate(3, RandomBot(seed=1), ExpectimaxBot(), seed=9)
+        self.assertEqual(first[:6], second[:6])
+
+    def test_simulate_counts_passed_turns(self):
+        report = simulate(6, RandomBot(seed=4), RandomBot(seed=5), seed=6)
+        self.assertGreater(report.passes, 0)
+
+    def test_simulate_requires_games(self):
+        with self.assertRaises(ValueError):
+            simulate(0, RandomBot(), RandomBot())
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_prints_report(self, mock_stdout):
+        report = main(["-n", "2", "--white", "random", "--seed", "1"])
+        self.assertEqual(report.games, 2)
+        self.assertIn("partidas/s", mock_stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+'''Tests unitarios para el entrenamiento TD(lambda).'''
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from core.neuralnet import NUM_INPUTS, NeuralNetwork, load_weights, random_weights
+from core.position import WHITE, BLACK
+from core.training import (
+    Trajectory, TrainingSettings, copy_weights, main, mirror_probabilities, outcome_vector,
+    play_game, td_targets, td_update, train,
+)
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+
+class TestTraining(unittest.TestCase):
+    '''Clase de tests para el autojuego y las actualizaciones TD.'''
+
+    def setUp(self):
+        self.__weights__ = random_weights(8, seed=5)
+        self.__directory__ = tempfile.mkdtemp()
+        self.__path__ = os.path.join(self.__directory__, "weights.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.__directory__)
+
+    def test_mirror_and_outcome(self):
+        probabilities = np.array([0.6, 0.2, 0.05, 0.1, 0.01], dtype=np.float32)
+        np.testing.assert_allclose(mirror_probabilities(probabilities), [0.4, 0.1, 0.01, 0.2, 0.05])
+        np.testing.assert_allclose(mirror_probabilities(mirror_probabilities(probabilities)),
+                                   probabilities)
+        self.assertEqual(list(outcome_vector(2)), [1.0, 1.0, 0.0, 0.0, 0.0])
+        self.assertEqual(list(outcome_vector(-3)), [0.0, 0.0, 0.0, 1.0, 1.0])
+
+    def test_targets_monte_carlo_and_td0(self):
+        values = np.full((3, 5), 0.5, dtype=np.float32)
+        movers = np.array([WHITE, BLACK, WHITE], dtype=np.int8)
+        monte_carlo = td_targets(values, movers, 1, 1.0)
+        self.assertEqual(list(monte_carlo[2]), [1.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(list(monte_carlo[1]), [0.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(list(monte_carlo[0]), [1.0, 0.0, 0.0, 0.0, 0.0])
+        values[1] = [0.8, 0.3, 0.1, 0.0, 0.0]
+        td_zero = td_targets(values, movers, 1, 0.0)
+        np.testing.assert_allclose(td_zero[0], [0.2, 0.0, 0.0, 0.3, 0.1])
+
+    def test_self_play_game(self):
+        network = NeuralNetwork(self.__weights__)
+        first = play_game(network, 11)
+        second = play_game(network, 11)
+        self.assertEqual(first.inputs.shape, (len(first.movers), NUM_INPUTS))
+        self.assertIn(first.result, (-3, -2, -1, 1, 2, 3))
+        np.testing.assert_array_equal(first.inputs, second.inputs)
+        self.assertEqual(first.result, second.result)
+
+    def test_update_reduces_error(self):
+        trajectory = play_game(NeuralNetwork(self.__weights__), 3)
+        weights = copy_weights(self.__weights__)
+        fixed = Trajectory(trajectory.inputs, trajectory.movers, trajectory.result)
+        first = td_update(weights, fixed, alpha=0.05, lam=1.0)
+        for _ in range(5):
+            last = td_update(weights, fixed, alpha=0.05, lam=1.0)
+        self.assertLess(last, first)
+        self.assertFalse(np.array_equal(weights.hidden_weights, self.__weights__.hidden_weights))
+
+    def test_train_writes_checkpoints(self):
+        settings = TrainingSettings(games=5, seed=1, workers=1, games_per_task=2,
+                                    checkpoint_path=self.__path__, checkpoint_every=4)
+        progress = list(train(self.__weights__, settings))
+        self.assertEqual([entry.games for entry in progress], [2, 4, 5])
+        self.assertGreater(progress[-1].positions, 0)
+        saved = load_weights(self.__path__)
+        np.testing.assert_array_equal(saved.output_weights, self.__weights__.output_weights)
+        del saved
+
+    def test_train_with_workers(self):
+        settings = TrainingSettings(games=4, seed=2, workers=2, games_per_task=1)
+        progress = list(train(self.__weights__, settings))
+        self.assertEqual(progress[-1].games, 4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            next(train(self.__weights__, TrainingSettings(games=0, workers=1)))
+        with self.assertRaises(ValueError):
+            next(train(self.__weights__, TrainingSettings(games=1, workers=0)))
+
+    def test_main_resumes_from_file(self):
+        main(["--games", "2", "--hidden", "4", "--workers", "1", "--seed", "3",
+              "--output", self.__path__])
+        self.assertEqual(load_weights(self.__path__).hidden_bias.shape, (4,))
+        progress = main(["--games", "1", "--resume", "--workers", "1", "--output", self.__path__])
+        self.assertEqual(progress.games, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()